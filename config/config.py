@@ -24,6 +24,49 @@ BBC_LIMIT_PER_CATEGORY = 3
 USE_AUTO_TOPIC = True  # True: LLM이 자동으로 주제 생성, False: 수동 설정 사용
 BLOG_TOPIC = "글로벌 기술 트렌드와 시장 동향"  # USE_AUTO_TOPIC이 False일 때 사용
 
+# 네트워크 설정
+HTTP_TIMEOUTS = {'feed': 30, 'article': 15, 'api': 10, 'llm': 120}  # 용도별 요청 타임아웃 (초)
+HTTP_POOL_LIMIT_PER_HOST = 8  # 호스트별 keep-alive 커넥션 수 (= 호스트별 동시 요청 수)
+HTTP_RETRIES = {'feed': 2, 'article': 2, 'api': 3, 'llm': 1}  # 429/5xx/연결 오류 시 용도별 재시도 횟수
+HTTP_BACKOFF_BASE = 0.5  # 재시도 대기 기본값 (초, 시도마다 2배 + 지터)
+HTTP_BACKOFF_MAX = 30  # 재시도 대기 최대값 (Retry-After가 이보다 길면 재시도하지 않음)
+HTTP_CIRCUIT_FAILURES = 5  # 연속 실패 시 해당 호스트 요청을 잠시 차단
+HTTP_CIRCUIT_RECOVERY = 60  # 차단 후 시험 요청까지 대기 (초)
+FEED_PARSE_EXECUTOR = 'thread'  # RSS 파싱 실행 위치: 'thread' / 'process' / 'inline'
+FEED_PARSE_WORKERS = 4  # RSS 파싱 풀 크기
+FEED_PARSER = 'stream'  # 'stream': 스트리밍 파서 우선 (실패 시 feedparser) / 'feedparser': 항상 feedparser
+
+# 네이버 검색 API 호출 제한
+NAVER_QPS = 10  # 초당 호출 수
+NAVER_DAILY_QUOTA = 25000  # 하루 호출 한도 (data/cache/naver_quota.json에 사용량 기록)
+
+# 증분 수집 설정
+INCREMENTAL_CRAWL = False  # True: 이전 실행에서 처리한 기사는 건너뜀 (data/cache/seen_articles.db)
+INCLUDE_UPDATED_ITEMS = False  # True: 제목/요약이 바뀐 기사는 다시 포함
+POLL_REQUESTS_PER_MINUTE = 30  # 연속 수집 모드의 전체 피드 요청 예산 (분당)
+POLL_MIN_INTERVAL = 120  # 피드별 폴링 간격 하한 (초, 발행 간격으로 학습)
+POLL_MAX_INTERVAL = 3600  # 피드별 폴링 간격 상한 (초)
+POLL_BATCH_SIZE = 10  # 새 기사가 이만큼 모이면 블로그 글 생성
+POLL_BATCH_MAX_WAIT = 600  # 첫 새 기사 후 최대 대기 (초)
+NEAR_DUPLICATE_THRESHOLD = 0.7  # 제목+요약 유사도가 이 값 이상이면 같은 기사로 보고 제거 (0~1)
+CONTENT_FETCH_CONCURRENCY = 8  # 기사 본문 동시 수집 개수
+CONTENT_CACHE_TTL_HOURS = 24  # 기사 본문 캐시 유지 시간
+CONTENT_CACHE_MAX_ENTRIES = 5000  # 기사 본문 캐시 최대 항목 수 (초과 시 LRU 삭제)
+RAW_STORE_ENABLED = True  # 기사 원문 HTML을 data/raw_pages에 압축 저장 (추출기 수정 후 재수집 없이 재추출)
+RAW_STORE_MAX_MB = 512  # 원문 저장소 최대 크기 (넘으면 오래 쓰지 않은 원문부터 삭제)
+NEWS_JSON_SNAPSHOT = True  # 아카이브(data/archive/*.jsonl)와 별도로 날짜별 JSON 파일도 저장
+BACKFILL_CONCURRENCY = 4  # 과거 기사 백필 시 동시에 진행할 작업 수 (src/scrapers/backfill.py)
+
+# 속보 빠른 발행 경로 (src/core/fast_lane.py)
+BREAKING_MIN_FEEDS = 3  # 같은 기사가 이 개수 이상의 피드에 실리면 속보로 판단
+BREAKING_MAX_AGE_MINUTES = 120  # 이보다 오래된 기사는 신호가 있어도 무시
+BREAKING_KEYWORDS = ['속보', '긴급', 'breaking']  # 제목에 있으면 바로 속보로 판단
+BREAKING_SPIKE_RATIO = 3.0  # 제목 단어가 평소보다 이 배수 이상 등장하면 급증으로 판단
+BREAKING_SPIKE_MIN_COUNT = 4  # 급증으로 보기 위한 최소 기사 수 (30분 구간)
+FAST_LANE_POLL_INTERVAL = 60  # 빠른 경로의 피드별 폴링 간격 하한 (초)
+FAST_LANE_AUTO_POST = True  # False: 글만 저장하고 티스토리 발행은 생략
+OLLAMA_KEEP_ALIVE = '30m'  # 빠른 경로 실행 중 모델을 메모리에 유지하는 시간
+
 # 쿠키 얻는 방법:
 # 1. 티스토리 관리자 페이지에 로그인
 # 2. F12 개발자 도구 열기
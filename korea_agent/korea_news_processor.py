@@ -3,14 +3,20 @@ import asyncio
 import os
 import sys
 from datetime import datetime
-import requests
 import re
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from src.scrapers.naver_news_api import search_naver_news
+from src.scrapers.naver_news_api import search_naver_news_many
+from src.scrapers.dedup import NearDuplicateDetector
+from src.storage.article_store import ArticleStore
+from src.storage.news_item import MISSING_CONTENT, NewsItem
+from src.storage.post_registry import PostRegistry
+from src.storage.search_index import SearchIndex
+from src.storage.seen_index import SeenIndex
 from config import config
+from src.scrapers import http_client
 
 class KoreaNewsProcessor:
     def __init__(self, blog_name=None, cookie=None):
@@ -19,23 +25,49 @@ class KoreaNewsProcessor:
         self.blog_name = blog_name
         self.cookie = cookie
         self.tistory_poster = None
+        self._seen_index = None
 
-    async def collect_trend_news_json(self, keywords=None, limit_per_keyword=5):
-        """네이버 트렌드 키워드별 뉴스 수집 및 JSON 저장"""
+    @property
+    def seen_index(self):
+        """이미 처리한 기사 인덱스 (증분 수집 시에만 열림)"""
+        if self._seen_index is None:
+            self._seen_index = SeenIndex()
+        return self._seen_index
+
+    async def collect_trend_news_json(self, keywords=None, limit_per_keyword=5, incremental=None, include_updated=None):
+        """네이버 트렌드 키워드별 뉴스 수집 및 JSON 저장
+        
+        incremental=True이면 이전 실행에서 이미 처리한 기사는 제외합니다.
+        (기본값: config.INCREMENTAL_CRAWL / config.INCLUDE_UPDATED_ITEMS)
+        """
+        if incremental is None:
+            incremental = getattr(config, 'INCREMENTAL_CRAWL', False)
+        if include_updated is None:
+            include_updated = getattr(config, 'INCLUDE_UPDATED_ITEMS', False)
         if keywords is None:
             keywords = ["금리","환율", "주식", "나스닥", "코스닥", "비트코인"]
         
         print(f"[NEWS] 네이버 트렌드 키워드별 뉴스 수집 중... (키워드: {keywords})")
         
-        all_news_data = {}
-        for keyword in keywords:
-            print(f"\n[키워드: {keyword}] 뉴스 기사 수집 중...")
-            news_list = search_naver_news(keyword, display=limit_per_keyword)
-            
+        # 모든 키워드를 초당 호출 제한 안에서 동시에 검색
+        all_news_data = await search_naver_news_many(keywords, display=limit_per_keyword)
+        # 다른 수집기와 같은 NewsItem으로 (원문 링크 하나, <b> 태그·HTML 엔티티 제거)
+        all_news_data = {
+            keyword: [NewsItem.from_naver(news, keyword=keyword) for news in news_list]
+            for keyword, news_list in all_news_data.items()
+        }
+        if incremental:
+            all_news_data = {
+                keyword: self.seen_index.filter_new(news_list, include_updated=include_updated)
+                for keyword, news_list in all_news_data.items()
+            }
+        # 겹치는 키워드(금리/환율/주식 등)에서 같은 기사가 반복되지 않도록 키워드 순서대로 한 번만 남김
+        detector = NearDuplicateDetector(threshold=getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7))
+        all_news_data = {keyword: detector.filter(news_list) for keyword, news_list in all_news_data.items()}
+        for keyword, news_list in all_news_data.items():
+            print(f"\n[키워드: {keyword}] 뉴스 기사 {len(news_list)}개")
             for news in news_list:
                 print(f"- {news['title']} | {news['link']}")
-            
-            all_news_data[keyword] = news_list
         
         # JSON 저장
         today_str = datetime.now().strftime('%Y-%m-%d')
@@ -44,9 +76,27 @@ class KoreaNewsProcessor:
         filename = os.path.join(data_dir, f"naver_trend_news_{today_str}.json")
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(all_news_data, f, ensure_ascii=False, indent=2, default=str)
+            json.dump({keyword: [dict(news) for news in news_list] for keyword, news_list in all_news_data.items()},
+                      f, ensure_ascii=False, indent=2, default=str)
         
         print(f"[SAVE] JSON 저장 완료: {filename}")
+        
+        # 기사 DB에도 키워드별로 저장
+        store = ArticleStore()
+        for keyword, news_list in all_news_data.items():
+            store.upsert(news_list, source='네이버뉴스', keyword=keyword)
+        store.close()
+        index = SearchIndex()
+        for keyword, news_list in all_news_data.items():
+            index.add_articles(news_list, source='네이버뉴스', keyword=keyword)
+        index.close()
+        
+        # 저장까지 끝난 기사만 처리 완료로 기록 (본문을 가져오지 못한 기사는 다음 실행에서 다시 시도)
+        if incremental:
+            for news_list in all_news_data.values():
+                self.seen_index.mark_seen([news for news in news_list if news.get('content') != MISSING_CONTENT],
+                                          source='네이버뉴스')
+            self.seen_index.flush()
         return all_news_data
 
     async def generate_topic(self, news_data):
@@ -75,9 +125,9 @@ Requirements:
 Title:"""
         
         try:
-            response = requests.post(
+            status, data = await http_client.post_json(
                 f"{self.ollama_url}/api/generate",
-                json={
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
@@ -87,11 +137,11 @@ Title:"""
                         "max_tokens": 200
                     }
                 },
-                timeout=60
+                kind='llm'
             )
             
-            if response.status_code == 200:
-                topic = response.json()["response"].strip()
+            if status == 200:
+                topic = data["response"].strip()
                 # 불필요한 문자 제거 및 정리
                 topic = topic.replace('"', '').replace("'", '').replace('\n', ' ').strip()
                 return topic
@@ -137,9 +187,9 @@ Requirements:
 Return ONLY the blog post in Markdown format. Do NOT return JSON, code block, or any explanation. Only the blog post content itself.
 """
         try:
-            response = requests.post(
+            status, data = await http_client.post_json(
                 f"{self.ollama_url}/api/generate",
-                json={
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
@@ -149,10 +199,10 @@ Return ONLY the blog post in Markdown format. Do NOT return JSON, code block, or
                         "max_tokens": 4096
                     }
                 },
-                timeout=120
+                kind='llm'
             )
-            if response.status_code == 200:
-                content = response.json()["response"].strip()
+            if status == 200:
+                content = data["response"].strip()
                 return content
             else:
                 return self._generate_fallback_blog_post(news_data, topic)
@@ -223,32 +273,15 @@ Return ONLY the blog post in Markdown format. Do NOT return JSON, code block, or
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(content)
         print(f"[SAVE] 블로그 글 저장 완료: {filename}")
-        # recentBlog.md 업데이트
-        self.update_recent_blog_md(filename, {"title": topic or 'korean_blog_post'})
+        index = SearchIndex()
+        index.add_post(filename, topic, source='네이버뉴스')
+        index.close()
+        # 발행 대기열에 등록 (korea_tistory_selenium_poster.py --auto가 가져감)
+        registry = PostRegistry()
+        registry.register(filename, topic or 'korean_blog_post', source='네이버뉴스')
+        registry.close()
         return filename, {"title": topic or 'korean_blog_post'}
 
-    def update_recent_blog_md(self, filename, blog_data):
-        """recentBlog.md를 최신 블로그 글 정보로 갱신 (마크다운 리스트 형식)"""
-        recent_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'recentBlog.md')
-        title = blog_data.get('title', '')
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        # 상대 경로로 변환
-        relative_path = os.path.relpath(filename, os.path.dirname(recent_path))
-        new_content = f"""# 최신 블로그 글 정보
-
-## 현재 최신 글
-- **제목**: {title}
-- **파일경로**: {relative_path}
-- **생성일시**: {current_time}
-- **타입**: 한국뉴스
-
----
-*이 파일은 자동으로 업데이트됩니다.*
-"""
-        with open(recent_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        print(f"[UPDATE] recentBlog.md 갱신 완료: {recent_path}")
-
     async def post_to_tistory(self, filename, category_id=None, tags=None):
         """티스토리 API를 통한 포스팅"""
         try:
@@ -277,6 +310,8 @@ async def test_korea_news_processor():
     # 4. 저장
     filename = await processor.save_blog_post(blog_content, topic)
     print(f"완료: {filename}")
+    
+    await http_client.close_session()
 
 if __name__ == "__main__":
     import asyncio
@@ -48,6 +48,7 @@ def tistory_post_with_selenium(
     kakao_password=None,
     json_file=None # 추가된 인자
 ):
+    """마크다운 글을 티스토리에 발행하고, 발행 버튼까지 눌렀으면 True (브라우저를 띄우지 못했거나 발행하지 못했으면 False)"""
     # 1. 마크다운 파일 읽기
     with open(markdown_file, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -107,7 +108,7 @@ def tistory_post_with_selenium(
         except Exception as e2:
             print(f"❌ 대체 방법도 실패: {e2}")
             print("💡 Chrome 브라우저가 설치되어 있는지 확인해주세요.")
-            return
+            return False
 
     # 3. 카카오 자동 로그인
     if kakao_email and kakao_password:
@@ -845,48 +846,45 @@ def tistory_post_with_selenium(
         print("✅ 공개 발행 버튼 클릭 완료!")
     except Exception as e:
         print(f"❌ 발행 버튼 클릭 오류: {e}")
+        driver.quit()
+        return False
 
     # 13. 완료 대기 후 종료
     print("⏳ 발행 처리 대기 중...")
     time.sleep(5)
     driver.quit()
     print("�� 티스토리 자동 업로드 완료!")
+    return True
 
 if __name__ == "__main__":
     import argparse
-    import re
     import os
-    import glob
     import sys
     
+    # 발행 대기열 (data/posts.db)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from src.storage.post_registry import PostRegistry, PostStateError
+    registry = PostRegistry()
+    
     def get_latest_blog_file():
-        """recentBlog.md에서 최신 블로그 파일 경로 추출"""
-        recent_blog_file = "recentBlog.md"
-        if not os.path.exists(recent_blog_file):
-            print("❌ recentBlog.md 파일이 없습니다.")
-            return None
-        
-        with open(recent_blog_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 파일경로 추출
-        match = re.search(r'- \*\*파일경로\*\*: (.+\.md)', content)
-        if match:
-            file_path = match.group(1)
-            # 경로 구분자 정규화
-            file_path = file_path.replace('\\', '/')
-            if os.path.exists(file_path):
-                print(f"✅ recentBlog.md에서 파일을 찾았습니다: {file_path}")
-                return file_path
-            else:
-                print(f"❌ 파일이 존재하지 않습니다: {file_path}")
+        """발행 대기열에서 가장 먼저 들어온 글을 가져와 파일 경로 반환 (posting 상태로 바뀌어 다른 포스터는 가져가지 않음)"""
+        # 이전 포스터가 발행 중에 죽어 posting에 멈춘 글은 다시 대기열로
+        stale = registry.requeue_stale()
+        if stale:
+            print(f"🔁 posting 상태로 멈춘 글 {stale}개를 다시 대기열에 넣었습니다.")
+        while True:
+            post = registry.claim_next(('연합뉴스', '네이버뉴스'))  # 한국뉴스(연합뉴스/네이버) 글만
+            if post is None:
+                print("❌ 발행 대기 중인 블로그 글이 없습니다.")
                 return None
-        else:
-            print("❌ recentBlog.md에서 파일경로를 찾을 수 없습니다.")
-            return None
+            if os.path.exists(post['path']):
+                print(f"✅ 발행 대기열에서 파일을 찾았습니다: {post['path']}")
+                return post['path']
+            print(f"❌ 파일이 존재하지 않습니다: {post['path']}")
+            registry.mark_failed(post['path'], "파일 없음")
     
     parser = argparse.ArgumentParser(description="한국뉴스 셀레니움 티스토리 자동 포스터")
-    parser.add_argument('--file', type=str, help='업로드할 마크다운 파일 경로 (지정하지 않으면 recentBlog.md에서 자동 찾기)')
+    parser.add_argument('--file', type=str, help='업로드할 마크다운 파일 경로 (지정하지 않으면 발행 대기열에서 다음 글)')
     parser.add_argument('--auto', action='store_true', help='자동 업로드 모드')
     args = parser.parse_args()
 
@@ -896,7 +894,7 @@ if __name__ == "__main__":
     # 파일 경로 결정
     file_path = args.file
     if file_path is None:
-        print("파일 경로가 지정되지 않았습니다. recentBlog.md에서 최신 파일을 찾습니다.")
+        print("파일 경로가 지정되지 않았습니다. 발행 대기열에서 다음 글을 가져옵니다.")
         file_path = get_latest_blog_file()
         if file_path is None:
             print("❌ 업로드할 파일을 찾을 수 없습니다.")
@@ -904,7 +902,7 @@ if __name__ == "__main__":
     
     # 자동 모드: 최신 파일들 자동 선택
     if args.auto:
-        print("자동 모드: recentBlog.md에서 최신 한국뉴스 블로그 글 파일을 찾아 업로드합니다.")
+        print("자동 모드: 발행 대기열에서 다음 한국뉴스 블로그 글 파일을 가져와 업로드합니다.")
         
         # 최신 블로그 글 파일 찾기
         if file_path is None:
@@ -963,13 +961,32 @@ if __name__ == "__main__":
     print(f"🏷️ 태그: {tags}")
     print(f"🔐 자동 로그인: {'예' if kakao_email and kakao_password else '아니오'}")
     
-    tistory_post_with_selenium(
-        markdown_file=file_path,
-        blog_url=blog_url,
-        category_name=category_name,
-        tags=tags,
-        headless=headless,
-        kakao_email=kakao_email,
-        kakao_password=kakao_password,
-        json_file=json_file
-    ) 
\ No newline at end of file
+    # 직접 지정한 파일도 대기열에서 posting 상태로 가져감 (이미 발행했거나 다른 포스터가 올리는 중이면 중단)
+    if args.file is not None:
+        try:
+            registry.claim(file_path)
+        except PostStateError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    
+    try:
+        published = tistory_post_with_selenium(
+            markdown_file=file_path,
+            blog_url=blog_url,
+            category_name=category_name,
+            tags=tags,
+            headless=headless,
+            kakao_email=kakao_email,
+            kakao_password=kakao_password,
+            json_file=json_file
+        )
+    except Exception as e:
+        registry.mark_failed(file_path, str(e))
+        raise
+    # 발행 버튼까지 누른 것을 확인한 글만 published로 기록
+    if not published:
+        registry.mark_failed(file_path, "발행하지 못했습니다")
+        registry.close()
+        sys.exit(1)
+    registry.mark_published(file_path)
+    registry.close()
@@ -12,4 +12,11 @@ sys.path.append(os.path.dirname(__file__))
 from src.core.auto_blog_poster import main
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    if '--poll' in sys.argv:
+        # 폴링 모드: python main.py --poll [--batches N]
+        import asyncio
+        from src.core.bbc_news_processor import poll_main
+        batches = sys.argv[sys.argv.index('--batches') + 1] if '--batches' in sys.argv else None
+        asyncio.run(poll_main(int(batches) if batches else None))
+    else:
+        main() 
\ No newline at end of file
@@ -3,18 +3,30 @@ import asyncio
 import os
 import sys
 from datetime import datetime
-import requests
 import re
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.scrapers.bbc_rss_crawler import BBCNewsCrawler
+from src.scrapers.content_cache import ArticleContentCache
+from src.scrapers.dedup import NearDuplicateDetector
+from src.scrapers.feed_scheduler import FeedScheduler
+from src.storage.article_archive import ArticleArchive
+from src.storage.article_store import ArticleStore
+from src.storage.news_item import MISSING_CONTENT
+from src.storage.post_registry import PostRegistry
+from src.storage.search_index import SearchIndex
+from src.storage.seen_index import SeenIndex
 from config import config
+from src.scrapers import http_client
 
 class BBCNewsProcessor:
     def __init__(self, blog_name=None, cookie=None):
-        self.crawler = BBCNewsCrawler()
+        self.crawler = BBCNewsCrawler(content_cache=ArticleContentCache(
+            ttl_seconds=getattr(config, 'CONTENT_CACHE_TTL_HOURS', 24) * 3600,
+            max_entries=getattr(config, 'CONTENT_CACHE_MAX_ENTRIES', 5000)
+        ))
         self.ollama_url = config.OLLAMA_URL
         self.model = config.OLLAMA_MODEL
         
@@ -22,33 +34,137 @@ class BBCNewsProcessor:
         self.blog_name = blog_name
         self.cookie = cookie
         self.tistory_poster = None  # API 포스터는 사용하지 않음
+        self._seen_index = None
+        # 수집한 기사를 덧붙이는 JSONL 아카이브 (data/archive)
+        self.archive = ArticleArchive()
+        # 날짜를 넘나드는 조회용 기사 DB (data/articles.db)
+        self.article_store = ArticleStore()
+        # 기사/블로그 글 전문 검색 색인 (data/search.db)
+        self.search_index = SearchIndex()
+        # 생성한 글의 발행 대기열 (data/posts.db, 포스터가 여기서 다음 글을 가져감)
+        self.post_registry = PostRegistry()
     
-    async def collect_and_save_json(self, category='all', limit_per_category=5):
-        """BBC 뉴스를 수집하고 JSON으로 저장"""
+    @property
+    def seen_index(self):
+        """이미 처리한 기사 인덱스 (증분 수집 시에만 열림)"""
+        if self._seen_index is None:
+            self._seen_index = SeenIndex()
+        return self._seen_index
+    
+    async def collect_and_save_json(self, category='all', limit_per_category=5, incremental=None, include_updated=None):
+        """BBC 뉴스를 수집하고 JSON으로 저장
+        
+        incremental=True이면 이전 실행에서 이미 처리한 기사는 빼고 새 기사만 본문을 받습니다.
+        include_updated=True이면 제목/요약이 바뀐 기사도 다시 포함합니다.
+        (기본값: config.INCREMENTAL_CRAWL / config.INCLUDE_UPDATED_ITEMS)
+        """
+        if incremental is None:
+            incremental = getattr(config, 'INCREMENTAL_CRAWL', False)
+        if include_updated is None:
+            include_updated = getattr(config, 'INCLUDE_UPDATED_ITEMS', False)
         print("[NEWS] BBC 뉴스 수집 중...")
         
-        if category == 'all':
-            news_list = await self.crawler.get_all_categories_today(limit_per_category)
-        else:
-            news_list = await self.crawler.get_today_news(category, limit_per_category)
+        async with self.crawler:
+            if category == 'all':
+                news_list = await self.crawler.get_all_categories_today(limit_per_category)
+            else:
+                news_list = await self.crawler.get_today_news(category, limit_per_category)
+            
+            if incremental:
+                total = len(news_list)
+                news_list = self.seen_index.filter_new(news_list, include_updated=include_updated)
+                print(f" 새 기사 {len(news_list)}/{total}개 (이미 처리한 기사 제외)")
+            
+            # 여러 카테고리에 함께 실린 같은 기사 제거 (본문 수집·프롬프트 작성 전에)
+            total = len(news_list)
+            detector = NearDuplicateDetector(threshold=getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7))
+            news_list = detector.filter(news_list)
+            if len(news_list) < total:
+                print(f" 유사 중복 기사 {total - len(news_list)}개 제거")
+            
+            await self._collect_contents(news_list)
+        
+        # JSON으로 저장
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        self._save_news_json(news_list, f"bbc_news_{category}_{today_str}.json")
         
-        # 기사별 본문 수집
+        # 저장까지 끝난 기사만 처리 완료로 기록 (본문을 가져오지 못한 기사는 다음 실행에서 다시 시도)
+        if incremental:
+            self.seen_index.mark_seen([news for news in news_list if news.get('content') != MISSING_CONTENT],
+                                      source='BBC')
+            self.seen_index.flush()
+        return news_list
+    
+    async def _collect_contents(self, news_list):
+        """기사별 본문 병렬 수집 (실패한 기사는 건너뛰고 계속 진행)"""
         print(" 기사 본문 수집 중...")
+        contents, failures = await self.crawler.fetch_contents(
+            [news['link'] for news in news_list],
+            max_concurrency=getattr(config, 'CONTENT_FETCH_CONCURRENCY', 8)
+        )
         for news in news_list:
-            content = await self.crawler.get_article_content(news['link'])
-            news['content'] = content if content else "(본문을 가져오지 못했습니다.)"
+            content = contents.get(news['link'])
+            news['content'] = content if content else MISSING_CONTENT
+        if failures:
+            print(f" 본문 수집 실패: {len(failures)}/{len(news_list)}개")
+        cache_stats = self.crawler.content_cache.stats()
+        print(f" 본문 캐시: 적중 {cache_stats['hits']}, 미적중 {cache_stats['misses']}, 저장 {cache_stats['size']}개")
+        extract_stats = self.crawler.extractor.summary()
+        if extract_stats['pages']:
+            print(f" 본문 추출({extract_stats['engine']}): 페이지당 평균 {extract_stats['avg_wall_ms']:.1f}ms "
+                  f"(CPU {extract_stats['avg_cpu_ms']:.1f}ms), 프로세스 최대 RSS {extract_stats['process_peak_rss_kb']}KB")
+    
+    def _save_news_json(self, news_list, name):
+        """뉴스 목록을 아카이브에 덧붙이고 data/bbc_news_json/<name>에도 저장 (NEWS_JSON_SNAPSHOT=False이면 생략)"""
+        count = self.archive.append(news_list, source='BBC')
+        self.article_store.upsert(news_list, source='BBC')
+        self.search_index.add_articles(news_list, source='BBC')
+        print(f"[SAVE] 아카이브에 {count}건 추가")
+        if not getattr(config, 'NEWS_JSON_SNAPSHOT', True):
+            return None
         
-        # JSON으로 저장
-        today_str = datetime.now().strftime('%Y-%m-%d')
         data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'bbc_news_json')
         os.makedirs(data_dir, exist_ok=True)
-        filename = os.path.join(data_dir, f"bbc_news_{category}_{today_str}.json")
+        filename = os.path.join(data_dir, name)
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(news_list, f, ensure_ascii=False, indent=2, default=str)
+            json.dump([dict(news) for news in news_list], f, ensure_ascii=False, indent=2, default=str)
         
         print(f"[SAVE] JSON 저장 완료: {filename}")
-        return news_list
+        return filename
+    
+    async def run_polling(self, batch_size=None, max_wait=None, max_batches=None, categories=None):
+        """피드를 계속 폴링하면서 새 기사가 모일 때마다 JSON 저장 + 블로그 글 생성
+        
+        피드별 요청 간격은 FeedScheduler가 발행 빈도로 학습합니다. max_batches개를 처리하면 종료합니다.
+        반환값: 저장한 블로그 글 파일 목록
+        """
+        batch_size = batch_size or getattr(config, 'POLL_BATCH_SIZE', 10)
+        max_wait = max_wait or getattr(config, 'POLL_BATCH_MAX_WAIT', 600)
+        scheduler = FeedScheduler(seen_index=self.seen_index)
+        scheduler.add_bbc_feeds(self.crawler, categories)
+        runner = asyncio.ensure_future(scheduler.run())
+        # 실행 중에 들어온 배치들 사이의 유사 중복도 제거
+        detector = NearDuplicateDetector(threshold=getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7))
+        filenames = []
+        try:
+            while max_batches is None or len(filenames) < max_batches:
+                batch = await scheduler.next_batch(batch_size, max_wait, runner=runner)
+                news_list = detector.filter(batch)
+                print(f"[NEWS] BBC 새 기사 {len(news_list)}개 (배치 {len(batch)}개)")
+                if news_list:
+                    await self._collect_contents(news_list)
+                    self._save_news_json(news_list, f"bbc_news_stream_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.json")
+                    topic = await self.generate_topic(news_list)
+                    blog_content = await self.generate_blog_post(news_list, topic)
+                    filenames.append(await self.save_blog_post(blog_content, topic))
+                    self.article_store.mark_posted(news_list)
+                scheduler.mark_processed(batch, source='BBC')
+        finally:
+            scheduler.stop()
+            if not runner.done():  # 이미 끝났으면 예외는 next_batch에서 전달됨
+                await runner
+        return filenames
     
     def create_topic_prompt(self, news_data):
         """블로그 글 주제 생성을 위한 프롬프트 생성"""
@@ -126,9 +242,9 @@ class BBCNewsProcessor:
         prompt = self.create_topic_prompt(news_data)
         
         try:
-            response = requests.post(
+            status, data = await http_client.post_json(
                 f"{self.ollama_url}/api/generate",
-                json={
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
@@ -138,16 +254,16 @@ class BBCNewsProcessor:
                         "max_tokens": 100
                     }
                 },
-                timeout=60
+                kind='llm'
             )
             
-            if response.status_code == 200:
-                topic = response.json()["response"].strip()
+            if status == 200:
+                topic = data["response"].strip()
                 # 불필요한 문자 제거
                 topic = topic.replace('"', '').replace("'", '').replace('\n', ' ').strip()
                 return topic
             else:
-                print(f" 주제 생성 LLM API 오류: {response.status_code}")
+                print(f" 주제 생성 LLM API 오류: {status}")
                 return self._generate_default_topic(news_data)
                 
         except Exception as e:
@@ -179,9 +295,9 @@ class BBCNewsProcessor:
         prompt = self.create_blog_prompt(news_data, topic)
         
         try:
-            response = requests.post(
+            status, data = await http_client.post_json(
                 f"{self.ollama_url}/api/generate",
-                json={
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
@@ -191,13 +307,13 @@ class BBCNewsProcessor:
                         "max_tokens": 4000
                     }
                 },
-                timeout=120
+                kind='llm'
             )
             
-            if response.status_code == 200:
-                return response.json()["response"]
+            if status == 200:
+                return data["response"]
             else:
-                print(f" LLM API 오류: {response.status_code}")
+                print(f" LLM API 오류: {status}")
                 return self._generate_dummy_blog_post(news_data, topic)
                 
         except Exception as e:
@@ -270,43 +386,11 @@ class BBCNewsProcessor:
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(content)
         print(f"[SAVE] 블로그 글 저장 완료: {filename}")
-        
-        # recentBlog.md 업데이트
-        self.update_recent_blog_md(filename, topic, "BBC뉴스")
+        self.search_index.add_post(filename, topic, source='BBC')
+        self.post_registry.register(filename, topic, source='BBC')
         
         return filename
     
-    def update_recent_blog_md(self, file_path, topic, source_type):
-        """recentBlog.md 파일을 업데이트하여 최신 블로그 글 정보 저장"""
-        try:
-            # 현재 시간
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # recentBlog.md 내용 생성
-            content = f"""# 최신 블로그 글 정보
-
-## 📝 최근 생성된 블로그 글
-
-### **제목**: {topic}
-- **파일경로**: {file_path}
-- **소스**: {source_type}
-- **생성일시**: {current_time}
-- **상태**: 생성 완료 (업로드 대기)
-
----
-
-*이 파일은 자동으로 생성되었습니다. 최신 블로그 글 정보를 관리합니다.*
-"""
-            
-            # recentBlog.md 파일 저장
-            with open('recentBlog.md', 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ recentBlog.md 업데이트 완료: {topic}")
-            
-        except Exception as e:
-            print(f"⚠️ recentBlog.md 업데이트 실패: {e}")
-    
     async def post_to_tistory(self, blog_file, category_id=None, tags=None):
         """티스토리에 자동 포스팅 (API 방식은 사용하지 않음)"""
         print(" API 방식 포스팅은 사용하지 않습니다. 셀레니움 방식만 사용합니다.")
@@ -381,7 +465,28 @@ async def main():
     print(f" 완료! 블로그 글: {filename}")
     print(f" 주제: {topic}")
     
+    await http_client.close_session()
+    
     return filename, topic  # 결과 반환
 
+async def poll_main(max_batches=None):
+    """폴링 모드: 피드별 간격을 학습하며 계속 수집하고, 새 기사가 모일 때마다 글을 생성해 발행 대기열에 등록"""
+    processor = BBCNewsProcessor(config.TISTORY_BLOG_NAME, config.TISTORY_COOKIE)
+    print(" BBC 피드 폴링 시작 (Ctrl+C로 종료)")
+    try:
+        filenames = await processor.run_polling(max_batches=max_batches)
+    finally:
+        await http_client.close_session()
+    print(f" 폴링 종료: 블로그 글 {len(filenames)}개 생성")
+    return filenames
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="BBC 뉴스 프로세서")
+    parser.add_argument('--poll', action='store_true', help='피드를 계속 폴링하며 새 기사가 모일 때마다 글 생성')
+    parser.add_argument('--batches', type=int, default=None, help='--poll에서 처리할 배치 수 (기본: 계속 실행)')
+    args = parser.parse_args()
+    if args.poll:
+        asyncio.run(poll_main(args.batches))
+    else:
+        asyncio.run(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+속보 빠른 발행 경로
+피드 폴링 결과를 계속 지켜보다가 신호가 강한 기사(여러 피드에 동시에 실린 기사, 갑자기 많이 등장한
+키워드, 속보 키워드)를 찾으면 배치 주기를 기다리지 않고 바로 글을 생성해 발행합니다.
+LLM 모델은 keep_alive 요청으로 메모리에 올려 두고, 티스토리는 로그인된 브라우저를 재사용합니다.
+"""
+
+import asyncio
+import os
+import re
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from config import config
+from src.core.bbc_news_processor import BBCNewsProcessor
+from src.core.korean_news_processor import KoreanNewsProcessor
+from src.scrapers import http_client
+from src.scrapers.dedup import NearDuplicateDetector, normalize_text
+from src.scrapers.feed_scheduler import FeedScheduler
+
+# 키워드 급증 판단에서 제외할 흔한 단어
+STOPWORDS = {
+    'the', 'a', 'an', 'to', 'of', 'in', 'on', 'for', 'and', 'or', 'is', 'are', 'was', 'as', 'at', 'by',
+    'with', 'from', 'after', 'over', 'says', 'say', 'new', 'how', 'why', 'what', 'who',
+    '종합', '단독', '속보', '상보', '1보', '2보', '사진', '영상', '뉴스',
+}
+WORD_RE = re.compile(r'\w{2,}')
+
+
+class BreakingNewsDetector:
+    """속보 후보 판별기
+
+    - 같은 기사(MinHash 유사도 기준)가 min_feeds개 이상의 피드에 실림
+    - 제목 단어가 최근 구간 평균보다 spike_ratio배 이상 많이 등장
+    - 제목에 속보 키워드 포함
+    max_age보다 오래된 기사는 신호가 있어도 무시합니다.
+    """
+
+    def __init__(self, min_feeds: int = 3, max_age: timedelta = timedelta(hours=2),
+                 keywords: Optional[List[str]] = None, spike_ratio: float = 3.0, spike_min_count: int = 4,
+                 window_seconds: float = 1800, warmup_windows: int = 2, alpha: float = 0.3,
+                 threshold: float = 0.7):
+        self.min_feeds = min_feeds
+        self.max_age = max_age
+        self.keywords = [keyword.lower() for keyword in (keywords or [])]
+        self.spike_ratio = spike_ratio
+        self.spike_min_count = spike_min_count
+        self.window_seconds = window_seconds
+        self.warmup_windows = warmup_windows
+        self.alpha = alpha
+        self.threshold = threshold
+        self._reset_clusters()
+        # 키워드 급증: 현재 구간의 단어별 기사 수와 이전 구간들의 EWMA
+        self.window_counts: Counter = Counter()
+        self.baseline: Dict[str, float] = {}
+        self.window_started = time.monotonic()
+        self.windows_seen = 0
+        self.spiked_terms: Set[str] = set()
+
+    def _reset_clusters(self):
+        self.clusters = NearDuplicateDetector(threshold=self.threshold)
+        self.cluster_feeds: Dict[int, Set[str]] = {}
+        self.flagged: Set[int] = set()
+
+    def _roll_window(self):
+        """구간이 끝나면 단어 빈도 기준선을 갱신하고 오래된 기사 묶음을 비움"""
+        if time.monotonic() - self.window_started < self.window_seconds:
+            return
+        for term in set(self.baseline) | set(self.window_counts):
+            count = self.window_counts.get(term, 0)
+            self.baseline[term] = self.alpha * count + (1 - self.alpha) * self.baseline.get(term, 0.0)
+        self.baseline = {term: value for term, value in self.baseline.items() if value >= 0.05}
+        self.window_counts = Counter()
+        self.spiked_terms = set()
+        self.window_started = time.monotonic()
+        self.windows_seen += 1
+        if self.windows_seen % 4 == 0:
+            self._reset_clusters()  # 몇 구간마다 기사 묶음 인덱스를 새로 시작해 메모리 제한
+
+    def is_fresh(self, item: Dict) -> bool:
+        published = item.get('published_date') or item.get('published')
+        if isinstance(published, str):
+            try:
+                published = datetime.fromisoformat(published)
+            except ValueError:
+                return True
+        if not isinstance(published, datetime):
+            return True
+        now = datetime.now(timezone.utc).replace(tzinfo=None)  # 피드 날짜는 UTC 기준
+        return now - published.replace(tzinfo=None) <= self.max_age
+
+    def _spike_term(self, item: Dict) -> Optional[str]:
+        terms = {term for term in WORD_RE.findall(normalize_text(item.get('title', ''))) if term not in STOPWORDS}
+        self.window_counts.update(terms)
+        if self.windows_seen < self.warmup_windows:
+            return None  # 기준선이 생길 때까지는 급증 판단 안 함
+        for term in terms:
+            count = self.window_counts[term]
+            if term in self.spiked_terms or count < self.spike_min_count:
+                continue
+            if count >= self.spike_ratio * (self.baseline.get(term, 0.0) + 1):
+                self.spiked_terms.add(term)  # 같은 단어로는 구간당 한 번만
+                return term
+        return None
+
+    def observe(self, feed: str, items: List[Dict]) -> List[Dict]:
+        """폴링된 피드 항목을 반영하고 새로 속보로 판단된 항목 반환 (item['signal']에 이유 기록)"""
+        self._roll_window()
+        flagged = []
+        for item in items:
+            index, is_new = self.clusters.match_or_add(item)
+            feeds = self.cluster_feeds.setdefault(index, set())
+            feeds.add(feed)
+            if index in self.flagged or not self.is_fresh(item):
+                continue
+
+            signal = None
+            title = item.get('title', '').lower()
+            keyword = next((keyword for keyword in self.keywords if keyword in title), None)
+            if keyword:
+                signal = f"속보 키워드 '{keyword}'"
+            elif len(feeds) >= self.min_feeds:
+                signal = f"{len(feeds)}개 피드 동시 게재"
+            elif is_new:
+                term = self._spike_term(item)
+                if term:
+                    signal = f"키워드 급증 '{term}'"
+            if signal:
+                self.flagged.add(index)
+                flagged.append({**item, 'signal': signal})
+        return flagged
+
+
+async def warm_up_llm(ollama_url: str, model: str, keep_alive: str = '30m') -> bool:
+    """프롬프트 없이 요청해 모델을 메모리에 올리고 keep_alive 동안 유지"""
+    try:
+        status, _ = await http_client.post_json(
+            f"{ollama_url}/api/generate",
+            {"model": model, "keep_alive": keep_alive},
+            kind='llm'
+        )
+        return status == 200
+    except Exception as e:
+        print(f" LLM 예열 실패: {e}")
+        return False
+
+
+class FastLane:
+    def __init__(self, processors: Dict[str, object], detector: BreakingNewsDetector,
+                 seen_index, browser=None, keep_alive: str = '30m', ping_interval: float = 240):
+        self.processors = processors  # 기사 source → 프로세서 (BBC, 연합뉴스)
+        self.detector = detector
+        self.seen_index = seen_index
+        self.browser = browser  # TistoryBrowser (None이면 글만 저장)
+        self.keep_alive = keep_alive
+        self.ping_interval = ping_interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.published: List[Dict] = []
+
+    def attach(self, scheduler: FeedScheduler):
+        scheduler.observers.append(self.on_items)
+
+    def on_items(self, feed: str, items: List[Dict]):
+        """스케줄러 콜백: 속보 후보 중 아직 처리하지 않은 기사를 큐에 넣음"""
+        flagged = [item for item in self.detector.observe(feed, items) if item.get('source') in self.processors]
+        for item in self.seen_index.filter_new(flagged):
+            item['flagged_at'] = time.monotonic()
+            print(f"🚨 [{item['signal']}] {item['title']}")
+            self.queue.put_nowait(item)
+
+    async def keep_llm_warm(self):
+        """기사 생성 요청 사이에 모델이 내려가지 않도록 주기적으로 keep_alive 갱신"""
+        processor = next(iter(self.processors.values()))
+        while True:
+            await warm_up_llm(processor.ollama_url, processor.model, self.keep_alive)
+            await asyncio.sleep(self.ping_interval)
+
+    async def start_browser(self):
+        """브라우저를 미리 띄우고 로그인 (selenium은 동기 API이므로 스레드에서 실행)"""
+        if self.browser is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.browser.start)
+
+    async def publish(self, item: Dict) -> Optional[str]:
+        """기사 하나로 글 생성 → 저장 → 발행 (저장한 파일 경로 반환)"""
+        processor = self.processors[item['source']]
+        news_list = [item]
+        await processor._collect_contents(news_list)
+        topic = await processor.generate_topic(news_list)
+        blog = await processor.generate_blog_post(news_list, topic)
+        if isinstance(blog, dict):  # KoreanNewsProcessor는 {'content': ...} 반환
+            blog = blog.get('content', '')
+        saved = await processor.save_blog_post(blog, topic)
+        filename = saved[0] if isinstance(saved, tuple) else saved
+
+        if self.browser is not None:
+            processor.post_registry.claim(filename)  # 저장하면서 대기열에 들어간 글을 배치 포스터보다 먼저 가져감
+            try:
+                published = await asyncio.get_running_loop().run_in_executor(None, self.browser.post, filename)
+            except Exception as e:
+                processor.post_registry.mark_failed(filename, str(e))
+                raise
+            if not published:
+                processor.post_registry.mark_failed(filename, "발행하지 못했습니다")
+                raise RuntimeError(f"티스토리에 발행하지 못했습니다: {filename}")
+            processor.post_registry.mark_published(filename)
+        self.seen_index.mark_seen(news_list, source=item['source'])
+        processor.article_store.upsert(news_list, source=item['source'])
+        processor.article_store.mark_posted(news_list)
+        self.seen_index.flush()
+
+        elapsed = time.monotonic() - item['flagged_at']
+        self.published.append({'title': item['title'], 'file': filename, 'seconds': elapsed})
+        print(f"⚡ 빠른 발행 완료 ({elapsed:.0f}초): {topic}")
+        return filename
+
+    async def run(self):
+        """속보 큐를 하나씩 처리 (실패한 기사는 건너뛰고 계속)"""
+        while True:
+            item = await self.queue.get()
+            try:
+                await self.publish(item)
+            except Exception as e:
+                print(f"❌ 빠른 발행 실패: {item['title']}: {e}")
+
+
+# 사용 예시: BBC + 연합뉴스 피드를 지켜보며 속보만 바로 발행
+async def main():
+    bbc = BBCNewsProcessor(config.TISTORY_BLOG_NAME, config.TISTORY_COOKIE)
+    korean = KoreanNewsProcessor(config.TISTORY_BLOG_NAME, config.TISTORY_COOKIE)
+
+    detector = BreakingNewsDetector(
+        min_feeds=getattr(config, 'BREAKING_MIN_FEEDS', 3),
+        max_age=timedelta(minutes=getattr(config, 'BREAKING_MAX_AGE_MINUTES', 120)),
+        keywords=getattr(config, 'BREAKING_KEYWORDS', ['속보', 'breaking']),
+        spike_ratio=getattr(config, 'BREAKING_SPIKE_RATIO', 3.0),
+        spike_min_count=getattr(config, 'BREAKING_SPIKE_MIN_COUNT', 4),
+        threshold=getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7),
+    )
+    browser = None
+    if getattr(config, 'FAST_LANE_AUTO_POST', True):
+        from src.posters.tistory_selenium_poster import TistoryBrowser
+        browser = TistoryBrowser.from_config()
+
+    # 빠른 경로는 큐에 넣지 않고 폴링 결과만 관찰 (일반 기사는 기존 배치 파이프라인이 처리)
+    scheduler = FeedScheduler(seen_index=bbc.seen_index, enqueue=False,
+                              min_interval=getattr(config, 'FAST_LANE_POLL_INTERVAL', 60))
+    scheduler.add_bbc_feeds(bbc.crawler)
+    scheduler.add_yonhap_feeds(korean.crawler)
+    lane = FastLane({'BBC': bbc, '연합뉴스': korean}, detector, bbc.seen_index, browser=browser,
+                    keep_alive=getattr(config, 'OLLAMA_KEEP_ALIVE', '30m'))
+    lane.attach(scheduler)
+
+    print("⚡ 속보 빠른 발행 경로 시작 (LLM 예열, 브라우저 로그인)")
+    await warm_up_llm(bbc.ollama_url, bbc.model, lane.keep_alive)
+    await lane.start_browser()
+    try:
+        await asyncio.gather(scheduler.run(), lane.run(), lane.keep_llm_warm())
+    finally:
+        scheduler.stop()
+        if browser is not None:
+            browser.close()
+        await http_client.close_session()
+
+if __name__ == "__main__":
+    asyncio.run(main())
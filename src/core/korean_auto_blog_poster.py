@@ -13,6 +13,7 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.core.korean_news_processor import KoreanNewsProcessor
+from src.scrapers import http_client
 from config import config
 
 async def korean_auto_blog_posting():
@@ -106,6 +107,9 @@ async def korean_auto_blog_posting():
     except Exception as e:
         print(f"❌ 자동 포스팅 중 오류 발생: {e}")
         return None
+    finally:
+        # 공유 HTTP 세션 정리
+        await http_client.close_session()
 
 def main():
     """메인 함수"""
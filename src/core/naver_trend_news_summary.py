@@ -1,19 +1,24 @@
+import asyncio
 import sys
 import os
 import json
 from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.scrapers.naver_news_api import search_naver_news
+from src.scrapers.naver_news_api import search_naver_news_many
+from src.scrapers.dedup import NearDuplicateDetector
+from src.storage.article_store import ArticleStore
+from src.storage.news_item import NewsItem
+from src.storage.search_index import SearchIndex
 from config import config
-import requests
+from src.scrapers import http_client
 
 def summarize_news_with_llm(news_list, keyword):
     prompt = f"다음은 '{keyword}'에 대한 최신 뉴스 기사 목록입니다. 각 기사의 주요 내용을 요약해 주세요.\n"
     for news in news_list:
         prompt += f"- {news['title']} ({news['link']})\n"
     # Ollama LLM API 호출
-    response = requests.post(
+    response = http_client.get_sync_session().post(
         f"{config.OLLAMA_URL}/api/generate",
         json={
             "model": config.OLLAMA_MODEL,
@@ -25,7 +30,7 @@ def summarize_news_with_llm(news_list, keyword):
                 "max_tokens": 1024
             }
         },
-        timeout=60
+        timeout=http_client.sync_timeout('llm', 60)
     )
     if response.status_code == 200:
         return response.json()["response"].strip()
@@ -38,7 +43,14 @@ def save_json(data, keyword):
     os.makedirs(out_dir, exist_ok=True)
     filename = os.path.join(out_dir, f"naver_trend_{keyword}_{today_str}.json")
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump({**data, 'news': [dict(news) for news in data['news']]}, f, ensure_ascii=False, indent=2, default=str)
+    # 기사 DB에도 저장
+    store = ArticleStore()
+    store.upsert(data['news'], source='네이버뉴스', keyword=keyword)
+    store.close()
+    index = SearchIndex()
+    index.add_articles(data['news'], source='네이버뉴스', keyword=keyword)
+    index.close()
     return filename
 
 def save_markdown(summary_dict):
@@ -54,6 +66,9 @@ def save_markdown(summary_dict):
                 f.write(f"- [{news['title']}]({news['link']})\n")
             f.write("\n## LLM 요약\n")
             f.write(info['summary'] + "\n\n---\n\n")
+    index = SearchIndex()
+    index.add_post(filename, f"네이버 트렌드 뉴스 요약 {today_str}", source='네이버뉴스')
+    index.close()
     return filename
 
 def post_to_tistory_with_selenium(md_file):
@@ -72,14 +87,29 @@ def post_to_tistory_with_selenium(md_file):
     else:
         print(f"블로그 업로드 오류: {result.stderr}")
 
+async def collect_keyword_news(keywords, display=5):
+    """키워드별 뉴스를 동시에 수집 (NewsItem 목록)"""
+    try:
+        results = await search_naver_news_many(keywords, display=display)
+        return {
+            keyword: [NewsItem.from_naver(news, keyword=keyword) for news in news_list]
+            for keyword, news_list in results.items()
+        }
+    finally:
+        await http_client.close_session()
+
 def main():
     print("[사용자 지정 키워드 기반 뉴스 요약]")
     keywords = ["경제", "주식", "정치", "나스닥", "코스닥", "미국", "한국"]
     print(f"키워드: {keywords}")
     summary_dict = {}
+    print("\n키워드별 뉴스 기사 수집 중...")
+    news_by_keyword = asyncio.run(collect_keyword_news(keywords, display=5))
+    # 여러 키워드에 겹쳐 나온 같은 기사는 앞 키워드에만 남김
+    detector = NearDuplicateDetector(threshold=getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7))
     for keyword in keywords:
-        print(f"\n[키워드: {keyword}] 뉴스 기사 수집 중...")
-        news_list = search_naver_news(keyword, display=5)
+        print(f"\n[키워드: {keyword}] 뉴스 기사")
+        news_list = detector.filter(news_by_keyword[keyword])
         for news in news_list:
             print(f"- {news['title']} | {news['link']}")
         summary = summarize_news_with_llm(news_list, keyword)
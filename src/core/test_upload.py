@@ -7,6 +7,8 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.core.bbc_news_processor import BBCNewsProcessor
+from src.scrapers import http_client
+from src.storage.article_archive import ArticleArchive
 from config import config
 
 async def test_upload_from_json():
@@ -29,8 +31,13 @@ async def test_upload_from_json():
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         json_file_path = os.path.join(project_root, "data", "bbc_news_json", "bbc_news_all_2025-07-05.json")
         
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            news_data = json.load(f)
+        if os.path.exists(json_file_path):
+            with open(json_file_path, "r", encoding="utf-8") as f:
+                news_data = json.load(f)
+        else:
+            # 날짜별 JSON이 없으면 아카이브에서 최근 BBC 기사 사용
+            print("📚 JSON 파일이 없어 아카이브에서 최근 BBC 기사를 읽습니다...")
+            news_data = ArticleArchive().recent(10, source='BBC')
         
         print(f"📰 읽은 뉴스 개수: {len(news_data)}개")
         
@@ -71,6 +78,9 @@ async def test_upload_from_json():
         
     except Exception as e:
         print(f"❌ 테스트 중 오류 발생: {e}")
+    finally:
+        # 공유 HTTP 세션 정리
+        await http_client.close_session()
 
 if __name__ == "__main__":
     asyncio.run(test_upload_from_json()) 
\ No newline at end of file
@@ -3,7 +3,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import UnexpectedAlertPresentException, NoAlertPresentException, TimeoutException, NoSuchElementException
+from selenium.common.exceptions import UnexpectedAlertPresentException, NoAlertPresentException, TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
@@ -37,48 +37,10 @@ def markdown_to_html(md, json_data=None):
 
     return html
 
-# 티스토리 셀레니움 자동 포스팅 함수
-def tistory_post_with_selenium(
-    markdown_file,
-    blog_url,
-    category_name="IT",
-    tags="BBC뉴스,글로벌트렌드,기술동향",
-    headless=False,
-    kakao_email=None,
-    kakao_password=None,
-    json_file=None # 추가된 인자
-):
-    # 1. 마크다운 파일 읽기
-    with open(markdown_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    lines = content.split('\n')
-    title = ""
-    body_lines = []
-    for line in lines:
-        if line.startswith('# ') and not title:
-            title = line[2:].strip()
-        else:
-            body_lines.append(line)
-    if not title:
-        title = os.path.basename(markdown_file).replace('.md', '')
-    body = '\n'.join(body_lines).strip()
-
-    # json_file 인자가 있으면 json_data로 로드
-    json_data = None
-    if json_file:
-        import json
-        try:
-            with open(json_file, 'r', encoding='utf-8') as jf:
-                json_data = json.load(jf)
-            print(f"✅ JSON 파일 로드 완료: {json_file}")
-        except Exception as e:
-            print(f"⚠️ JSON 파일 로드 실패: {e}")
-            json_data = None
-
-    # JSON 데이터가 있으면 본문에 반드시 포함
-    html_body = markdown_to_html(body, json_data)
-
-    # 2. 셀레니움 브라우저 옵션
+# 크롬 WebDriver 생성 / 카카오 로그인 (빠른 발행 경로에서 로그인된 브라우저를 재사용할 수 있도록 분리)
+def create_driver(headless=False):
+    """크롬 WebDriver 생성 (실패 시 None)"""
+    # 셀레니움 브라우저 옵션
     options = Options()
     if headless:
         options.add_argument('--headless')
@@ -107,9 +69,12 @@ def tistory_post_with_selenium(
         except Exception as e2:
             print(f"❌ 대체 방법도 실패: {e2}")
             print("💡 Chrome 브라우저가 설치되어 있는지 확인해주세요.")
-            return
+            return None
+    return driver
+
 
-    # 3. 카카오 자동 로그인
+def kakao_login(driver, kakao_email=None, kakao_password=None):
+    """카카오 계정으로 티스토리 자동 로그인 (계정 정보가 없거나 실패하면 글쓰기 단계에서 수동 로그인)"""
     if kakao_email and kakao_password:
         print("🔐 카카오 자동 로그인 시도 중...")
         try:
@@ -275,7 +240,59 @@ def tistory_post_with_selenium(
             print("수동 로그인을 진행합니다...")
     else:
         print("카카오 계정 정보가 없어 수동 로그인을 진행합니다...")
-    
+
+
+# 티스토리 셀레니움 자동 포스팅 함수
+def tistory_post_with_selenium(
+    markdown_file,
+    blog_url,
+    category_name="IT",
+    tags="BBC뉴스,글로벌트렌드,기술동향",
+    headless=False,
+    kakao_email=None,
+    kakao_password=None,
+    json_file=None, # 추가된 인자
+    driver=None  # 로그인된 WebDriver를 넘기면 새로 띄우지 않고 사용 (종료도 호출 측에서)
+):
+    """마크다운 글을 티스토리에 발행하고, 발행 버튼까지 눌렀으면 True (브라우저를 띄우지 못했거나 발행하지 못했으면 False)"""
+    # 1. 마크다운 파일 읽기
+    with open(markdown_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    lines = content.split('\n')
+    title = ""
+    body_lines = []
+    for line in lines:
+        if line.startswith('# ') and not title:
+            title = line[2:].strip()
+        else:
+            body_lines.append(line)
+    if not title:
+        title = os.path.basename(markdown_file).replace('.md', '')
+    body = '\n'.join(body_lines).strip()
+
+    # json_file 인자가 있으면 json_data로 로드
+    json_data = None
+    if json_file:
+        import json
+        try:
+            with open(json_file, 'r', encoding='utf-8') as jf:
+                json_data = json.load(jf)
+            print(f"✅ JSON 파일 로드 완료: {json_file}")
+        except Exception as e:
+            print(f"⚠️ JSON 파일 로드 실패: {e}")
+            json_data = None
+
+    # JSON 데이터가 있으면 본문에 반드시 포함
+    html_body = markdown_to_html(body, json_data)
+
+    # 2~3. 브라우저 준비 및 카카오 자동 로그인 (이미 로그인된 driver를 받으면 그대로 재사용)
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver(headless)
+        if driver is None:
+            return False
+        kakao_login(driver, kakao_email, kakao_password)
+
     # 4. 티스토리 글쓰기 페이지로 이동
     print("📝 티스토리 글쓰기 페이지로 이동 중...")
     
@@ -845,44 +862,132 @@ def tistory_post_with_selenium(
         print("✅ 공개 발행 버튼 클릭 완료!")
     except Exception as e:
         print(f"❌ 발행 버튼 클릭 오류: {e}")
+        if owns_driver:
+            driver.quit()
+        return False
 
     # 13. 완료 대기 후 종료
     print("⏳ 발행 처리 대기 중...")
     time.sleep(5)
-    driver.quit()
+    if owns_driver:
+        driver.quit()
     print("�� 티스토리 자동 업로드 완료!")
+    return True
+
+
+# 설정 파일 로드
+def load_tistory_config():
+    import json
+    # 현재 디렉토리 기준으로 config 폴더에서 설정 파일 찾기
+    current_dir = os.getcwd()
+    config_file = os.path.join(current_dir, "config", "tistory_config.json")
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config_data = json.load(f)
+                print(f"✅ 설정 파일 로드 완료: {config_file}")
+                return config_data
+        except Exception as e:
+            print(f"⚠️ 설정 파일 로드 실패: {e}")
+    else:
+        print(f"⚠️ 설정 파일을 찾을 수 없습니다: {config_file}")
+    return {}
+
+
+class TistoryBrowser:
+    """로그인된 크롬 창을 유지하며 여러 글을 연속으로 발행 (글마다 브라우저 실행/로그인 생략)"""
+
+    def __init__(self, blog_url, category_name="IT", tags="BBC뉴스,글로벌트렌드,기술동향",
+                 headless=False, kakao_email=None, kakao_password=None):
+        self.blog_url = blog_url
+        self.category_name = category_name
+        self.tags = tags
+        self.headless = headless
+        self.kakao_email = kakao_email
+        self.kakao_password = kakao_password
+        self.driver = None
+
+    @classmethod
+    def from_config(cls):
+        """config/tistory_config.json 설정으로 생성"""
+        config = load_tistory_config()
+        return cls(
+            blog_url=config.get('blog_url', 'https://aigent-hong.tistory.com'),
+            category_name=config.get('default_category', 'IT'),
+            tags=config.get('default_tags', 'BBC뉴스,글로벌트렌드,기술동향'),
+            headless=config.get('headless', False),
+            kakao_email=config.get('kakao_email', ''),
+            kakao_password=config.get('kakao_password', ''),
+        )
+
+    def start(self):
+        """브라우저를 띄우고 로그인 (이미 떠 있으면 그대로 사용)"""
+        if self.driver is not None:
+            return
+        self.driver = create_driver(self.headless)
+        if self.driver is None:
+            raise RuntimeError("Chrome WebDriver를 시작할 수 없습니다.")
+        kakao_login(self.driver, self.kakao_email, self.kakao_password)
+
+    def post(self, markdown_file, json_file=None):
+        """로그인된 브라우저로 글 발행 (브라우저가 죽었으면 한 번 다시 띄워서 재시도)
+
+        발행 버튼까지 눌렀으면 True, 발행하지 못했으면 False를 반환합니다.
+        """
+        for attempt in range(2):
+            try:
+                self.start()
+                return tistory_post_with_selenium(
+                    markdown_file=markdown_file,
+                    blog_url=self.blog_url,
+                    category_name=self.category_name,
+                    tags=self.tags,
+                    json_file=json_file,
+                    driver=self.driver
+                )
+            except WebDriverException as e:
+                print(f"⚠️ 브라우저 오류로 다시 시작합니다: {e}")
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
 
 if __name__ == "__main__":
     import argparse
-    import re
     import os
     
+    # 발행 대기열 (data/posts.db)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.storage.post_registry import PostRegistry, PostStateError
+    registry = PostRegistry()
+    
     def get_latest_blog_file():
-        """recentBlog.md에서 최신 블로그 파일 경로 추출"""
-        recent_blog_file = "recentBlog.md"
-        if not os.path.exists(recent_blog_file):
-            print("❌ recentBlog.md 파일이 없습니다.")
-            return None
-        
-        with open(recent_blog_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 파일경로 추출
-        match = re.search(r'- \*\*파일경로\*\*: (.+\.md)', content)
-        if match:
-            file_path = match.group(1)
-            if os.path.exists(file_path):
-                print(f"✅ recentBlog.md에서 파일을 찾았습니다: {file_path}")
-                return file_path
-            else:
-                print(f"❌ 파일이 존재하지 않습니다: {file_path}")
+        """발행 대기열에서 가장 먼저 들어온 글을 가져와 파일 경로 반환 (posting 상태로 바뀌어 다른 포스터는 가져가지 않음)"""
+        # 이전 포스터가 발행 중에 죽어 posting에 멈춘 글은 다시 대기열로
+        stale = registry.requeue_stale()
+        if stale:
+            print(f"🔁 posting 상태로 멈춘 글 {stale}개를 다시 대기열에 넣었습니다.")
+        while True:
+            post = registry.claim_next('BBC')  # BBC 글만
+            if post is None:
+                print("❌ 발행 대기 중인 블로그 글이 없습니다.")
                 return None
-        else:
-            print("❌ recentBlog.md에서 파일경로를 찾을 수 없습니다.")
-            return None
+            if os.path.exists(post['path']):
+                print(f"✅ 발행 대기열에서 파일을 찾았습니다: {post['path']}")
+                return post['path']
+            print(f"❌ 파일이 존재하지 않습니다: {post['path']}")
+            registry.mark_failed(post['path'], "파일 없음")
     
     parser = argparse.ArgumentParser(description="BBC 셀레니움 티스토리 자동 포스터")
-    parser.add_argument('--file', type=str, help='업로드할 마크다운 파일 경로 (지정하지 않으면 recentBlog.md에서 자동 찾기)')
+    parser.add_argument('--file', type=str, help='업로드할 마크다운 파일 경로 (지정하지 않으면 발행 대기열에서 다음 글)')
     parser.add_argument('--auto', action='store_true', help='자동 업로드 모드')
     args = parser.parse_args()
 
@@ -892,7 +997,7 @@ if __name__ == "__main__":
     # 파일 경로 결정
     file_path = args.file
     if file_path is None:
-        print("파일 경로가 지정되지 않았습니다. recentBlog.md에서 최신 파일을 찾습니다.")
+        print("파일 경로가 지정되지 않았습니다. 발행 대기열에서 다음 글을 가져옵니다.")
         file_path = get_latest_blog_file()
         if file_path is None:
             print("❌ 업로드할 파일을 찾을 수 없습니다.")
@@ -900,7 +1005,7 @@ if __name__ == "__main__":
     
     # 자동 모드: 최신 파일들 자동 선택
     if args.auto:
-        print("자동 모드: recentBlog.md에서 최신 BBC 블로그 글 파일을 찾아 업로드합니다.")
+        print("자동 모드: 발행 대기열에서 다음 BBC 블로그 글 파일을 가져와 업로드합니다.")
         
         # 최신 블로그 글 파일 찾기
         if file_path is None:
@@ -912,24 +1017,7 @@ if __name__ == "__main__":
     print(f"📁 업로드할 파일: {file_path}")
     
     # 설정 파일 로드
-    def load_config():
-        import json
-        # 현재 디렉토리 기준으로 config 폴더에서 설정 파일 찾기
-        current_dir = os.getcwd()
-        config_file = os.path.join(current_dir, "config", "tistory_config.json")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    print(f"✅ 설정 파일 로드 완료: {config_file}")
-                    return config_data
-            except Exception as e:
-                print(f"⚠️ 설정 파일 로드 실패: {e}")
-        else:
-            print(f"⚠️ 설정 파일을 찾을 수 없습니다: {config_file}")
-        return {}
-    
-    config = load_config()
+    config = load_tistory_config()
     
     # 블로그 주소 및 기본값 설정
     blog_url = config.get('blog_url', 'https://aigent-hong.tistory.com')
@@ -959,13 +1047,32 @@ if __name__ == "__main__":
     print(f"🏷️ 태그: {tags}")
     print(f"🔐 자동 로그인: {'예' if kakao_email and kakao_password else '아니오'}")
     
-    tistory_post_with_selenium(
-        markdown_file=file_path,
-        blog_url=blog_url,
-        category_name=category_name,
-        tags=tags,
-        headless=headless,
-        kakao_email=kakao_email,
-        kakao_password=kakao_password,
-        json_file=json_file
-    ) 
\ No newline at end of file
+    # 직접 지정한 파일도 대기열에서 posting 상태로 가져감 (이미 발행했거나 다른 포스터가 올리는 중이면 중단)
+    if args.file is not None:
+        try:
+            registry.claim(file_path)
+        except PostStateError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    
+    try:
+        published = tistory_post_with_selenium(
+            markdown_file=file_path,
+            blog_url=blog_url,
+            category_name=category_name,
+            tags=tags,
+            headless=headless,
+            kakao_email=kakao_email,
+            kakao_password=kakao_password,
+            json_file=json_file
+        )
+    except Exception as e:
+        registry.mark_failed(file_path, str(e))
+        raise
+    # 발행 버튼까지 누른 것을 확인한 글만 published로 기록
+    if not published:
+        registry.mark_failed(file_path, "발행하지 못했습니다")
+        registry.close()
+        sys.exit(1)
+    registry.mark_published(file_path)
+    registry.close()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+과거 기사 백필 수집기
+날짜 범위와 페이지가 있는 소스(네이버 검색 start 오프셋, Wayback Machine에 저장된 RSS 스냅샷)를
+작업 단위로 나눠 제한된 동시성으로 훑습니다. 페이지마다 결과를 JSONL에 추가한 뒤 체크포인트를 저장하므로,
+몇 달 치 수집이 중간에 끊겨도 다시 실행하면 마지막으로 저장한 페이지 다음부터 이어서 진행합니다.
+
+사용법:
+    python src/scrapers/backfill.py naver <작업 이름> --query 경제 --query 반도체 --since 2024-01-01
+    python src/scrapers/backfill.py wayback <작업 이름> --since 2024-01-01 --until 2024-06-30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config import config
+from src.scrapers import http_client
+from src.scrapers.feed_parser import parse_feed_entries_async
+from src.scrapers.naver_news_api import (
+    NAVER_MAX_DISPLAY, NAVER_MAX_START, NAVER_QPS, NaverQuota, search_naver_news_async,
+)
+from src.scrapers.rate_limiter import TokenBucket
+from src.scrapers.rss_stream import utc_naive
+from src.storage.news_item import NewsItem
+from src.storage.seen_index import item_key
+
+DEFAULT_BACKFILL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'backfill'
+)
+WAYBACK_CDX_URL = "https://web.archive.org/cdx/search/cdx"
+WAYBACK_SNAPSHOT_URL = "https://web.archive.org/web/{timestamp}id_/{url}"  # id_: 원본 그대로 (툴바 없음)
+
+# 페이지 하나 요청: 커서 → (수집한 행, 다음 커서 또는 None(작업 끝))
+# 커서는 체크포인트에 JSON으로 저장되므로 기본 타입만 사용
+FetchPage = Callable[[Any], Awaitable[Tuple[List[Dict], Any]]]
+
+
+def make_row(item: NewsItem, origin: str) -> Dict:
+    """백필 결과 한 행 (아카이브 레코드 + 출처 검색어/피드 URL)"""
+    return {**item.to_record(), 'origin': origin}
+
+
+def month_ranges(since: datetime, until: datetime) -> Iterator[Tuple[datetime, datetime]]:
+    """[since, until] 구간을 달력 월 단위로 나눔"""
+    start = since
+    while start <= until:
+        next_month = (start.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0,
+                                                                         second=0, microsecond=0)
+        end = min(until, next_month - timedelta(microseconds=1))
+        yield start, end
+        start = next_month
+
+
+class BackfillJob:
+    """체크포인트로 재개할 수 있는 백필 작업
+
+    data/backfill/<이름>/items.jsonl: 수집한 행 (중복 제거)
+    data/backfill/<이름>/checkpoint.json: 작업별 다음 커서/완료 여부와 items.jsonl의 유효 길이
+    """
+
+    def __init__(self, name: str, root: str = DEFAULT_BACKFILL_DIR, concurrency: Optional[int] = None):
+        self.name = name
+        self.dir = os.path.join(root, name)
+        self.checkpoint_path = os.path.join(self.dir, 'checkpoint.json')
+        self.output_path = os.path.join(self.dir, 'items.jsonl')
+        self.concurrency = concurrency or getattr(config, 'BACKFILL_CONCURRENCY', 4)
+        self.tasks: Dict[str, Tuple[FetchPage, Any]] = {}
+        os.makedirs(self.dir, exist_ok=True)
+        self.state = self._load_checkpoint()
+        self.seen = set()
+        self._output = self._open_output()
+
+    def _load_checkpoint(self) -> Dict:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'tasks': {}, 'offset': 0, 'rows': 0}
+
+    def _save_checkpoint(self):
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _open_output(self):
+        """체크포인트 이후에 쓰다 만 행은 잘라내고, 이미 저장한 기사 키를 다시 읽음"""
+        output = open(self.output_path, 'a+b')
+        output.truncate(self.state['offset'])
+        output.seek(0)
+        for line in output:
+            try:
+                self.seen.add(item_key(json.loads(line)))
+            except ValueError:
+                continue
+        output.seek(0, os.SEEK_END)
+        return output
+
+    def add_task(self, key: str, fetch: FetchPage, initial_cursor: Any = None):
+        """작업 등록 (이미 체크포인트에 있으면 저장된 커서부터 재개)"""
+        self.tasks[key] = (fetch, initial_cursor)
+
+    def _commit_page(self, key: str, rows: List[Dict], cursor: Any):
+        """한 페이지 결과를 저장하고 체크포인트 갱신 (await 없이 실행되므로 작업 간에 섞이지 않음)"""
+        written = 0
+        for row in rows:
+            row_key = item_key(row)
+            if row_key in self.seen:
+                continue
+            self.seen.add(row_key)
+            self._output.write((json.dumps(row, ensure_ascii=False) + '\n').encode('utf-8'))
+            written += 1
+        self._output.flush()
+        os.fsync(self._output.fileno())
+
+        task = self.state['tasks'].setdefault(key, {'cursor': None, 'done': False, 'pages': 0, 'rows': 0})
+        task['cursor'] = cursor
+        task['done'] = cursor is None
+        task['pages'] += 1
+        task['rows'] += written
+        self.state['offset'] = self._output.tell()
+        self.state['rows'] += written
+        self._save_checkpoint()
+        return written
+
+    async def _run_task(self, key: str, slots: asyncio.Semaphore):
+        fetch, cursor = self.tasks[key]
+        saved = self.state['tasks'].get(key)
+        if saved is not None:
+            if saved['done']:
+                return
+            cursor = saved['cursor']
+        async with slots:
+            while True:
+                try:
+                    rows, next_cursor = await fetch(cursor)
+                except Exception as e:
+                    # 마지막 체크포인트가 그대로 남으므로 다음 실행에서 이 페이지부터 다시 시도
+                    print(f"❌ {key} 중단 (커서 {cursor}): {e}")
+                    return
+                written = self._commit_page(key, rows, next_cursor)
+                if rows:
+                    print(f"  {key}: {len(rows)}건 (새 기사 {written}건)")
+                if next_cursor is None:
+                    print(f"✅ {key} 완료")
+                    return
+                cursor = next_cursor
+
+    async def run(self) -> Dict:
+        """등록한 작업을 최대 concurrency개씩 동시에 실행하고 진행 상황 반환"""
+        slots = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._run_task(key, slots) for key in self.tasks))
+        return self.progress()
+
+    def progress(self) -> Dict:
+        tasks = self.state['tasks']
+        return {
+            'tasks': len(self.tasks),
+            'done': sum(1 for key in self.tasks if tasks.get(key, {}).get('done')),
+            'rows': self.state['rows'],
+        }
+
+    def close(self):
+        self._output.close()
+
+
+# ---- 네이버 뉴스 검색: 검색어별 start 오프셋 페이지 ----
+
+def naver_pages(query: str, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                bucket: Optional[TokenBucket] = None, quota: Optional[NaverQuota] = None,
+                page_size: int = NAVER_MAX_DISPLAY) -> FetchPage:
+    """최신순 검색 결과를 start 오프셋으로 넘기는 페이지 함수
+
+    네이버 검색 API는 날짜 조건이 없고 start가 최대 1000이므로, 검색어마다 최근 약 1100건까지만 거슬러
+    올라갈 수 있습니다. since보다 오래된 기사가 나오면 작업을 끝내고, until 이후 기사는 건너뜁니다.
+    """
+    async def fetch(cursor):
+        start = cursor or 1
+        items = await search_naver_news_async(query, display=page_size, start=start, sort='date',
+                                              bucket=bucket, quota=quota, raise_errors=True)
+        rows = []
+        reached_since = False
+        for entry in items:
+            item = NewsItem.from_naver(entry, keyword=query)
+            if item.published is not None and since is not None and item.published < since:
+                reached_since = True
+                break
+            if item.published is not None and until is not None and item.published > until:
+                continue
+            rows.append(make_row(item, query))
+        next_start = start + page_size
+        done = reached_since or len(items) < page_size or next_start > NAVER_MAX_START
+        return rows, None if done else next_start
+    return fetch
+
+
+def add_naver_tasks(job: BackfillJob, queries: List[str], since: Optional[datetime] = None,
+                    until: Optional[datetime] = None):
+    bucket = TokenBucket(rate=NAVER_QPS, capacity=NAVER_QPS)
+    quota = NaverQuota()
+    for query in queries:
+        job.add_task(f'naver:{query}', naver_pages(query, since, until, bucket=bucket, quota=quota))
+
+
+# ---- Wayback Machine RSS 스냅샷: 피드/월별로 스냅샷 목록을 만든 뒤 하나씩 ----
+
+async def list_snapshots(feed_url: str, since: datetime, until: datetime, collapse: int = 8) -> List[str]:
+    """기간 안의 피드 스냅샷 시각 목록 (collapse=8이면 하루에 하나, 10이면 한 시간에 하나)"""
+    params = {
+        'url': feed_url,
+        'from': since.strftime('%Y%m%d%H%M%S'),
+        'to': until.strftime('%Y%m%d%H%M%S'),
+        'output': 'json',
+        'fl': 'timestamp',
+        'filter': 'statuscode:200',
+        'collapse': f'timestamp:{collapse}',
+    }
+    status, data = await http_client.get_json(WAYBACK_CDX_URL, params=params, kind='feed', total=60)
+    if status != 200:
+        raise RuntimeError(f"CDX 조회 실패 ({status})")
+    if not data:
+        return []
+    return [row[0] for row in data[1:]]  # 첫 행은 필드 이름
+
+
+def wayback_pages(feed_url: str, source: str, since: datetime, until: datetime,
+                  collapse: int = 8) -> FetchPage:
+    """첫 페이지에서 스냅샷 목록을 커서에 저장하고, 이후 페이지마다 스냅샷 하나를 파싱"""
+    async def fetch(cursor):
+        if cursor is None:
+            snapshots = await list_snapshots(feed_url, since, until, collapse)
+            return [], {'snapshots': snapshots, 'index': 0} if snapshots else None
+
+        snapshots, index = cursor['snapshots'], cursor['index']
+        url = WAYBACK_SNAPSHOT_URL.format(timestamp=snapshots[index], url=feed_url)
+        async with http_client.request('GET', url, kind='feed', total=60) as response:
+            if response.status != 200:
+                raise RuntimeError(f"스냅샷 요청 실패 ({response.status}): {url}")
+            body = await response.read()
+        entries = await parse_feed_entries_async(body)
+
+        rows = []
+        for entry in entries:
+            item = NewsItem.from_feed_entry(entry, source=source)
+            if item.published is not None and not since <= item.published <= until:
+                continue
+            rows.append(make_row(item, feed_url))
+        index += 1
+        return rows, {'snapshots': snapshots, 'index': index} if index < len(snapshots) else None
+    return fetch
+
+
+def add_wayback_tasks(job: BackfillJob, feeds: Dict[str, Tuple[str, str]], since: datetime, until: datetime,
+                      collapse: int = 8):
+    """feeds: {이름: (피드 URL, 소스 이름)} — 피드마다 월 단위 작업으로 나눠 등록"""
+    for name, (feed_url, source) in feeds.items():
+        for start, end in month_ranges(since, until):
+            job.add_task(f'wayback:{name}:{start:%Y-%m}', wayback_pages(feed_url, source, start, end, collapse))
+
+
+def default_feeds() -> Dict[str, Tuple[str, str]]:
+    """BBC/연합뉴스 크롤러에 등록된 RSS 피드"""
+    from src.scrapers.bbc_rss_crawler import BBCNewsCrawler
+    from src.scrapers.korean_news_crawler import KoreanNewsCrawler
+
+    feeds = {f'bbc_{name}': (url, 'BBC') for name, url in BBCNewsCrawler().rss_feeds.items()}
+    feeds.update({f'yonhap_{name}': (url, '연합뉴스') for name, url in KoreanNewsCrawler().yonhap_rss_urls.items()})
+    return feeds
+
+
+# 사용 예시
+async def main():
+    parser = argparse.ArgumentParser(description="과거 기사 백필 수집 (중단 후 같은 작업 이름으로 다시 실행하면 이어서 진행)")
+    parser.add_argument('mode', choices=['naver', 'wayback'])
+    parser.add_argument('name', help='작업 이름 (data/backfill/<이름>에 결과와 체크포인트 저장)')
+    parser.add_argument('--query', action='append', default=[], help='네이버 검색어 (여러 번 지정 가능)')
+    parser.add_argument('--since', type=datetime.fromisoformat, help='시작 날짜 (UTC, 예: 2024-01-01)')
+    parser.add_argument('--until', type=datetime.fromisoformat, default=None, help='끝 날짜 (UTC, 기본: 지금)')
+    parser.add_argument('--concurrency', type=int, default=None)
+    parser.add_argument('--hourly', action='store_true', help='Wayback 스냅샷을 하루 하나 대신 한 시간 하나씩')
+    args = parser.parse_args()
+
+    until = args.until or utc_naive(datetime.now().astimezone())
+    job = BackfillJob(args.name, concurrency=args.concurrency)
+    if args.mode == 'naver':
+        if not args.query:
+            parser.error('--query가 필요합니다')
+        add_naver_tasks(job, args.query, since=args.since, until=until)
+    else:
+        if args.since is None:
+            parser.error('--since가 필요합니다')
+        add_wayback_tasks(job, default_feeds(), args.since, until, collapse=10 if args.hourly else 8)
+
+    try:
+        progress = await job.run()
+        print(f"\n📦 {job.output_path}: 작업 {progress['done']}/{progress['tasks']}개 완료, 기사 {progress['rows']}건")
+    finally:
+        job.close()
+        await http_client.close_session()
+
+if __name__ == "__main__":
+    asyncio.run(main())
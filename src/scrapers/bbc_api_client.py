@@ -1,50 +1,101 @@
-import requests
 import json
 from datetime import datetime, timedelta
 import asyncio
+import codecs
+import os
+import sys
+from urllib.parse import urljoin, urlsplit
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import http_client
+from src.scrapers.content_cache import normalize_url
+from src.scrapers.html_extract import AnchorScanner, HTMLExtractor
+
+BBC_HOSTS = ('www.bbc.co.uk', 'www.bbc.com', 'bbc.co.uk', 'bbc.com')
 
 class BBCAPIClient:
-    def __init__(self):
+    def __init__(self, extractor=None):
         self.base_url = "https://www.bbc.co.uk"
         self.api_url = "https://www.bbc.co.uk/api"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # 전체 파싱 모드(lazy=False)에서 쓰는 링크 추출 엔진 (selectolax/lxml 우선, 없으면 BeautifulSoup)
+        self.extractor = extractor or HTMLExtractor()
+        # 링크 스캔 통계 (읽은 바이트, 지나간 태그/링크 수, 필요한 만큼 찾고 조기 중단한 횟수)
+        self.stream_chunk_size = 8192
+        self.scan_stats = {'pages': 0, 'bytes_read': 0, 'nodes_scanned': 0, 'anchors_scanned': 0, 'early_stops': 0}
+    
+    def canonical_news_url(self, href, title):
+        """기사 링크이면 정규화된 전체 URL, 아니면 None"""
+        if not href or not title or len(title) <= 10:  # 의미있는 제목만
+            return None
+        full_url = urljoin(self.base_url + '/', href)
+        parts = urlsplit(full_url)
+        if parts.netloc not in BBC_HOSTS or '/news/' not in parts.path:
+            return None
+        return normalize_url(full_url)
     
-    async def get_news_by_category(self, category='news', limit=10):
-        """카테고리별 BBC 뉴스 가져오기"""
+    async def _scan_links(self, url, limit):
+        """<a> 태그만 스트리밍으로 훑어 기사 링크 limit개를 찾으면 중단 (실패 시 None)"""
+        scanner = AnchorScanner(self.canonical_news_url, limit)
+        bytes_read = 0
+        async with http_client.request('GET', url, kind='api') as response:
+            if response.status != 200:
+                print(f"❌ BBC API 요청 실패: {response.status}")
+                return None
+            decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+            async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                bytes_read += len(chunk)
+                scanner.feed(decoder.decode(chunk))
+                if scanner.done:
+                    # 필요한 링크를 모두 찾았으므로 남은 페이지는 받지 않음
+                    response.close()
+                    break
+        
+        self.scan_stats['pages'] += 1
+        self.scan_stats['bytes_read'] += bytes_read
+        self.scan_stats['nodes_scanned'] += scanner.nodes_scanned
+        self.scan_stats['anchors_scanned'] += scanner.anchors_scanned
+        if scanner.done:
+            self.scan_stats['early_stops'] += 1
+        return scanner.links
+    
+    async def _parse_links(self, url, limit):
+        """페이지 전체를 받아 모든 링크를 추출한 뒤 기사 링크 limit개 선택 (실패 시 None)"""
+        async with http_client.request('GET', url, kind='api') as response:
+            status = response.status
+            html = await response.read()
+        if status != 200:
+            print(f"❌ BBC API 요청 실패: {status}")
+            return None
+        
+        links = []
+        seen_urls = set()
+        for href, title in self.extractor.anchors(html, url):
+            full_url = self.canonical_news_url(href, title)
+            if full_url and full_url not in seen_urls:
+                seen_urls.add(full_url)
+                links.append((full_url, title))
+                if len(links) >= limit:
+                    break
+        return links
+    
+    async def get_news_by_category(self, category='news', limit=10, lazy=True):
+        """카테고리별 BBC 뉴스 가져오기
+        
+        lazy=True이면 <a> 태그만 스트리밍으로 훑고 기사 limit개를 찾는 즉시 중단합니다.
+        """
         try:
-            # BBC 뉴스 페이지에서 데이터 추출
+            # BBC 뉴스 페이지에서 기사 링크 추출 (필터링 후 limit개, URL 기준 중복 제거)
             url = f"{self.base_url}/{category}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            
-            if response.status_code == 200:
-                # BBC 뉴스 페이지 파싱
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                news_items = []
-                # 뉴스 링크 찾기
-                news_links = soup.find_all('a', href=True)
-                
-                for link in news_links[:limit]:
-                    href = link.get('href')
-                    if href and '/news/' in href and not href.startswith('http'):
-                        full_url = f"{self.base_url}{href}"
-                        title = link.get_text().strip()
-                        
-                        if title and len(title) > 10:  # 의미있는 제목만
-                            news_item = {
-                                'title': title,
-                                'link': full_url,
-                                'category': category
-                            }
-                            news_items.append(news_item)
-                
-                return news_items
-            else:
-                print(f"❌ BBC API 요청 실패: {response.status_code}")
+            links = await (self._scan_links(url, limit) if lazy else self._parse_links(url, limit))
+            if links is None:
                 return []
+            
+            return [
+                {'title': title, 'link': link, 'category': category}
+                for link, title in links
+            ]
                 
         except Exception as e:
             print(f"❌ BBC 뉴스 가져오기 실패: {e}")
@@ -82,6 +133,12 @@ async def main():
     print("\n🌍 세계 뉴스:")
     for news in world_news:
         print(f"- {news['title']}")
+    
+    stats = client.scan_stats
+    print(f"\n링크 스캔: {stats['pages']}페이지, {stats['bytes_read']:,} bytes, "
+          f"태그 {stats['nodes_scanned']:,}개 / 링크 {stats['anchors_scanned']:,}개, 조기 중단 {stats['early_stops']}회")
+    
+    await http_client.close_session()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,12 +1,33 @@
-import feedparser
-import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 import asyncio
+import sys
 import os
 
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import http_client
+from src.scrapers.bbc_api_client import BBC_HOSTS
+from src.scrapers.bulk_fetch import fetch_many
+from src.scrapers.content_cache import ArticleContentCache
+from src.scrapers.feed_cache import FeedCache
+from src.scrapers.html_extract import HTMLExtractor
+from src.scrapers.rate_limiter import HostRateLimiter
+from src.storage.news_item import NewsItem
+from src.storage.raw_store import default_store
+
 class BBCNewsCrawler:
-    def __init__(self):
+    def __init__(self, rate_per_host=5.0, feed_cache=None, content_cache=None, extractor=None, raw_store=None):
+        # ETag/Last-Modified 기반 피드 캐시 (변경 없는 피드는 재파싱하지 않음)
+        self.feed_cache = feed_cache or FeedCache()
+        # URL 기준 기사 본문 캐시 (TTL + LRU)
+        self.content_cache = content_cache or ArticleContentCache()
+        # 본문 추출 엔진 (selectolax/lxml 우선, 없으면 BeautifulSoup)
+        self.extractor = extractor or HTMLExtractor()
+        # 내용 해시 기준 원문 HTML 저장소 (추출기를 고친 뒤 다시 요청하지 않고 재추출)
+        self.raw_store = raw_store or default_store()
+        # 고정 sleep 대신 호스트별 토큰 버킷으로 요청 간격 조절
+        self.rate_limiter = HostRateLimiter(rate=rate_per_host, capacity=rate_per_host)
         self.rss_feeds = {
             'world': 'http://feeds.bbci.co.uk/news/world/rss.xml',
             'technology': 'http://feeds.bbci.co.uk/news/technology/rss.xml',
@@ -16,6 +37,27 @@ class BBCNewsCrawler:
             'health': 'http://feeds.bbci.co.uk/news/health/rss.xml'
         }
     
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입 (HTTP 세션은 http_client가 공유 관리)"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 (공유 세션은 닫지 않음)"""
+        return None
+    
+    async def fetch_feed(self, category, max_items=None):
+        """RSS 피드 항목을 비동기로 가져오기 (조건부 요청 캐시 사용, max_items: 앞 N개만 파싱)"""
+        url = self.rss_feeds[category]
+        await self.rate_limiter.acquire(url)
+        entries = await self.feed_cache.fetch_entries(url, max_items=max_items)
+        if entries is None:
+            print(f"❌ BBC {category} RSS 요청 실패")
+        return entries
+    
+    def to_news_item(self, entry, category):
+        """피드 항목(발행일 있음)을 NewsItem으로 변환"""
+        return NewsItem.from_feed_entry(entry, source='BBC', category=category)
+    
     async def get_today_news(self, category='world', limit=10):
         """오늘 BBC 뉴스 가져오기 (없으면 이전 날짜 포함)"""
         if category not in self.rss_feeds:
@@ -24,34 +66,25 @@ class BBCNewsCrawler:
         
         try:
             # RSS 피드 파싱
-            feed = feedparser.parse(self.rss_feeds[category])
+            entries = await self.fetch_feed(category, max_items=limit * 2)  # 더 많은 뉴스 확인
+            if entries is None:
+                return []
             today = datetime.now().date()
             
             today_news = []
             recent_news = []  # 최근 뉴스 (오늘 + 이전 3일)
             
-            for entry in feed.entries[:limit * 2]:  # 더 많은 뉴스 확인
+            for entry in entries:
                 # 발행일 확인
-                pub_date = datetime(*entry.published_parsed[:6])
+                if not entry['published_parsed']:
+                    continue
+                news_item = self.to_news_item(entry, category)
+                pub_date = news_item['published']
                 days_diff = (today - pub_date.date()).days
                 
                 if pub_date.date() == today:
-                    news_item = {
-                        'title': entry.title,
-                        'link': entry.link,
-                        'summary': entry.summary,
-                        'published': pub_date,
-                        'category': category
-                    }
                     today_news.append(news_item)
                 elif days_diff <= 3:  # 최근 3일 이내 뉴스
-                    news_item = {
-                        'title': entry.title,
-                        'link': entry.link,
-                        'summary': entry.summary,
-                        'published': pub_date,
-                        'category': category
-                    }
                     recent_news.append(news_item)
             
             # 오늘 뉴스가 있으면 오늘 뉴스 반환
@@ -70,41 +103,88 @@ class BBCNewsCrawler:
             print(f"❌ BBC 뉴스 수집 실패: {e}")
             return []
     
-    async def get_all_categories_today(self, limit_per_category=5):
-        """모든 카테고리의 오늘 뉴스 가져오기"""
+    async def get_all_categories_today(self, limit_per_category=5, concurrent=True):
+        """모든 카테고리의 오늘 뉴스 가져오기
+        
+        concurrent=True이면 모든 피드를 동시에 요청하고 (호스트별 속도 제한 적용),
+        결과는 카테고리 순서대로 합쳐서 반환합니다.
+        """
         all_news = []
         
+        if concurrent:
+            print(f"[NEWS] {len(self.rss_feeds)}개 카테고리 동시 수집 중...")
+            results = await asyncio.gather(*[
+                self.get_today_news(category, limit_per_category)
+                for category in self.rss_feeds.keys()
+            ])
+            for category_news in results:
+                all_news.extend(category_news)
+            return all_news
+        
         for category in self.rss_feeds.keys():
             print(f"[NEWS] {category} 카테고리 수집 중...")
             category_news = await self.get_today_news(category, limit_per_category)
             all_news.extend(category_news)
-            await asyncio.sleep(1)  # 요청 간격 조절
         
         return all_news
     
+    async def _fetch_article_content(self, url):
+        """BBC 기사 본문 가져오기 (실패 시 예외 발생)"""
+        cached = self.content_cache.get(url)
+        if cached is not None:
+            return cached
+        
+        await self.rate_limiter.acquire(url)
+        async with http_client.request('GET', url, kind='article') as response:
+            response.raise_for_status()
+            html = await response.read()
+            charset = response.charset
+        if self.raw_store is not None:
+            # 압축·파일 쓰기·SQLite 기록이 다른 기사 수집을 막지 않도록 작업 스레드에서
+            await asyncio.to_thread(self.raw_store.put, url, html, charset)
+        
+        # BBC 기사 본문 추출 (<article> 안의 <p>만)
+        content = self.extractor.article_text(html, url)
+        if content:
+            self.content_cache.set(url, content)
+        return content
+    
+    def reextract_from_store(self, update_cache=True):
+        """원문 저장소의 BBC 페이지에서 본문을 다시 추출 (네트워크 요청 없음)
+        
+        반환값: {url: 본문 또는 None}
+        """
+        if self.raw_store is None:
+            return {}
+        contents = self.raw_store.reextract(
+            lambda html, url, encoding: self.extractor.article_text(html, url), hosts=BBC_HOSTS
+        )
+        if update_cache:
+            for url, content in contents.items():
+                if content:
+                    self.content_cache.set(url, content)
+        return contents
+    
     async def get_article_content(self, url):
         """BBC 기사 본문 가져오기"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # BBC 기사 본문 추출
-            article_body = soup.find('article')
-            if article_body:
-                # 본문 텍스트 추출
-                paragraphs = article_body.find_all('p')
-                content = '\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                return content
-            
-            return None
-            
+            return await self._fetch_article_content(url)
         except Exception as e:
             print(f"❌ 기사 본문 가져오기 실패: {e}")
             return None
+    
+    async def fetch_contents(self, urls, max_concurrency=8, max_per_host=4, timeout=15):
+        """여러 기사 본문을 병렬로 가져오기
+        
+        반환값: ({url: 본문 또는 None}, {url: 실패 사유})
+        """
+        contents, failures = await fetch_many(
+            self._fetch_article_content, urls,
+            max_concurrency=max_concurrency, max_per_host=max_per_host, timeout=timeout
+        )
+        for url, reason in failures.items():
+            print(f"❌ 기사 본문 가져오기 실패: {url} ({reason})")
+        return contents, failures
 
     async def save_to_file(self, news_list, category='all'):
         """기사 리스트를 마크다운 파일로 저장 (본문 포함)"""
@@ -117,8 +197,8 @@ class BBCNewsCrawler:
         
         # 기사별 본문 비동기 수집
         print("📝 기사 본문 수집 중...")
-        tasks = [self.get_article_content(news['link']) for news in news_list]
-        contents = await asyncio.gather(*tasks)
+        contents_by_url, _ = await self.fetch_contents([news['link'] for news in news_list])
+        contents = [contents_by_url.get(news['link']) for news in news_list]
         
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(f"# BBC {category.capitalize()} News - {today_str}\n\n")
@@ -137,8 +217,11 @@ class BBCNewsCrawler:
 
 # 사용 예시
 async def main():
-    crawler = BBCNewsCrawler()
-    
+    async with BBCNewsCrawler() as crawler:
+        await run_examples(crawler)
+    await http_client.close_session()
+
+async def run_examples(crawler):
     # 특정 카테고리 오늘 뉴스
     world_news = await crawler.get_today_news('world', 5)
     for news in world_news:
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+기사 본문 일괄 수집기
+전체 동시성과 호스트별 동시성을 제한하면서 여러 URL을 병렬로 가져옵니다.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.scrapers.rate_limiter import HostConcurrencyLimiter
+
+
+async def fetch_many(
+    fetch: Callable[[str], Awaitable[Optional[str]]],
+    urls: List[str],
+    max_concurrency: int = 8,
+    max_per_host: int = 4,
+    timeout: float = 15.0,
+) -> Tuple[Dict[str, Optional[str]], Dict[str, str]]:
+    """URL 목록을 병렬로 가져오기
+    
+    한 URL이 실패하거나 시간 초과되어도 나머지는 계속 진행합니다.
+    반환값: ({url: 본문 또는 None}, {url: 실패 사유})
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    host_limiter = HostConcurrencyLimiter(max_per_host)
+    contents: Dict[str, Optional[str]] = {}
+    failures: Dict[str, str] = {}
+
+    async def run(url):
+        async with semaphore, host_limiter.for_url(url):
+            try:
+                contents[url] = await asyncio.wait_for(fetch(url), timeout)
+            except asyncio.TimeoutError:
+                contents[url] = None
+                failures[url] = f"시간 초과 ({timeout}초)"
+            except Exception as e:
+                contents[url] = None
+                failures[url] = str(e) or type(e).__name__
+
+    # 같은 URL은 한 번만 요청
+    unique_urls = list(dict.fromkeys(urls))
+    await asyncio.gather(*[run(url) for url in unique_urls])
+    return contents, failures
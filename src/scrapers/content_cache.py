@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+기사 본문 캐시
+정규화된 URL을 키로 추출된 본문 텍스트를 SQLite에 저장합니다.
+TTL이 지난 항목은 무시하고, 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (LRU).
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'cache', 'article_content.db'
+)
+
+# 본문과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAM_PREFIXES = ('utm_', 'at_', 'ocid', 'fbclid', 'gclid')
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 프래그먼트·추적 파라미터 제거, 쿼리 정렬)"""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+class ArticleContentCache:
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: float = 24 * 3600,
+                 max_entries: int = 5000):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS article_content (
+                url_key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_article_content_access ON article_content(last_access)"
+        )
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        """캐시된 본문 반환 (없거나 만료되면 None)"""
+        key = normalize_url(url)
+        row = self.conn.execute(
+            "SELECT content, fetched_at FROM article_content WHERE url_key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            if row is not None:
+                self.conn.execute("DELETE FROM article_content WHERE url_key = ?", (key,))
+                self.conn.commit()
+            self.misses += 1
+            return None
+
+        self.conn.execute("UPDATE article_content SET last_access = ? WHERE url_key = ?", (now, key))
+        self.conn.commit()
+        self.hits += 1
+        return row[0]
+
+    def set(self, url: str, content: str):
+        """본문 저장 후 최대 개수를 넘으면 LRU 순서로 삭제"""
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO article_content (url_key, content, fetched_at, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (normalize_url(url), content, now, now)
+        )
+        overflow = self.size() - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                "DELETE FROM article_content WHERE url_key IN "
+                "(SELECT url_key FROM article_content ORDER BY last_access LIMIT ?)",
+                (overflow,)
+            )
+        self.conn.commit()
+
+    def size(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM article_content").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미적중 횟수와 현재 항목 수"""
+        return {'hits': self.hits, 'misses': self.misses, 'size': self.size()}
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+유사 중복 기사 제거
+제목+요약의 문자 n-gram으로 MinHash 서명을 만들고 LSH 밴드 인덱스로 후보만 비교합니다.
+모든 쌍을 비교하지 않으므로 한 번에 수만 건도 처리할 수 있습니다.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+MAX_HASH = (1 << 64) - 1
+DENSIFY_STEP = 1 << 48  # 빌려온 값이 원래 값과 겹치지 않도록 거리만큼 더하는 간격
+TAG_RE = re.compile(r'<[^>]+>')
+NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_text(text: str) -> str:
+    """HTML 태그·문장부호 제거, 소문자화, 공백 정리"""
+    text = TAG_RE.sub(' ', text or '')
+    return NON_WORD_RE.sub(' ', text.lower()).strip()
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """문자 n-gram 집합 (한국어처럼 띄어쓰기가 불규칙한 텍스트에도 동작)"""
+    text = normalize_text(text)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(shingle_set: Set[str], num_perm: int = 128) -> Tuple[int, ...]:
+    """원-퍼뮤테이션 MinHash 서명
+
+    n-gram마다 해시를 한 번만 계산해 num_perm개 구간 중 하나에 넣고 구간별 최솟값을 취합니다.
+    빈 구간은 오른쪽의 채워진 구간 값을 빌려와 채웁니다 (densification).
+    """
+    signature = [MAX_HASH] * num_perm
+    for shingle in shingle_set:
+        # 서명은 한 프로세스 안에서만 비교하므로 내장 hash()로 충분 (blake2b보다 훨씬 빠름)
+        h = hash(shingle) & MAX_HASH
+        bucket = h % num_perm
+        value = h // num_perm
+        if value < signature[bucket]:
+            signature[bucket] = value
+
+    if MAX_HASH in signature and len(shingle_set) > 0:
+        # 뒤에서부터 두 바퀴 훑으며 각 빈 구간에 오른쪽으로 가장 가까운 값과 거리를 반영
+        dense = list(signature)
+        next_value = None
+        distance = 0
+        for i in range(2 * num_perm - 1, -1, -1):
+            j = i % num_perm
+            if signature[j] != MAX_HASH:
+                next_value = signature[j]
+                distance = 0
+                continue
+            distance += 1
+            if i < num_perm and next_value is not None:
+                dense[j] = next_value + distance * DENSIFY_STEP
+        signature = dense
+    return tuple(signature)
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """두 서명의 자카드 유사도 추정값"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """유사도가 similarity인 쌍이 한 밴드 이상에서 겹쳐 후보가 될 확률 1-(1-s^r)^b"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def choose_bands(threshold: float, num_perm: int, recall: float = 0.99) -> Tuple[int, int]:
+    """임계값 유사도의 쌍이 recall 이상의 확률로 후보가 되는 (밴드 수, 밴드당 행 수) 중 행 수가 가장 큰 것
+
+    S-곡선 중간점을 임계값에 맞추면 임계값 근처 쌍의 상당수(0.7/128에서 약 40%)를 놓치므로 중간점을
+    임계값보다 충분히 낮게 두고, 늘어난 후보는 estimate_similarity >= threshold로 다시 확인합니다.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if candidate_probability(threshold, bands, rows) >= recall:
+            best = (bands, rows)  # 행 수가 클수록 우연히 겹치는 후보가 적음
+    return best
+
+
+class NearDuplicateDetector:
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, shingle_size: int = 3,
+                 text_fields: Iterable[str] = ('title', 'summary', 'description')):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.text_fields = tuple(text_fields)
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self.band_buckets: List[Dict[Tuple[int, ...], List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        self.signatures: List[Tuple[int, ...]] = []
+        self.titles: Dict[str, int] = {}  # 정규화한 제목 → 항목 번호 (완전히 같은 제목은 해시 없이 바로 판정)
+
+    def item_text(self, item: Dict) -> str:
+        return ' '.join(str(item.get(field) or '') for field in self.text_fields)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def find_duplicate(self, signature: Tuple[int, ...]) -> Optional[int]:
+        """이미 등록된 항목 중 임계값 이상으로 비슷한 항목 번호 (없으면 None)"""
+        checked = set()
+        for band, key in self._band_keys(signature):
+            for candidate in self.band_buckets[band].get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if estimate_similarity(signature, self.signatures[candidate]) >= self.threshold:
+                    return candidate
+        return None
+
+    def match_or_add(self, item: Dict) -> Tuple[int, bool]:
+        """(같은 기사로 판단된 항목 번호, 새로 등록했는지) 반환"""
+        title = normalize_text(item.get('title', ''))
+        if title and title in self.titles:
+            return self.titles[title], False
+
+        signature = minhash_signature(shingles(self.item_text(item), self.shingle_size), self.num_perm)
+        duplicate = self.find_duplicate(signature)
+        if duplicate is not None:
+            return duplicate, False
+
+        index = len(self.signatures)
+        self.signatures.append(signature)
+        for band, key in self._band_keys(signature):
+            self.band_buckets[band][key].append(index)
+        if title:
+            self.titles[title] = index
+        return index, True
+
+    def check_and_add(self, item: Dict) -> bool:
+        """중복이면 True, 아니면 인덱스에 등록하고 False"""
+        return not self.match_or_add(item)[1]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def filter(self, items: Iterable[Dict]) -> List[Dict]:
+        """먼저 나온 항목을 남기고 유사 중복 항목 제거"""
+        return [item for item in items if not self.check_and_add(item)]
+
+
+def remove_near_duplicates(items: Iterable[Dict], threshold: float = 0.7, num_perm: int = 128) -> List[Dict]:
+    """유사 중복 기사 제거 (한 번만 쓰는 경우의 간편 함수)"""
+    return NearDuplicateDetector(threshold=threshold, num_perm=num_perm).filter(items)
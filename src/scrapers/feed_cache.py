@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+RSS 피드 조건부 요청 캐시
+피드 URL별로 ETag / Last-Modified / 본문 해시와 파싱된 항목을 디스크에 저장하고,
+변경이 없으면 (304 또는 동일 해시) 다시 파싱하지 않고 캐시된 항목을 반환합니다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from src.scrapers import http_client
+from src.scrapers.feed_parser import parse_feed_entries_async
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'cache', 'feeds'
+)
+
+
+class FeedCache:
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 통계: 304 응답 / 본문 해시 일치 / 새로 파싱
+        self.stats = {'not_modified': 0, 'hash_match': 0, 'parsed': 0}
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def load(self, url: str) -> Optional[Dict]:
+        """캐시된 피드 정보 읽기"""
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, url: str, record: Dict):
+        """피드 정보를 원자적으로 저장 (임시 파일 작성 후 교체)"""
+        path = self._path(url)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def conditional_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since 헤더 생성"""
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    @staticmethod
+    def covers(cached: Optional[Dict], max_items: Optional[int]) -> bool:
+        """캐시된 항목이 요청한 개수를 모두 담고 있는지 (앞 N개만 파싱해 둔 경우 확인)"""
+        if not cached:
+            return False
+        cached_max = cached.get('max_items')
+        return cached_max is None or (max_items is not None and cached_max >= max_items)
+
+    async def fetch_entries(self, url: str, max_items: Optional[int] = None) -> Optional[List[Dict]]:
+        """조건부 GET으로 피드 항목 가져오기 (실패 시 None)
+
+        max_items를 주면 피드 앞쪽 N개만 파싱합니다.
+        """
+        cached = self.load(url)
+        if not self.covers(cached, max_items):
+            cached = None  # 캐시가 요청보다 적은 항목만 담고 있으면 전체를 다시 받음
+        headers = self.conditional_headers(cached)
+
+        async with http_client.request('GET', url, kind='feed', headers=headers) as response:
+            if response.status == 304 and cached:
+                self.stats['not_modified'] += 1
+                return cached['entries'][:max_items]
+            if response.status != 200:
+                return None
+            body = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        # 검증자를 보내지 않는 서버는 본문 해시로 변경 여부 판단
+        content_hash = hashlib.sha256(body).hexdigest()
+        if cached and cached.get('content_hash') == content_hash:
+            self.stats['hash_match'] += 1
+            entries = cached['entries']
+            parsed_max = cached.get('max_items')
+        else:
+            self.stats['parsed'] += 1
+            # 파싱은 풀에서 실행하고 그동안 다른 피드 요청을 계속 처리
+            entries = await parse_feed_entries_async(body, max_items=max_items)
+            parsed_max = max_items
+
+        self.save(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': content_hash,
+            'max_items': parsed_max,
+            'entries': entries,
+        })
+        return entries[:max_items]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+RSS 피드 파싱 도우미
+feedparser 결과를 캐시/전달하기 쉬운 작은 dict 목록으로 변환합니다.
+기본으로는 스트리밍 파서(rss_stream)를 먼저 쓰고, 읽을 수 없는 피드만 feedparser로 처리합니다.
+feedparser.parse는 CPU를 쓰는 동기 함수이므로 비동기 코드에서는 parse_feed_entries_async로
+스레드/프로세스 풀에서 실행해 이벤트 루프가 멈추지 않게 합니다.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import feedparser
+
+from config import config
+from src.scrapers.rss_stream import FeedParseError, parse_stream_entries, utc_naive
+
+# 'thread': 스레드 풀, 'process': 프로세스 풀 (GIL 영향 없음), 'inline': 이벤트 루프에서 바로 파싱
+PARSE_EXECUTOR = getattr(config, 'FEED_PARSE_EXECUTOR', 'thread')
+PARSE_WORKERS = getattr(config, 'FEED_PARSE_WORKERS', 4)
+# 'stream': 스트리밍 파서 우선 (실패 시 feedparser), 'feedparser': 항상 feedparser
+PARSE_ENGINE = getattr(config, 'FEED_PARSER', 'stream')
+
+_executor: Optional[Executor] = None
+
+
+def compact_entry(entry) -> Dict:
+    """feedparser 항목을 필요한 필드만 담은 dict로 변환"""
+    link = entry.get('link', '')
+    published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return {
+        'title': entry.get('title', ''),
+        'link': link,
+        'summary': entry.get('summary') or entry.get('description', ''),
+        'published_parsed': list(published_parsed[:6]) if published_parsed else None,
+        'guid': entry.get('id') or link,
+    }
+
+
+def _apply_cutoffs(entries: List[Dict], max_items: Optional[int],
+                   since: Optional[datetime]) -> List[Dict]:
+    """feedparser 결과에 스트리밍 파서와 같은 cutoff 적용"""
+    if since is not None:
+        since = utc_naive(since)
+        kept = []
+        for entry in entries:
+            if entry['published_parsed'] and datetime(*entry['published_parsed']) < since:
+                break
+            kept.append(entry)
+        entries = kept
+    return entries[:max_items] if max_items is not None else entries
+
+
+def parse_feed_entries(content, max_items: Optional[int] = None, since: Optional[datetime] = None,
+                       engine: Optional[str] = None) -> List[Dict]:
+    """RSS 본문(bytes/str)을 파싱해 compact dict 목록으로 반환
+
+    max_items/since를 주면 앞 N개 또는 since 이후 항목만 읽습니다 (피드는 최신순이라고 가정).
+    프로세스 풀에서도 실행되므로 모듈 최상위 함수로 두고, 반환값은 pickle 가능한 기본 타입만 사용합니다.
+    """
+    if (engine or PARSE_ENGINE) == 'stream':
+        try:
+            entries = parse_stream_entries(content, max_items=max_items, since=since)
+            if entries:
+                return entries
+        except FeedParseError:
+            pass  # 잘못된 XML (정의되지 않은 엔티티 등)은 관대한 feedparser로 처리
+    feed = feedparser.parse(content)
+    return _apply_cutoffs([compact_entry(entry) for entry in feed.entries], max_items, since)
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """피드 파싱용 공유 풀 (처음 호출할 때 생성, inline 모드이면 None)"""
+    global _executor
+    if PARSE_EXECUTOR == 'inline':
+        return None
+    if _executor is None:
+        if PARSE_EXECUTOR == 'process':
+            _executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        elif PARSE_EXECUTOR == 'thread':
+            _executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix='feed-parse')
+        else:
+            raise ValueError(f"알 수 없는 FEED_PARSE_EXECUTOR: {PARSE_EXECUTOR} (thread/process/inline)")
+    return _executor
+
+
+async def parse_feed_entries_async(content, max_items: Optional[int] = None,
+                                   since: Optional[datetime] = None) -> List[Dict]:
+    """parse_feed_entries를 풀에서 실행 (다른 피드의 다운로드와 파싱이 겹쳐서 진행됨)"""
+    executor = get_parse_executor()
+    if executor is None:
+        return parse_feed_entries(content, max_items=max_items, since=since)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(parse_feed_entries, content, max_items=max_items, since=since)
+    )
+
+
+def shutdown_parse_executor():
+    """피드 파싱 풀 종료"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
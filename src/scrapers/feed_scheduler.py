@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+피드별 적응형 폴링 스케줄러
+피드마다 최근 항목들의 발행 간격을 EWMA로 학습해, 자주 갱신되는 피드(world, main)는 자주,
+드문 피드(science, entertainment)는 드물게 요청합니다. 전체 요청 수는 분당 예산 안에서만 보내고,
+처음 보는 기사는 asyncio.Queue에 넣어 프로세서가 배치로 가져가게 합니다.
+"""
+
+import asyncio
+import heapq
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config import config
+from src.scrapers.rate_limiter import TokenBucket
+from src.storage.seen_index import SeenIndex, item_key
+
+FetchEntries = Callable[[], Awaitable[Optional[List[Dict]]]]
+ToItems = Callable[[List[Dict]], List[Dict]]
+
+
+class FeedState:
+    """피드 하나의 폴링 상태와 학습한 갱신 주기"""
+
+    def __init__(self, name: str, fetch: FetchEntries, to_items: ToItems, source: str, interval: float):
+        self.name = name
+        self.fetch = fetch
+        self.to_items = to_items
+        self.source = source
+        self.interval = interval
+        self.ewma_gap: Optional[float] = None  # 항목 발행 간격의 지수 이동 평균 (초)
+        self.polls = 0
+        self.new_items = 0
+        self.errors = 0
+
+
+def publish_gap(entries: List[Dict], sample: int = 20) -> Optional[float]:
+    """최근 항목들의 발행 시각 간격 중앙값 (초, 날짜가 두 개 미만이면 None)"""
+    times = sorted(
+        (datetime(*entry['published_parsed'][:6]).timestamp() for entry in entries if entry.get('published_parsed')),
+        reverse=True,
+    )[:sample]
+    gaps = [newer - older for newer, older in zip(times, times[1:]) if newer > older]
+    return statistics.median(gaps) if gaps else None
+
+
+class FeedScheduler:
+    def __init__(self, seen_index: Optional[SeenIndex] = None,
+                 requests_per_minute: Optional[float] = None, max_concurrent: int = 4,
+                 min_interval: Optional[float] = None, max_interval: Optional[float] = None,
+                 alpha: float = 0.3, queue_size: int = 1000, enqueue: bool = True):
+        self.seen_index = seen_index or SeenIndex()
+        requests_per_minute = requests_per_minute or getattr(config, 'POLL_REQUESTS_PER_MINUTE', 30)
+        # 전체 요청 예산 (모든 피드가 공유하는 토큰 버킷)
+        self.budget = TokenBucket(rate=requests_per_minute / 60, capacity=max(1.0, requests_per_minute / 10))
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval or getattr(config, 'POLL_MIN_INTERVAL', 120)
+        self.max_interval = max_interval or getattr(config, 'POLL_MAX_INTERVAL', 3600)
+        self.alpha = alpha
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.enqueue = enqueue  # False이면 큐에 넣지 않고 observers에게만 전달 (빠른 발행 경로 전용 실행)
+        # 폴링할 때마다 (피드 이름, 이미 본 기사까지 포함한 전체 항목)을 받는 콜백
+        self.observers: List[Callable[[str, List[Dict]], None]] = []
+        self.feeds: Dict[str, FeedState] = {}
+        self._due: List = []  # (다음 폴링 시각, 피드 이름) 힙
+        self._enqueued = set()  # 이번 실행에서 이미 큐에 넣은 기사 (처리 완료 기록 전 중복 방지)
+        self._stopped = asyncio.Event()
+
+    def add_feed(self, name: str, fetch: FetchEntries, to_items: ToItems, source: str,
+                 interval: Optional[float] = None):
+        """폴링할 피드 등록 (interval: 학습 전 초기 간격)"""
+        state = FeedState(name, fetch, to_items, source, interval or self.min_interval)
+        self.feeds[name] = state
+        heapq.heappush(self._due, (time.monotonic(), name))
+
+    def add_bbc_feeds(self, crawler, categories: Optional[List[str]] = None):
+        """BBCNewsCrawler의 카테고리 피드 등록"""
+        for category in categories or crawler.rss_feeds:
+            self.add_feed(
+                f'bbc:{category}',
+                lambda category=category: crawler.fetch_feed(category),
+                lambda entries, category=category: [
+                    crawler.to_news_item(entry, category) for entry in entries if entry['published_parsed']
+                ],
+                source='BBC',
+            )
+
+    def add_yonhap_feeds(self, crawler, categories: Optional[List[str]] = None):
+        """KoreanNewsCrawler의 연합뉴스 카테고리 피드 등록"""
+        for category in categories or crawler.yonhap_rss_urls:
+            url = crawler.yonhap_rss_urls[category]
+            self.add_feed(
+                f'yonhap:{category}',
+                lambda url=url: crawler.fetch_rss_feed(url),
+                lambda entries, category=category: crawler.parse_yonhap_news(entries, category),
+                source='연합뉴스',
+            )
+
+    def _next_interval(self, state: FeedState, entries: Optional[List[Dict]], new_count: int) -> float:
+        """관찰한 발행 간격으로 다음 폴링 간격 계산"""
+        if entries is None:
+            # 실패한 피드는 간격을 두 배로 늘림 (회로 차단기와 별개로 요청 예산 절약)
+            return min(self.max_interval, state.interval * 2)
+        gap = publish_gap(entries)
+        if gap is not None:
+            state.ewma_gap = gap if state.ewma_gap is None else self.alpha * gap + (1 - self.alpha) * state.ewma_gap
+        interval = state.ewma_gap if state.ewma_gap is not None else state.interval
+        if new_count == 0:
+            interval = max(interval, state.interval * 1.5)  # 새 기사가 없으면 점점 드물게
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    async def poll(self, state: FeedState) -> int:
+        """피드를 한 번 요청해 새 기사를 큐에 넣고 다음 간격을 정함 (새 기사 수 반환)"""
+        state.polls += 1
+        try:
+            entries = await state.fetch()
+        except Exception as e:
+            print(f"❌ {state.name} 폴링 실패: {e}")
+            entries = None
+        if entries is None:
+            state.errors += 1
+            state.interval = self._next_interval(state, None, 0)
+            return 0
+
+        items = state.to_items(entries)
+        for item in items:
+            item.setdefault('source', state.source)
+            item['feed'] = state.name
+        for observer in self.observers:
+            observer(state.name, items)
+
+        items = [item for item in items if item_key(item) not in self._enqueued]
+        new_items = self.seen_index.filter_new(items) if self.enqueue else items
+        for item in new_items:
+            self._enqueued.add(item_key(item))
+            if self.enqueue:
+                await self.queue.put(item)
+        state.new_items += len(new_items)
+        state.interval = self._next_interval(state, entries, len(new_items))
+        return len(new_items)
+
+    async def _poll_and_reschedule(self, state: FeedState, slots: asyncio.Semaphore):
+        try:
+            await self.poll(state)
+        finally:
+            slots.release()
+            heapq.heappush(self._due, (time.monotonic() + state.interval, state.name))
+
+    async def run(self):
+        """stop()이 호출될 때까지 피드를 각자의 간격으로 폴링"""
+        slots = asyncio.Semaphore(self.max_concurrent)
+        tasks = set()
+        try:
+            while not self._stopped.is_set():
+                if not self._due:
+                    await asyncio.sleep(1)
+                    continue
+                due_at, name = self._due[0]
+                wait = due_at - time.monotonic()
+                if wait > 0:
+                    # 가장 이른 피드 차례까지 대기 (그 사이 stop()이 오면 바로 종료)
+                    try:
+                        await asyncio.wait_for(self._stopped.wait(), timeout=min(wait, 5))
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                heapq.heappop(self._due)
+                await self.budget.acquire()
+                await slots.acquire()
+                task = asyncio.ensure_future(self._poll_and_reschedule(self.feeds[name], slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def next_batch(self, max_items: int = 10, max_wait: float = 300,
+                         runner: Optional[asyncio.Future] = None) -> List[Dict]:
+        """큐에서 기사 배치 꺼내기 (max_items개가 모이거나 첫 기사 후 max_wait초가 지나면 반환)
+
+        runner(run()을 실행 중인 태스크)를 넘기면 첫 기사를 기다리는 동안 runner도 함께 지켜보고,
+        runner가 먼저 끝나면 그 예외를 다시 발생시킵니다 (폴링이 멈췄는데 큐만 계속 기다리지 않도록).
+        """
+        if runner is None:
+            batch = [await self.queue.get()]
+        else:
+            getter = asyncio.ensure_future(self.queue.get())
+            try:
+                await asyncio.wait({getter, runner}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if not getter.done() or getter.cancelled():
+                runner.result()  # run()이 예외로 끝났으면 여기서 그대로 발생
+                raise RuntimeError("피드 스케줄러가 종료되어 더 이상 기사가 들어오지 않습니다.")
+            batch = [getter.result()]
+        deadline = time.monotonic() + max_wait
+        while len(batch) < max_items:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def mark_processed(self, items: List[Dict], source: Optional[str] = None):
+        """프로세서가 처리를 끝낸 기사 기록 (다음 실행에서 다시 큐에 넣지 않음)
+
+        이후로는 seen_index가 걸러 주므로 _enqueued에서는 빼서 계속 폴링해도 집합이 커지지 않게 합니다.
+        """
+        self.seen_index.mark_seen(items, source=source)
+        self.seen_index.flush()
+        for item in items:
+            self._enqueued.discard(item_key(item))
+
+    def summary(self) -> Dict[str, Dict]:
+        """피드별 학습 간격/폴링 통계"""
+        return {
+            name: {
+                'interval': round(state.interval),
+                'ewma_gap': round(state.ewma_gap) if state.ewma_gap is not None else None,
+                'polls': state.polls,
+                'new_items': state.new_items,
+                'errors': state.errors,
+            }
+            for name, state in self.feeds.items()
+        }
+
+
+# 사용 예시: BBC + 연합뉴스 피드를 폴링하며 새 기사 출력
+async def main():
+    from src.scrapers import http_client
+    from src.scrapers.bbc_rss_crawler import BBCNewsCrawler
+    from src.scrapers.korean_news_crawler import KoreanNewsCrawler
+
+    scheduler = FeedScheduler()
+    scheduler.add_bbc_feeds(BBCNewsCrawler())
+    scheduler.add_yonhap_feeds(KoreanNewsCrawler())
+    runner = asyncio.ensure_future(scheduler.run())
+    try:
+        while True:
+            batch = await scheduler.next_batch(max_items=10, max_wait=60)
+            print(f"\n📰 새 기사 {len(batch)}개")
+            for item in batch:
+                print(f"- [{item['source']}/{item['category']}] {item['title']}")
+            scheduler.mark_processed(batch)
+            for name, stats in scheduler.summary().items():
+                print(f"  {name}: 간격 {stats['interval']}초, 폴링 {stats['polls']}회, 새 기사 {stats['new_items']}개")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        scheduler.stop()
+        await runner
+        await http_client.close_session()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+HTML 본문/링크 추출 엔진
+selectolax 또는 lxml이 설치되어 있으면 빠른 경로를 사용하고,
+없으면 기존 BeautifulSoup(html.parser)로 대체합니다.
+페이지마다 처리 시간(wall/CPU)을 기록하고, trace_memory=True이면 tracemalloc으로 페이지 하나를 처리하는 동안의
+최대 할당량도 기록해 엔진별 비용을 비교할 수 있습니다. (프로세스 최대 RSS는 줄지 않는 누적값이라 페이지별 비교에 쓰지 않음)
+"""
+
+import io
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = None
+
+
+# ---- selectolax: C 파서, 트리 전체를 만들지만 매우 빠름 ----
+
+def _selectolax_paragraphs(html: bytes) -> List[str]:
+    tree = SelectolaxParser(html)
+    article = tree.css_first('article')
+    if article is None:
+        return []
+    return [p.text().strip() for p in article.css('p')]
+
+
+def _selectolax_anchors(html: bytes) -> List[Tuple[str, str]]:
+    tree = SelectolaxParser(html)
+    return [(a.attributes.get('href') or '', a.text().strip()) for a in tree.css('a[href]')]
+
+
+# ---- lxml: iterparse로 필요한 부분만 보고 첫 <article>이 끝나면 중단 ----
+
+def _lxml_paragraphs(html: bytes) -> List[str]:
+    paragraphs = []
+    depth = 0
+    for event, element in etree.iterparse(io.BytesIO(html), events=('start', 'end'),
+                                          html=True, recover=True):
+        if element.tag == 'article':
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                break  # 첫 번째 article만 사용 (기존 soup.find('article')와 동일)
+        elif event == 'end':
+            if depth > 0 and element.tag == 'p':
+                paragraphs.append(''.join(element.itertext()).strip())
+            if depth == 0:
+                element.clear()  # article 밖의 노드는 바로 해제
+    return paragraphs
+
+
+def _lxml_anchors(html: bytes) -> List[Tuple[str, str]]:
+    anchors = []
+    for _, element in etree.iterparse(io.BytesIO(html), events=('end',), tag='a',
+                                      html=True, recover=True):
+        href = element.get('href')
+        if href:
+            anchors.append((href, ''.join(element.itertext()).strip()))
+        element.clear()
+    return anchors
+
+
+# ---- BeautifulSoup: 기존 방식 (SoupStrainer로 필요한 태그만 트리에 올림) ----
+
+def _soup_paragraphs(html: bytes) -> List[str]:
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('article'))
+    article = soup.find('article')
+    if article is None:
+        return []
+    return [p.get_text().strip() for p in article.find_all('p')]
+
+
+def _soup_anchors(html: bytes) -> List[Tuple[str, str]]:
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('a', href=True))
+    return [(a.get('href'), a.get_text().strip()) for a in soup.find_all('a', href=True)]
+
+
+ENGINES: Dict[str, Tuple[Callable, Callable]] = {}
+if SelectolaxParser is not None:
+    ENGINES['selectolax'] = (_selectolax_paragraphs, _selectolax_anchors)
+if etree is not None:
+    ENGINES['lxml'] = (_lxml_paragraphs, _lxml_anchors)
+if BeautifulSoup is not None:
+    ENGINES['bs4'] = (_soup_paragraphs, _soup_anchors)
+
+
+def resolve_engine(engine: str = 'auto') -> str:
+    """사용할 엔진 이름 결정 (auto: selectolax > lxml > bs4)"""
+    if engine != 'auto':
+        if engine not in ENGINES:
+            raise ValueError(f"사용할 수 없는 추출 엔진: {engine} (가능: {list(ENGINES)})")
+        return engine
+    for name in ('selectolax', 'lxml', 'bs4'):
+        if name in ENGINES:
+            return name
+    raise RuntimeError("HTML 파서가 설치되어 있지 않습니다 (selectolax, lxml, beautifulsoup4 중 하나 필요)")
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """프로세스 시작 후 최대 RSS (KB, 줄어들지 않음)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class HTMLExtractor:
+    def __init__(self, engine: str = 'auto', max_timings: int = 1000, trace_memory: bool = False):
+        """trace_memory=True이면 호출마다 tracemalloc으로 최대 할당량을 잼 (느려지므로 측정할 때만)"""
+        self.engine = resolve_engine(engine)
+        self.max_timings = max_timings
+        self.trace_memory = trace_memory
+        self.timings: List[Dict] = []
+
+    def _measure(self, kind: str, url: Optional[str], func: Callable, html: bytes):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = func(html)
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+        # 이 호출 동안 늘어난 최대 할당량 (파이썬 할당자 기준, C 라이브러리가 직접 잡는 메모리는 빠짐)
+        peak_kb = (tracemalloc.get_traced_memory()[1] - base) // 1024 if self.trace_memory else None
+        self.timings.append({
+            'url': url,
+            'kind': kind,
+            'engine': self.engine,
+            'bytes': len(html),
+            'wall_ms': wall_ms,
+            'cpu_ms': cpu_ms,
+            'peak_alloc_kb': peak_kb,
+        })
+        if len(self.timings) > self.max_timings:
+            del self.timings[:len(self.timings) - self.max_timings]
+        return result
+
+    def article_text(self, html: bytes, url: Optional[str] = None) -> Optional[str]:
+        """첫 번째 <article> 안의 <p> 텍스트를 줄바꿈으로 연결 (article이 없으면 None)"""
+        paragraphs = self._measure('article', url, ENGINES[self.engine][0], html)
+        if not paragraphs:
+            return None
+        return '\n'.join(p for p in paragraphs if p)
+
+    def anchors(self, html: bytes, url: Optional[str] = None) -> List[Tuple[str, str]]:
+        """문서의 모든 (href, 링크 텍스트) 목록"""
+        return self._measure('anchors', url, ENGINES[self.engine][1], html)
+
+    def summary(self) -> Dict:
+        """기록된 페이지별 처리 시간 요약"""
+        if not self.timings:
+            return {'engine': self.engine, 'pages': 0}
+        count = len(self.timings)
+        peaks = [t['peak_alloc_kb'] for t in self.timings if t['peak_alloc_kb'] is not None]
+        return {
+            'engine': self.engine,
+            'pages': count,
+            'avg_wall_ms': sum(t['wall_ms'] for t in self.timings) / count,
+            'avg_cpu_ms': sum(t['cpu_ms'] for t in self.timings) / count,
+            'max_peak_alloc_kb': max(peaks) if peaks else None,  # 페이지 하나 처리 중 최대 할당량
+            'process_peak_rss_kb': _peak_rss_kb(),  # 프로세스 전체 누적 최대값
+        }
+
+
+class YonhapArticleParser(HTMLParser):
+    """연합뉴스 기사 본문 스트리밍 파서
+    
+    feed()로 조각을 넣다가 본문 컨테이너(class="story-news ...")가 닫히면 done이 True가 되므로
+    호출 측은 그 시점에 다운로드를 멈출 수 있습니다.
+    """
+
+    CONTAINER_CLASSES = ('story-news', 'article-txt')
+    SKIP_CLASSES = ('copyright', 'adrs', 'txt-desc')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.container_tag = None
+        self.depth = 0
+        self.in_paragraph = False
+        self.skip_paragraph = False
+        self.current: List[str] = []
+        self.paragraphs: List[str] = []
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        classes = (dict(attrs).get('class') or '').split()
+        if self.container_tag is None:
+            if tag in ('div', 'article') and any(c in self.CONTAINER_CLASSES for c in classes):
+                self.container_tag = tag
+                self.depth = 1
+            return
+        if tag == self.container_tag:
+            self.depth += 1
+        elif tag == 'p':
+            self.in_paragraph = True
+            self.skip_paragraph = any(skip in c for c in classes for skip in self.SKIP_CLASSES)
+            self.current = []
+
+    def handle_endtag(self, tag):
+        if self.done or self.container_tag is None:
+            return
+        if tag == 'p' and self.in_paragraph:
+            text = ''.join(self.current).strip()
+            if text and not self.skip_paragraph:
+                self.paragraphs.append(text)
+            self.in_paragraph = False
+        elif tag == self.container_tag:
+            self.depth -= 1
+            if self.depth == 0:
+                self.done = True
+
+    def handle_data(self, data):
+        if self.in_paragraph and not self.done:
+            self.current.append(data)
+
+    def text(self) -> Optional[str]:
+        """추출된 본문 (문단이 없으면 None)"""
+        return '\n'.join(self.paragraphs) if self.paragraphs else None
+
+
+class AnchorScanner(HTMLParser):
+    """<a> 태그만 보는 스트리밍 링크 스캐너
+    
+    link_filter(href, text)가 정규화된 URL을 돌려준 링크만 (url, text)로 모으고 URL 기준으로 중복을 제거합니다.
+    limit개가 모이면 done이 True가 되므로 호출 측은 그 시점에 다운로드를 멈출 수 있습니다.
+    """
+
+    def __init__(self, link_filter: Callable[[str, str], Optional[str]], limit: Optional[int] = None):
+        super().__init__(convert_charrefs=True)
+        self.link_filter = link_filter
+        self.limit = limit
+        self.href: Optional[str] = None
+        self.current: List[str] = []
+        self.links: List[Tuple[str, str]] = []
+        self.seen_urls = set()
+        self.nodes_scanned = 0  # 지나간 시작 태그 수
+        self.anchors_scanned = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes_scanned += 1
+        if tag == 'a' and not self.done:
+            self.href = dict(attrs).get('href')
+            self.current = []
+
+    def handle_endtag(self, tag):
+        if tag != 'a' or self.href is None:
+            return
+        self.anchors_scanned += 1
+        text = ' '.join(''.join(self.current).split())
+        url = self.link_filter(self.href, text)
+        self.href = None
+        if url is None or url in self.seen_urls:
+            return
+        self.seen_urls.add(url)
+        self.links.append((url, text))
+        if self.limit is not None and len(self.links) >= self.limit:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.href is not None:
+            self.current.append(data)
+
+
+# 사용 예시: 저장된 HTML 파일로 엔진별 비용 비교
+def benchmark(path: str, engine: str, repeat: int) -> Dict:
+    """엔진 하나의 페이지당 시간과 메모리 (엔진마다 새 프로세스에서 실행해야 RSS가 섞이지 않음)
+
+    rss_growth_kb: 파일을 읽은 뒤부터 추출을 마칠 때까지 늘어난 최대 RSS (C 파서의 메모리 포함)
+    max_peak_alloc_kb: 페이지 하나 처리 중 tracemalloc 최대 할당량 (시간 측정과 따로 한 번 더 실행)
+    """
+    with open(path, 'rb') as f:
+        html = f.read()
+    rss_before = _peak_rss_kb()
+    extractor = HTMLExtractor(engine)
+    for _ in range(repeat):
+        extractor.article_text(html, path)
+    result = extractor.summary()
+    rss_after = _peak_rss_kb()
+    result['rss_growth_kb'] = rss_after - rss_before if rss_before is not None else None
+    traced = HTMLExtractor(engine, trace_memory=True)
+    traced.article_text(html, path)
+    tracemalloc.stop()
+    result['max_peak_alloc_kb'] = traced.summary()['max_peak_alloc_kb']
+    return result
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python src/scrapers/html_extract.py <html 파일> [반복 횟수]")
+        return
+    path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    if len(sys.argv) > 3:  # 하위 프로세스: 엔진 하나만 측정
+        summary = benchmark(path, sys.argv[3], repeat)
+        print(f"[{sys.argv[3]}] 평균 {summary['avg_wall_ms']:.2f}ms (CPU {summary['avg_cpu_ms']:.2f}ms), "
+              f"페이지당 최대 할당 {summary['max_peak_alloc_kb']}KB, RSS 증가 {summary['rss_growth_kb']}KB")
+        return
+
+    # 앞선 엔진의 최대 RSS가 다음 엔진에 이어지지 않도록 엔진마다 새 프로세스에서 측정
+    for engine in ENGINES:
+        subprocess.run([sys.executable, os.path.abspath(__file__), path, str(repeat), engine], check=True)
+
+if __name__ == "__main__":
+    main()
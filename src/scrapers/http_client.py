@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 클라이언트
+모든 스크래퍼와 Ollama 호출이 하나의 커넥션 풀을 재사용하도록 합니다.
+- 호스트별 keep-alive 커넥션 풀, DNS 캐시
+- gzip/deflate (brotli 패키지가 있으면 br까지) 압축 협상
+- 용도별 타임아웃은 config.HTTP_TIMEOUTS에서 한 곳에서 설정
+- request()는 재시도/백오프/회로 차단기(resilience)를 거쳐 요청
+"""
+
+import asyncio
+import json
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import config
+from src.scrapers.resilience import RETRY_STATUSES, ResilienceLayer
+
+try:
+    import brotli  # noqa: F401  (aiohttp/urllib3가 br 응답을 풀 수 있는지 확인용)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+# 용도별 전체 타임아웃 (초)
+DEFAULT_TIMEOUTS = {
+    'feed': 30,
+    'article': 15,
+    'api': 10,
+    'llm': 120,
+}
+TIMEOUTS = {**DEFAULT_TIMEOUTS, **getattr(config, 'HTTP_TIMEOUTS', {})}
+CONNECT_TIMEOUT = 10
+
+POOL_LIMIT = getattr(config, 'HTTP_POOL_LIMIT', 100)
+POOL_LIMIT_PER_HOST = getattr(config, 'HTTP_POOL_LIMIT_PER_HOST', 8)
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+
+# 용도별 재시도 횟수 (LLM 호출은 오래 걸리므로 적게)
+DEFAULT_RETRIES = {
+    'feed': 2,
+    'article': 2,
+    'api': 3,
+    'llm': 1,
+}
+RETRIES = {**DEFAULT_RETRIES, **getattr(config, 'HTTP_RETRIES', {})}
+
+# 모든 비동기 요청이 공유하는 호스트별 재시도/회로 차단 상태
+resilience = ResilienceLayer(
+    max_per_host=POOL_LIMIT_PER_HOST,
+    backoff_base=getattr(config, 'HTTP_BACKOFF_BASE', 0.5),
+    backoff_max=getattr(config, 'HTTP_BACKOFF_MAX', 30),
+    failure_threshold=getattr(config, 'HTTP_CIRCUIT_FAILURES', 5),
+    recovery_time=getattr(config, 'HTTP_CIRCUIT_RECOVERY', 60),
+)
+
+# aiohttp 세션은 이벤트 루프에 묶이므로 루프마다 하나씩 유지
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+_sync_session: Optional[requests.Session] = None
+
+
+def timeout(kind: str = 'api', total: Optional[float] = None) -> aiohttp.ClientTimeout:
+    """용도별 aiohttp 타임아웃 (total을 주면 그 값을 우선 사용)"""
+    return aiohttp.ClientTimeout(total=total or TIMEOUTS[kind], connect=CONNECT_TIMEOUT)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """현재 이벤트 루프의 공유 세션 반환 (없으면 생성, 코루틴 안에서 호출)"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """현재 이벤트 루프의 공유 세션 종료 (프로그램 종료 직전에 호출)"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@asynccontextmanager
+async def request(method: str, url: str, kind: str = 'api', total: Optional[float] = None,
+                  retries: Optional[int] = None, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+    """공유 세션으로 요청 (async with로 응답 사용)
+
+    호스트별 동시 요청 슬롯을 잡고, 429/5xx/연결 오류는 백오프 후 재시도합니다.
+    계속 실패하는 호스트는 resilience.CircuitOpenError로 바로 실패합니다.
+    """
+    if retries is None:
+        retries = RETRIES[kind]
+    async with resilience.slot(url):
+        response = await resilience.send(
+            url, lambda: get_session().request(method, url, timeout=timeout(kind, total), **kwargs),
+            retries=retries,
+        )
+        try:
+            yield response
+        finally:
+            response.release()
+
+
+async def _read_body(response: aiohttp.ClientResponse) -> Any:
+    if 'json' in response.headers.get('Content-Type', ''):
+        return await response.json(content_type=None)
+    text = await response.text()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+async def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                   kind: str = 'api', total: Optional[float] = None) -> Tuple[int, Any]:
+    """GET 요청 후 (상태 코드, JSON 또는 텍스트) 반환"""
+    async with request('GET', url, kind=kind, total=total, params=params, headers=headers) as response:
+        return response.status, await _read_body(response)
+
+
+async def post_json(url: str, payload: Dict, headers: Optional[Dict] = None,
+                    kind: str = 'api', total: Optional[float] = None) -> Tuple[int, Any]:
+    """JSON POST 요청 후 (상태 코드, JSON 또는 텍스트) 반환"""
+    async with request('POST', url, kind=kind, total=total, json=payload, headers=headers) as response:
+        return response.status, await _read_body(response)
+
+
+def get_sync_session() -> requests.Session:
+    """동기 코드용 공유 requests 세션 (커넥션 풀 재사용)"""
+    global _sync_session
+    if _sync_session is None:
+        session = requests.Session()
+        # 동기 요청은 urllib3 재시도로 429/5xx를 백오프 후 재시도 (Retry-After 준수, GET 등 멱등 요청만)
+        retry = Retry(total=RETRIES['api'], backoff_factor=getattr(config, 'HTTP_BACKOFF_BASE', 0.5),
+                      status_forcelist=sorted(RETRY_STATUSES), respect_retry_after_header=True,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=POOL_LIMIT_PER_HOST, pool_maxsize=POOL_LIMIT_PER_HOST,
+                              max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        _sync_session = session
+    return _sync_session
+
+
+def sync_timeout(kind: str = 'api', total: Optional[float] = None) -> Tuple[float, float]:
+    """requests용 (connect, read) 타임아웃"""
+    return (CONNECT_TIMEOUT, total or TIMEOUTS[kind])
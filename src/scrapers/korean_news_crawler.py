@@ -5,16 +5,43 @@
 """
 
 import asyncio
-import aiohttp
-import feedparser
-from datetime import datetime, timedelta
-import re
-from typing import List, Dict, Optional
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+import codecs
+from typing import List, Dict, Optional, Tuple
 import logging
 
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config import config
+from src.scrapers import http_client
+from src.scrapers.bulk_fetch import fetch_many
+from src.scrapers.content_cache import ArticleContentCache
+from src.scrapers.dedup import NearDuplicateDetector
+from src.scrapers.feed_cache import FeedCache
+from src.scrapers.html_extract import YonhapArticleParser
+from src.storage.news_item import NewsItem
+from src.storage.raw_store import RawPageStore, default_store
+
+YONHAP_ARTICLE_HOSTS = ('www.yna.co.kr', 'yna.co.kr', 'www.yonhapnews.co.kr')
+
 class KoreanNewsCrawler:
-    def __init__(self):
-        self.session = None
+    def __init__(self, feed_cache: Optional[FeedCache] = None,
+                 content_cache: Optional[ArticleContentCache] = None,
+                 raw_store: Optional[RawPageStore] = None):
+        # ETag/Last-Modified 기반 피드 캐시 (변경 없는 피드는 재파싱하지 않음)
+        self.feed_cache = feed_cache or FeedCache()
+        # URL 기준 기사 본문 캐시 (TTL + LRU)
+        self.content_cache = content_cache or ArticleContentCache()
+        # 내용 해시 기준 원문 HTML 저장소 (추출기를 고친 뒤 다시 요청하지 않고 재추출)
+        self.raw_store = raw_store or default_store()
+        # 본문 스트리밍 통계 (읽은 바이트, 본문 종료 후 조기 중단 횟수)
+        self.stream_chunk_size = 8192
+        self.stream_stats = {'pages': 0, 'bytes_read': 0, 'early_stops': 0}
+        # 피드에서 읽을 최신 항목 수 (나머지는 파싱하지 않음)
+        self.max_feed_items = 10
         self.setup_logging()
         
         # 연합뉴스 RSS URL들만 사용
@@ -35,63 +62,40 @@ class KoreanNewsCrawler:
         )
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def session(self):
+        """공유 HTTP 세션 (http_client가 커넥션 풀을 관리)"""
+        return http_client.get_session()
+    
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        if self.session:
-            await self.session.close()
+        """비동기 컨텍스트 매니저 종료 (공유 세션은 닫지 않음)"""
+        return None
     
-    async def fetch_rss_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
-        """RSS 피드 가져오기"""
+    async def fetch_rss_feed(self, url: str, max_items: Optional[int] = None) -> Optional[List[Dict]]:
+        """RSS 피드 항목 가져오기 (조건부 요청 캐시 사용, max_items: 앞 N개만 파싱)"""
         try:
-            async with self.session.get(url, timeout=30) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return feedparser.parse(content)
-                else:
-                    self.logger.warning(f"RSS 피드 가져오기 실패: {url}, 상태: {response.status}")
-                    return None
+            entries = await self.feed_cache.fetch_entries(url, max_items=max_items)
+            if entries is None:
+                self.logger.warning(f"RSS 피드 가져오기 실패: {url}")
+            return entries
         except Exception as e:
             self.logger.error(f"RSS 피드 가져오기 오류: {url}, 오류: {e}")
             return None
     
-    def parse_yonhap_news(self, feed: feedparser.FeedParserDict, category: str) -> List[Dict]:
+    def parse_yonhap_news(self, entries: List[Dict], category: str) -> List[Dict]:
         """연합뉴스 파싱"""
         news_list = []
         
-        for entry in feed.entries[:10]:  # 최신 10개만
+        for entry in entries[:self.max_feed_items]:  # 최신 10개만
             try:
-                # 제목 정리
-                title = entry.title.strip()
-                
-                # 날짜 파싱
-                pub_date = datetime.now()  # 기본값
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                
-                # 링크
-                link = entry.link if hasattr(entry, 'link') else ''
-                
-                # 요약
-                summary = ""
-                if hasattr(entry, 'summary'):
-                    summary = re.sub(r'<.*?>', '', entry.summary).strip()
-                elif hasattr(entry, 'description'):
-                    summary = re.sub(r'<.*?>', '', entry.description).strip()
-                
-                news_item = {
-                    'title': title,
-                    'link': link,
-                    'summary': summary,
-                    'category': category,
-                    'source': '연합뉴스',
-                    'published': pub_date.isoformat(),
-                    'published_date': pub_date
-                }
+                # 제목/요약 정리와 날짜 파싱은 NewsItem에서 한 번만 (발행일이 없으면 수집 시각)
+                news_item = NewsItem.from_feed_entry(entry, source='연합뉴스', category=category)
+                if news_item.published is None:
+                    news_item['published'] = datetime.now(timezone.utc)
                 
                 news_list.append(news_item)
                 
@@ -107,9 +111,9 @@ class KoreanNewsCrawler:
         
         # 연합뉴스에서 가져오기
         if category in self.yonhap_rss_urls:
-            feed = await self.fetch_rss_feed(self.yonhap_rss_urls[category])
-            if feed:
-                yonhap_news = self.parse_yonhap_news(feed, category)
+            entries = await self.fetch_rss_feed(self.yonhap_rss_urls[category], max_items=self.max_feed_items)
+            if entries:
+                yonhap_news = self.parse_yonhap_news(entries, category)
                 all_news.extend(yonhap_news[:limit//2])
         
         # 날짜순으로 정렬하고 중복 제거
@@ -120,49 +124,114 @@ class KoreanNewsCrawler:
         """모든 카테고리의 오늘 뉴스 가져오기"""
         all_news = []
         
-        # 연합뉴스에서 가져오기
-        for category in ['main', 'politics', 'economy', 'society', 'world', 'science']:
-            try:
-                news = await self.get_category_news(category, limit_per_category)
-                all_news.extend(news)
-                self.logger.info(f"카테고리 '{category}'에서 {len(news)}개 뉴스 수집")
-            except Exception as e:
-                self.logger.error(f"카테고리 '{category}' 수집 오류: {e}")
+        # 연합뉴스에서 가져오기 (피드를 동시에 요청해 한 피드를 파싱하는 동안 다른 피드를 내려받음)
+        categories = ['main', 'politics', 'economy', 'society', 'world', 'science']
+        results = await asyncio.gather(*[
+            self.get_category_news(category, limit_per_category) for category in categories
+        ], return_exceptions=True)
+        for category, news in zip(categories, results):
+            if isinstance(news, Exception):
+                self.logger.error(f"카테고리 '{category}' 수집 오류: {news}")
+                continue
+            all_news.extend(news)
+            self.logger.info(f"카테고리 '{category}'에서 {len(news)}개 뉴스 수집")
         
         # 중복 제거 및 정렬
         unique_news = self.remove_duplicates(all_news)
         return sorted(unique_news, key=lambda x: x['published_date'], reverse=True)
     
-    def remove_duplicates(self, news_list: List[Dict]) -> List[Dict]:
-        """중복 뉴스 제거 (제목 기준)"""
-        seen_titles = set()
-        unique_news = []
-        
-        for news in news_list:
-            # 제목 정규화 (공백 제거, 소문자 변환)
-            normalized_title = re.sub(r'\s+', ' ', news['title'].lower().strip())
-            
-            if normalized_title not in seen_titles:
-                seen_titles.add(normalized_title)
-                unique_news.append(news)
-        
-        return unique_news
+    def remove_duplicates(self, news_list: List[Dict], threshold: Optional[float] = None) -> List[Dict]:
+        """중복 뉴스 제거 (제목+요약 MinHash 유사도 기준, 먼저 나온 기사를 남김)"""
+        if threshold is None:
+            threshold = getattr(config, 'NEAR_DUPLICATE_THRESHOLD', 0.7)
+        return NearDuplicateDetector(threshold=threshold).filter(news_list)
+    
+    async def _fetch_article_content(self, url: str) -> Optional[str]:
+        """연합뉴스 기사 본문 가져오기 (실패 시 예외 발생)
+        
+        응답을 조각 단위로 읽으면서 파싱하고, 본문 컨테이너가 닫히면 나머지는 받지 않습니다.
+        """
+        cached = self.content_cache.get(url)
+        if cached is not None:
+            return cached
+        
+        parser = YonhapArticleParser()
+        bytes_read = 0
+        raw_chunks = []
+        async with http_client.request('GET', url, kind='article') as response:
+            if response.status != 200:
+                return None
+            charset = response.charset or 'utf-8'
+            decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+            async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                bytes_read += len(chunk)
+                if self.raw_store is not None:
+                    raw_chunks.append(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done:
+                    # 남은 응답은 읽지 않고 연결을 닫음
+                    response.close()
+                    break
+        if self.raw_store is not None:
+            # 조기 중단한 경우 본문까지의 앞부분만 저장 (재추출에는 충분)
+            # 압축·파일 쓰기·SQLite 기록이 다른 기사 수집을 막지 않도록 작업 스레드에서
+            await asyncio.to_thread(self.raw_store.put, url, b''.join(raw_chunks), charset, complete=not parser.done)
+        
+        self.stream_stats['pages'] += 1
+        self.stream_stats['bytes_read'] += bytes_read
+        if parser.done:
+            self.stream_stats['early_stops'] += 1
+        
+        content = parser.text()
+        if content:
+            self.content_cache.set(url, content)
+        return content
+    
+    @staticmethod
+    def extract_article_text(html: bytes, encoding: Optional[str] = None) -> Optional[str]:
+        """저장된 원문에서 연합뉴스 기사 본문 추출"""
+        parser = YonhapArticleParser()
+        parser.feed(html.decode(encoding or 'utf-8', errors='replace'))
+        return parser.text()
+    
+    def reextract_from_store(self, update_cache: bool = True) -> Dict[str, Optional[str]]:
+        """원문 저장소의 연합뉴스 페이지에서 본문을 다시 추출 (네트워크 요청 없음)
+        
+        반환값: {url: 본문 또는 None}
+        """
+        if self.raw_store is None:
+            return {}
+        contents = self.raw_store.reextract(
+            lambda html, url, encoding: self.extract_article_text(html, encoding), hosts=YONHAP_ARTICLE_HOSTS
+        )
+        if update_cache:
+            for url, content in contents.items():
+                if content:
+                    self.content_cache.set(url, content)
+        return contents
     
     async def get_article_content(self, url: str) -> Optional[str]:
-        """기사 본문 가져오기 (간단한 버전)"""
+        """기사 본문 가져오기"""
         try:
-            async with self.session.get(url, timeout=30) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    
-                    # 간단한 본문 추출 (실제로는 더 정교한 파싱 필요)
-                    # 여기서는 요약만 반환
-                    return "본문은 원문 링크를 참조하세요."
-                else:
-                    return None
+            return await self._fetch_article_content(url)
         except Exception as e:
             self.logger.error(f"기사 본문 가져오기 오류: {url}, 오류: {e}")
             return None
+    
+    async def fetch_contents(self, urls: List[str], max_concurrency: int = 8,
+                             max_per_host: int = 4, timeout: float = 15.0
+                             ) -> Tuple[Dict[str, Optional[str]], Dict[str, str]]:
+        """여러 기사 본문을 병렬로 가져오기
+        
+        반환값: ({url: 본문 또는 None}, {url: 실패 사유})
+        """
+        contents, failures = await fetch_many(
+            self._fetch_article_content, urls,
+            max_concurrency=max_concurrency, max_per_host=max_per_host, timeout=timeout
+        )
+        for url, reason in failures.items():
+            self.logger.error(f"기사 본문 가져오기 오류: {url}, 오류: {reason}")
+        return contents, failures
 
 # 사용 예시
 async def main():
@@ -186,6 +255,8 @@ async def main():
         
         for news in all_news[:5]:  # 상위 5개만 출력
             print(f"- [{news['category']}] {news['title']} ({news['source']})")
+    
+    await http_client.close_session()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
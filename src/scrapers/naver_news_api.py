@@ -1,35 +1,209 @@
-import requests
+import asyncio
+import json
+import os
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from config import config
+from src.scrapers import http_client
+from src.scrapers.rate_limiter import TokenBucket
 
-# 네이버 뉴스 검색 API
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
 
-def search_naver_news(query, display=10, start=1, sort="date"):
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
+# 네이버 검색 API 제한: 초당 호출 수, 하루 호출 수 (애플리케이션 기준)
+NAVER_QPS = getattr(config, 'NAVER_QPS', 10)
+NAVER_DAILY_QUOTA = getattr(config, 'NAVER_DAILY_QUOTA', 25000)
+NAVER_QUOTA_RESERVE = getattr(config, 'NAVER_QUOTA_RESERVE', 100)  # 한도 직전에 멈추기 위한 여유분
+NAVER_QUOTA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'cache', 'naver_quota.json'
+)
+
+class NaverAPIError(Exception):
+    """네이버 API 호출 실패 또는 일일 한도 도달 (raise_errors=True일 때)"""
+
+class NaverQuota:
+    """네이버 API 일일 호출량 카운터 (파일에 저장해 실행 간에도 유지)"""
+    
+    def __init__(self, path=NAVER_QUOTA_FILE, daily_limit=NAVER_DAILY_QUOTA, reserve=NAVER_QUOTA_RESERVE):
+        self.path = path
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+    
+    def _load(self):
+        today = datetime.now().strftime('%Y-%m-%d')
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get('date') != today:
+            data = {'date': today, 'count': 0}
+        return data
+    
+    def _save(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+    
+    def used(self):
+        return self._load()['count']
+    
+    def remaining(self):
+        return max(0, self.daily_limit - self.reserve - self.used())
+    
+    def try_acquire(self, calls=1):
+        """호출 가능하면 카운트를 올리고 True, 한도에 가까우면 False"""
+        data = self._load()
+        if data['count'] + calls > self.daily_limit - self.reserve:
+            return False
+        data['count'] += calls
+        self._save(data)
+        return True
+
+def _naver_headers():
+    return {
         "X-Naver-Client-Id": config.NAVER_CLIENT_ID,
         "X-Naver-Client-Secret": config.NAVER_CLIENT_SECRET,
     }
+
+# 네이버 뉴스 검색 API
+
+def search_naver_news(query, display=10, start=1, sort="date"):
+    if not NaverQuota().try_acquire():
+        print("네이버 API 일일 호출 한도에 가까워 요청을 건너뜁니다:", query)
+        return []
     params = {
         "query": query,
         "display": display,
         "start": start,
         "sort": sort,  # date(최신순), sim(정확도순)
     }
-    response = requests.get(url, headers=headers, params=params)
+    response = http_client.get_sync_session().get(NAVER_NEWS_URL, headers=_naver_headers(), params=params,
+                                                  timeout=http_client.sync_timeout('api'))
     if response.status_code == 200:
         return response.json()["items"]
     else:
         print("네이버 뉴스 API 오류:", response.text)
         return []
 
+async def search_naver_news_async(query, display=10, start=1, sort="date", bucket=None, quota=None,
+                                  raise_errors=False):
+    """네이버 뉴스 검색 (비동기). bucket/quota를 주면 속도 제한과 일일 한도를 적용
+    
+    raise_errors=True이면 실패/한도 도달 시 빈 목록 대신 NaverAPIError 발생 (결과 끝과 구분해야 하는 백필용)
+    """
+    quota = quota or NaverQuota()
+    if not quota.try_acquire():
+        if raise_errors:
+            raise NaverAPIError("네이버 API 일일 호출 한도 도달")
+        print("네이버 API 일일 호출 한도에 가까워 요청을 건너뜁니다:", query)
+        return []
+    if bucket is not None:
+        await bucket.acquire()
+    params = {
+        "query": query,
+        "display": display,
+        "start": start,
+        "sort": sort,
+    }
+    try:
+        status, data = await http_client.get_json(NAVER_NEWS_URL, params=params, headers=_naver_headers())
+    except Exception as e:
+        if raise_errors:
+            raise NaverAPIError(f"네이버 뉴스 API 요청 실패 ({query}): {e}") from e
+        print(f"네이버 뉴스 API 요청 실패 ({query}): {e}")
+        return []
+    if status == 200:
+        return data["items"]
+    if raise_errors:
+        raise NaverAPIError(f"네이버 뉴스 API 오류 ({status}): {data}")
+    print("네이버 뉴스 API 오류:", data)
+    return []
+
+async def search_naver_news_many(keywords, display=10, sort="date"):
+    """여러 키워드를 초당 호출 제한 안에서 동시에 검색
+    
+    반환값: {키워드: 뉴스 목록} (키워드 순서 유지)
+    """
+    bucket = TokenBucket(rate=NAVER_QPS, capacity=NAVER_QPS)
+    quota = NaverQuota()
+    results = await asyncio.gather(*[
+        search_naver_news_async(keyword, display=display, sort=sort, bucket=bucket, quota=quota)
+        for keyword in keywords
+    ])
+    return dict(zip(keywords, results))
+
+# 네이버 검색 API 페이지 제한 (display 최대 100, start 최대 1000)
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
+
+def parse_pub_date(item):
+    """네이버 뉴스 항목의 pubDate를 datetime으로 변환 (실패 시 None)"""
+    try:
+        return parsedate_to_datetime(item.get("pubDate", ""))
+    except (TypeError, ValueError):
+        return None
+
+async def iter_naver_news(query, sort="date", limit=None, since=None, page_size=NAVER_MAX_DISPLAY,
+                          bucket=None, quota=None):
+    """start 오프셋을 넘기며 네이버 뉴스를 한 건씩 yield하는 비동기 제너레이터
+    
+    현재 페이지를 소비하는 동안 다음 페이지를 미리 요청합니다 (limit까지 더 필요할 때만, 남은 개수만큼).
+    limit개를 넘기거나, (sort="date"일 때) since보다 오래된 기사가 나오면 멈춥니다.
+    """
+    page_size = min(page_size, NAVER_MAX_DISPLAY)
+    bucket = bucket or TokenBucket(rate=NAVER_QPS, capacity=NAVER_QPS)
+    quota = quota or NaverQuota()
+    if since is not None and since.tzinfo is None:
+        since = since.astimezone()  # 로컬 시간으로 간주
+    
+    def page_display(received):
+        """limit까지 남은 개수만큼만 요청 (남은 개수가 한 페이지보다 적으면 display를 줄임)"""
+        return page_size if limit is None else min(page_size, limit - received)
+    
+    def fetch_page(start, display):
+        return asyncio.ensure_future(search_naver_news_async(
+            query, display=display, start=start, sort=sort, bucket=bucket, quota=quota
+        ))
+    
+    if limit is not None and limit <= 0:
+        return
+    start = 1
+    display = page_display(0)
+    pending = fetch_page(start, display)
+    yielded = 0
+    try:
+        while pending is not None:
+            items = await pending
+            pending = None
+            next_start = start + display
+            # 이번 페이지로 limit을 채울 수 있으면 다음 페이지는 요청하지 않음 (호출 한도·토큰 절약)
+            if (len(items) == display and next_start <= NAVER_MAX_START
+                    and (limit is None or yielded + len(items) < limit)):
+                display = page_display(yielded + len(items))
+                pending = fetch_page(next_start, display)  # 다음 페이지 미리 요청
+            
+            for item in items:
+                if since is not None and sort == "date":
+                    pub_date = parse_pub_date(item)
+                    if pub_date is not None and pub_date < since:
+                        return
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+            start = next_start
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
 # 네이버 데이터랩(트렌드) API
 
 def get_naver_trend_keywords(date=None, top_n=10):
     url = "https://openapi.naver.com/v1/datalab/search"
     headers = {
-        "X-Naver-Client-Id": config.NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": config.NAVER_CLIENT_SECRET,
+        **_naver_headers(),
         "Content-Type": "application/json"
     }
     if date is None:
@@ -49,7 +223,8 @@ def get_naver_trend_keywords(date=None, top_n=10):
         "ages": [],
         "gender": ""
     }
-    response = requests.post(url, headers=headers, json=body)
+    response = http_client.get_sync_session().post(url, headers=headers, json=body,
+                                                   timeout=http_client.sync_timeout('api'))
     if response.status_code == 200:
         # 실제 인기 검색어는 데이터랩에서 바로 제공하지 않으므로, 예시로 빈 리스트 반환
         # 실시간 인기 검색어는 크롤링이 필요함
@@ -1,12 +1,19 @@
-import requests
+import os
+import sys
 from bs4 import BeautifulSoup
 
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers import http_client
+
 def get_naver_realtime_keywords(top_n=10):
     url = "https://datalab.naver.com/keyword/realtimeList.naver"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     }
-    response = requests.get(url, headers=headers)
+    response = http_client.get_sync_session().get(url, headers=headers,
+                                                  timeout=http_client.sync_timeout('api'))
     if response.status_code != 200:
         print("네이버 실시간 트렌드 크롤링 오류:", response.text)
         return []
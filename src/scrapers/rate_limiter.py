@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+호스트별 요청 속도 제한기
+고정 sleep 대신 토큰 버킷으로 같은 호스트에 대한 요청 간격을 조절합니다.
+"""
+
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (rate: 초당 토큰 보충량, capacity: 최대 버스트)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """호스트마다 별도의 토큰 버킷을 두는 속도 제한기"""
+
+    def __init__(self, rate: float = 5.0, capacity: float = 5.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 토큰 버킷 반환"""
+        host = urlsplit(url).netloc.lower()
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.capacity)
+        return self.buckets[host]
+
+    async def acquire(self, url: str):
+        """해당 URL의 호스트로 요청을 보내도 될 때까지 대기"""
+        await self.bucket_for(url).acquire()
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수 제한기"""
+
+    def __init__(self, max_per_host: int = 4):
+        self.max_per_host = max_per_host
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        """URL의 호스트에 해당하는 세마포어 반환 (async with로 사용)"""
+        host = urlsplit(url).netloc.lower()
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self.semaphores[host]
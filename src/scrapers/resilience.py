@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+외부 요청 복원력 계층
+모든 비동기 HTTP 요청이 공유하는 호스트별 상태를 관리합니다.
+- 호스트별 동시 요청 수 제한
+- 429/5xx/연결 오류 시 지수 백오프 + 지터로 재시도 (Retry-After 헤더 우선)
+- 429를 받은 호스트는 요청 간격을 늘렸다가 성공할 때마다 조금씩 회복
+- 계속 실패하는 호스트는 회로 차단기로 일정 시간 바로 실패 처리 (죽은 피드가 매번 타임아웃까지 기다리지 않도록)
+"""
+
+import asyncio
+import random
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.scrapers.rate_limiter import HostConcurrencyLimiter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class CircuitOpenError(Exception):
+    """회로 차단 중인 호스트로의 요청"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 회로 차단 중 ({retry_in:.0f}초 후 재시도)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class HostState:
+    """호스트별 회로 차단/요청 간격 상태 (이벤트 루프와 무관한 값만 보관)"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None  # 회로가 열린 시각 (None이면 닫힘)
+        self.probing = False  # 반개방 상태에서 시험 요청이 진행 중인지
+        self.rate: Optional[float] = None  # 429 이후 적용하는 초당 요청 수 (None이면 제한 없음)
+        self.next_at = 0.0  # 다음 요청을 보내도 되는 시각
+        self.requests = 0
+        self.retries = 0
+        self.short_circuited = 0
+
+
+class ResilienceLayer:
+    def __init__(self, max_per_host: int = 8, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 failure_threshold: int = 5, recovery_time: float = 60.0,
+                 throttle_rate: float = 4.0, min_rate: float = 0.2, rate_step: float = 0.1):
+        self.max_per_host = max_per_host
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.throttle_rate = throttle_rate  # 429 이후 회복 목표 초당 요청 수 (첫 429에서 절반부터 시작)
+        self.min_rate = min_rate
+        self.rate_step = rate_step  # 성공할 때마다 늘리는 초당 요청 수
+        self.hosts: Dict[str, HostState] = {}
+        # 세마포어는 이벤트 루프에 묶이므로 루프마다 따로 유지
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HostConcurrencyLimiter]" = \
+            weakref.WeakKeyDictionary()
+
+    def state_for(self, url: str) -> HostState:
+        host = urlsplit(url).netloc.lower()
+        if host not in self.hosts:
+            self.hosts[host] = HostState(host)
+        return self.hosts[host]
+
+    def slot(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 슬롯 (async with로 사용, 응답을 다 읽을 때까지 유지)"""
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = HostConcurrencyLimiter(self.max_per_host)
+        return limiter.for_url(url)
+
+    # ---- 회로 차단기 ----
+
+    def _check_circuit(self, state: HostState):
+        if state.opened_at is None:
+            return
+        elapsed = time.monotonic() - state.opened_at
+        if elapsed < self.recovery_time or state.probing:
+            state.short_circuited += 1
+            raise CircuitOpenError(state.host, max(0.0, self.recovery_time - elapsed))
+        state.probing = True  # 반개방: 시험 요청 하나만 통과
+
+    def _close_circuit(self, state: HostState):
+        state.consecutive_failures = 0
+        state.opened_at = None
+        state.probing = False
+
+    def _record_success(self, state: HostState):
+        self._close_circuit(state)
+        if state.rate is not None:
+            state.rate += self.rate_step
+            if state.rate >= self.throttle_rate:
+                state.rate = None  # 충분히 회복되면 간격 제한 해제
+
+    def _record_failure(self, state: HostState):
+        state.consecutive_failures += 1
+        if state.probing or state.consecutive_failures >= self.failure_threshold:
+            state.opened_at = time.monotonic()
+        state.probing = False
+
+    # ---- 요청 간격 / 재시도 대기 ----
+
+    def _throttle(self, state: HostState):
+        """429를 받은 호스트의 초당 요청 수를 절반으로 줄임"""
+        state.rate = max(self.min_rate, (state.rate or self.throttle_rate) / 2)
+
+    async def _pace(self, state: HostState):
+        if state.rate is None:
+            return
+        now = time.monotonic()
+        wait = max(0.0, state.next_at - now)
+        state.next_at = max(now, state.next_at) + 1 / state.rate
+        if wait:
+            await asyncio.sleep(wait)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """재시도 전 대기 시간 (Retry-After가 있으면 그 값, 없으면 full jitter 지수 백오프)"""
+        if retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def send(self, url: str, send: Callable[[], Awaitable[aiohttp.ClientResponse]],
+                   retries: int = 2) -> aiohttp.ClientResponse:
+        """send()를 재시도 정책에 따라 실행하고 마지막 응답 반환
+
+        재시도 후에도 429/5xx이면 그 응답을 그대로 돌려주므로 호출 측의 상태 코드 처리는 그대로 동작합니다.
+        연결 오류/타임아웃이 끝까지 계속되면 마지막 예외를, 회로 차단 중이면 CircuitOpenError를 발생시킵니다.
+        """
+        state = self.state_for(url)
+        attempt = 0
+        while True:
+            self._check_circuit(state)
+            probe = state.probing
+            try:
+                await self._pace(state)
+                state.requests += 1
+                try:
+                    response = await send()
+                except RETRY_EXCEPTIONS:
+                    self._record_failure(state)
+                    if attempt >= retries:
+                        raise
+                    delay = self.backoff_delay(attempt)
+                else:
+                    if response.status not in RETRY_STATUSES:
+                        self._record_success(state)
+                        return response
+                    if response.status == 429:
+                        # 서버가 살아 있으므로 회로 차단 대상은 아님 (시험 요청이었다면 회로를 닫음)
+                        self._close_circuit(state)
+                        self._throttle(state)
+                    else:
+                        self._record_failure(state)
+                    delay = self.backoff_delay(attempt, response.headers.get('Retry-After'))
+                    if attempt >= retries or delay > self.backoff_max:
+                        return response
+                    response.release()
+            finally:
+                # 시험 요청이 취소되거나 다른 예외로 끝나 성공/실패가 기록되지 않았으면 다음 요청이 다시 시험하도록
+                if probe and state.probing:
+                    state.probing = False
+            attempt += 1
+            state.retries += 1
+            await asyncio.sleep(delay)
+
+    def summary(self) -> Dict[str, Dict]:
+        """호스트별 요청/재시도/차단 통계"""
+        return {
+            host: {
+                'requests': state.requests,
+                'retries': state.retries,
+                'short_circuited': state.short_circuited,
+                'circuit_open': state.opened_at is not None,
+                'rate': state.rate,
+            }
+            for host, state in self.hosts.items()
+        }
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초"""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+스트리밍 RSS/Atom 항목 파서
+형식이 알려진 RSS 2.0 피드(BBC, 연합뉴스)는 feedparser 대신 iterparse로 항목을 하나씩 읽어
+title/link/summary/pubDate/guid만 뽑습니다. 앞에서 N개를 읽었거나 기준 시각보다 오래된 항목이
+나오면 나머지는 읽지 않습니다. lxml이 있으면 lxml, 없으면 표준 라이브러리 ElementTree를 사용합니다.
+"""
+
+import io
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+ITEM_TAGS = ('item', 'entry')
+SUMMARY_TAGS = ('description', 'summary', 'content', 'encoded')
+DATE_TAGS = ('pubDate', 'published', 'updated', 'date')
+CHUNK_SIZE = 64 * 1024
+PARSE_ERRORS = (ET.ParseError,) + ((etree.XMLSyntaxError,) if etree is not None else ())
+
+DEFAULT_SAMPLE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'feed_samples'
+)
+
+
+class FeedParseError(Exception):
+    """스트리밍 파서로 읽을 수 없는 피드 (호출 측에서 feedparser로 대체)"""
+
+
+def _local_name(tag) -> str:
+    """'{namespace}name' → 'name'"""
+    if not isinstance(tag, str):
+        return ''  # lxml의 주석/처리 명령 노드
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_date(text: Optional[str]) -> Optional[List[int]]:
+    """RFC 822(RSS) 또는 ISO 8601(Atom) 날짜 → UTC [년, 월, 일, 시, 분, 초] (feedparser와 동일한 기준)"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return [parsed.year, parsed.month, parsed.day, parsed.hour, parsed.minute, parsed.second]
+
+
+def utc_naive(value: datetime) -> datetime:
+    """시간대가 있는 datetime은 UTC로 바꾸고 tzinfo 제거 (없으면 이미 UTC로 간주)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _item_to_entry(element) -> Dict:
+    """<item>/<entry> 요소 → compact_entry와 같은 형태의 dict"""
+    fields: Dict[str, str] = {}
+    link = ''
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'link':
+            # RSS는 텍스트, Atom은 href 속성 (rel이 없거나 alternate인 링크)
+            href = child.get('href')
+            if href is None:
+                link = link or (child.text or '').strip()
+            elif child.get('rel', 'alternate') == 'alternate':
+                link = link or href.strip()
+        elif name not in fields:
+            fields[name] = ''.join(child.itertext()).strip()
+
+    summary = next((fields[tag] for tag in SUMMARY_TAGS if fields.get(tag)), '')
+    published = next((fields[tag] for tag in DATE_TAGS if fields.get(tag)), None)
+    return {
+        'title': fields.get('title', ''),
+        'link': link,
+        'summary': summary,
+        'published_parsed': parse_date(published),
+        'guid': fields.get('guid') or fields.get('id') or link,
+    }
+
+
+def _lxml_events(content: bytes) -> Iterator[Tuple[str, object]]:
+    for event, element in etree.iterparse(io.BytesIO(content), events=('start', 'end'),
+                                          resolve_entities=False, no_network=True):
+        yield event, element
+
+
+def _stdlib_events(content: bytes) -> Iterator[Tuple[str, object]]:
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    for offset in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[offset:offset + CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _release(element):
+    """처리한 항목 요소의 메모리 해제"""
+    element.clear()
+    if hasattr(element, 'getprevious'):
+        # lxml은 clear 후에도 부모에 빈 요소가 남으므로 앞 형제들을 지움
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def iter_stream_entries(content, max_items: Optional[int] = None,
+                        since: Optional[datetime] = None) -> Iterator[Dict]:
+    """피드 본문에서 항목을 하나씩 생성
+
+    max_items개를 내보냈거나 since보다 오래된 항목을 만나면 (피드는 최신순이라고 가정) 중단합니다.
+    since가 시간대 없는 datetime이면 UTC로 간주합니다. 날짜가 없는 항목은 cutoff 없이 포함합니다.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    if since is not None:
+        since = utc_naive(since)
+
+    events = _lxml_events(content) if etree is not None else _stdlib_events(content)
+    count = 0
+    depth = 0  # 항목 안에 있는 동안의 중첩 깊이 (항목 안의 항목 태그 무시)
+    try:
+        for event, element in events:
+            if _local_name(element.tag) not in ITEM_TAGS:
+                continue
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue
+
+            entry = _item_to_entry(element)
+            _release(element)
+            if since is not None and entry['published_parsed'] and datetime(*entry['published_parsed']) < since:
+                return
+            yield entry
+            count += 1
+            if max_items is not None and count >= max_items:
+                return
+    except PARSE_ERRORS as e:
+        raise FeedParseError(str(e)) from e
+
+
+def parse_stream_entries(content, max_items: Optional[int] = None,
+                         since: Optional[datetime] = None) -> List[Dict]:
+    """iter_stream_entries의 결과를 리스트로 반환 (실패 시 FeedParseError)"""
+    return list(iter_stream_entries(content, max_items=max_items, since=since))
+
+
+# ---- 녹화한 피드 샘플로 feedparser 경로와 비교 ----
+
+def record_samples(sample_dir: str = DEFAULT_SAMPLE_DIR) -> List[str]:
+    """BBC/연합뉴스 피드를 한 번씩 내려받아 벤치마크용 샘플로 저장"""
+    from src.scrapers import http_client
+    from src.scrapers.bbc_rss_crawler import BBCNewsCrawler
+    from src.scrapers.korean_news_crawler import KoreanNewsCrawler
+
+    feeds = {f'bbc_{name}': url for name, url in BBCNewsCrawler().rss_feeds.items()}
+    feeds.update({f'yonhap_{name}': url for name, url in KoreanNewsCrawler().yonhap_rss_urls.items()})
+
+    os.makedirs(sample_dir, exist_ok=True)
+    session = http_client.get_sync_session()
+    saved = []
+    for name, url in feeds.items():
+        try:
+            response = session.get(url, timeout=http_client.sync_timeout('feed'))
+            response.raise_for_status()
+        except Exception as e:
+            print(f"❌ {name} 샘플 저장 실패: {e}")
+            continue
+        path = os.path.join(sample_dir, f'{name}.xml')
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        saved.append(path)
+        print(f"✅ {name}: {len(response.content):,} bytes → {path}")
+    return saved
+
+
+def benchmark(sample_dir: str = DEFAULT_SAMPLE_DIR, repeat: int = 20, max_items: int = 10):
+    """저장된 샘플마다 feedparser / 스트리밍(전체) / 스트리밍(앞 max_items개) 평균 시간 비교"""
+    from src.scrapers.feed_parser import parse_feed_entries
+
+    paths = sorted(os.path.join(sample_dir, name) for name in os.listdir(sample_dir) if name.endswith('.xml'))
+    if not paths:
+        print(f"샘플이 없습니다: {sample_dir} (먼저 record 실행)")
+        return
+
+    backend = 'lxml' if etree is not None else 'ElementTree'
+    runs = {
+        'feedparser': lambda content: parse_feed_entries(content, engine='feedparser'),
+        f'stream({backend})': lambda content: parse_stream_entries(content),
+        f'stream 앞 {max_items}개': lambda content: parse_stream_entries(content, max_items=max_items),
+    }
+    totals = {name: 0.0 for name in runs}
+    for path in paths:
+        with open(path, 'rb') as f:
+            content = f.read()
+        results = {}
+        for name, run in runs.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                entries = run(content)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+            totals[name] += elapsed_ms
+            results[name] = (elapsed_ms, entries)
+
+        baseline = [entry['link'] for entry in results['feedparser'][1]]
+        streamed = [entry['link'] for entry in results[f'stream({backend})'][1]]
+        same = '일치' if baseline == streamed else '불일치'
+        line = ', '.join(f"{name} {ms:.2f}ms/{len(entries)}개" for name, (ms, entries) in results.items())
+        print(f"[{os.path.basename(path)}] {len(content):,} bytes | {line} | 링크 {same}")
+
+    print("합계: " + ', '.join(f"{name} {ms:.2f}ms" for name, ms in totals.items()))
+
+
+# 사용 예시
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('record', 'bench'):
+        print("사용법: python src/scrapers/rss_stream.py record [샘플 폴더]")
+        print("        python src/scrapers/rss_stream.py bench [샘플 폴더] [반복 횟수]")
+        return
+    sample_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SAMPLE_DIR
+    if sys.argv[1] == 'record':
+        record_samples(sample_dir)
+    else:
+        benchmark(sample_dir, repeat=int(sys.argv[3]) if len(sys.argv) > 3 else 20)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# 저장소 모듈 패키지 
\ No newline at end of file
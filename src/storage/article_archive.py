@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+기사 JSONL 아카이브
+수집한 기사를 고정된 스키마의 한 줄짜리 JSON으로 월별 파일(data/archive/articles-YYYY-MM.jsonl)에 덧붙입니다.
+기존 파일을 덮어쓰지 않으므로 같은 날 다시 실행해도 이전 기록이 남고, 읽을 때는 한 줄씩 읽어
+몇 달 치 기사도 일정한 메모리로 순회할 수 있습니다. orjson이 있으면 orjson, 없으면 표준 json을 사용합니다.
+
+사용법:
+    python src/storage/article_archive.py stats
+    python src/storage/article_archive.py tail [소스] [개수]
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.rss_stream import utc_naive
+from src.storage.news_item import MISSING_CONTENT, SCHEMA_VERSION, NewsItem
+from src.storage.seen_index import item_key
+
+DEFAULT_ARCHIVE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'archive'
+)
+# 레코드 필드 (순서 고정, 없는 값은 None)
+ARCHIVE_FIELDS = (
+    'v', 'id', 'source', 'category', 'keyword', 'title', 'link', 'summary', 'content',
+    'published', 'collected_at', 'guid',
+)
+
+
+def dumps(record: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(line: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def to_timestamp(value) -> Optional[str]:
+    """datetime/date/ISO 문자열 → UTC 기준 ISO 문자열 (시간대 없는 값은 이미 UTC로 간주)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f"발행일 형식을 알 수 없습니다: {value!r}")
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if not isinstance(value, datetime):
+        raise TypeError(f"발행일로 쓸 수 없는 값입니다: {value!r}")
+    return utc_naive(value).isoformat(timespec='seconds')
+
+
+def to_record(item: Dict, source: Optional[str] = None, collected_at: Optional[float] = None) -> Dict:
+    """뉴스 dict(BBC/연합뉴스/네이버) → 아카이브 레코드
+
+    문자열 필드에 다른 타입이 오면 문자열로 바꾸지 않고 TypeError를 냅니다 (default=str처럼 조용히 형식이 바뀌지 않도록).
+    읽을 수 없는 발행일은 published=None으로 기록합니다.
+    """
+    if isinstance(item, NewsItem):
+        return item.to_record(source=source, collected_at=collected_at)  # 이미 정규화된 값이라 바로 변환
+    link = item.get('originallink') or item.get('link') or ''
+    content = item.get('content')
+    published = item.get('published_date') or item.get('published') or item.get('pubDate')
+    try:
+        if isinstance(published, str) and not published[:4].isdigit():
+            # 네이버 pubDate (RFC 822)
+            from email.utils import parsedate_to_datetime
+            published = parsedate_to_datetime(published)
+        published = to_timestamp(published)
+    except (TypeError, ValueError, IndexError):
+        # 날짜 하나 때문에 배치 전체 저장이 실패하지 않도록 발행일만 비워 둠
+        print(f"⚠️ 발행일을 읽을 수 없어 비워 둡니다: {published!r} ({link})")
+        published = None
+    record = {
+        'v': SCHEMA_VERSION,
+        'id': hashlib.sha1(item_key(item).encode('utf-8')).hexdigest()[:16],
+        'source': source or item.get('source'),
+        'category': item.get('category'),
+        'keyword': item.get('keyword'),
+        'title': item.get('title', ''),
+        'link': link,
+        'summary': item.get('summary') or item.get('description') or '',
+        'content': None if content == MISSING_CONTENT else content,
+        'published': published,
+        'collected_at': to_timestamp(datetime.fromtimestamp(collected_at or time.time(), timezone.utc)),
+        'guid': item.get('guid') or link,
+    }
+    for field in ('source', 'category', 'keyword', 'title', 'link', 'summary', 'content', 'guid'):
+        if record[field] is not None and not isinstance(record[field], str):
+            raise TypeError(f"{field} 필드는 문자열이어야 합니다: {record[field]!r}")
+    return record
+
+
+class ArticleArchive:
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or DEFAULT_ARCHIVE_DIR
+        os.makedirs(self.root, exist_ok=True)
+
+    def path_for(self, month: str) -> str:
+        return os.path.join(self.root, f'articles-{month}.jsonl')
+
+    def months(self) -> List[str]:
+        """아카이브가 있는 달 목록 ('YYYY-MM', 오래된 순)"""
+        names = glob.glob(os.path.join(self.root, 'articles-*.jsonl'))
+        return sorted(os.path.basename(name)[len('articles-'):-len('.jsonl')] for name in names)
+
+    def append(self, items: Iterable[Dict], source: Optional[str] = None) -> int:
+        """기사들을 이번 달 파일에 덧붙이고 기록한 개수 반환 (한 번의 write로 추가)"""
+        now = time.time()
+        lines = [dumps(to_record(item, source=source, collected_at=now)) + b'\n' for item in items]
+        if not lines:
+            return 0
+        with open(self.path_for(datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m')), 'ab') as f:
+            f.write(b''.join(lines))
+        return len(lines)
+
+    def read_month(self, month: str) -> Iterator[Dict]:
+        """한 달 파일의 레코드를 한 줄씩 생성 (쓰다 끊긴 줄은 건너뜀)"""
+        with open(self.path_for(month), 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield loads(line)
+                except ValueError:
+                    continue
+
+    def read_month_from(self, month: str, offset: int = 0) -> Iterator[Tuple[Dict, int]]:
+        """offset 바이트 이후에 추가된 레코드와 그 줄이 끝나는 위치 (증분 내보내기용)
+
+        아직 줄바꿈까지 쓰이지 않은 마지막 줄은 다음 호출에서 읽도록 남겨 둡니다.
+        """
+        with open(self.path_for(month), 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield loads(line), offset
+                except ValueError:
+                    continue
+
+    def iter_records(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                     source: Optional[str] = None, unique: bool = False) -> Iterator[Dict]:
+        """수집 시각 기준으로 [since, until] 구간의 레코드를 한 줄씩 생성
+
+        unique=True이면 같은 기사(id)는 처음 기록만 내보냅니다 (id 집합만큼 메모리 사용).
+        """
+        since_key = to_timestamp(since) if since else None
+        until_key = to_timestamp(until) if until else None
+        seen = set()
+        for month in self.months():
+            if since_key and month < since_key[:7] or until_key and month > until_key[:7]:
+                continue  # 구간 밖의 달은 파일을 열지 않음
+            for record in self.read_month(month):
+                collected = record['collected_at']
+                if since_key and collected < since_key or until_key and collected > until_key:
+                    continue
+                if source and record['source'] != source:
+                    continue
+                if unique:
+                    if record['id'] in seen:
+                        continue
+                    seen.add(record['id'])
+                yield record
+
+    def recent(self, limit: int = 10, source: Optional[str] = None) -> List[Dict]:
+        """가장 최근에 기록한 레코드 limit개 (최근 달부터 거슬러 읽음)"""
+        result: List[Dict] = []
+        for month in reversed(self.months()):
+            tail = deque(maxlen=limit - len(result))
+            for record in self.read_month(month):
+                if source is None or record['source'] == source:
+                    tail.append(record)
+            result = list(tail) + result
+            if len(result) >= limit:
+                break
+        return result
+
+
+# 사용 예시
+def main():
+    archive = ArticleArchive()
+    if len(sys.argv) > 1 and sys.argv[1] == 'tail':
+        source = sys.argv[2] if len(sys.argv) > 2 else None
+        for record in archive.recent(int(sys.argv[3]) if len(sys.argv) > 3 else 10, source=source):
+            print(f"[{record['collected_at']}] [{record['source']}/{record['category']}] {record['title']}")
+        return
+    for month in archive.months():
+        counts: Dict[str, int] = {}
+        for record in archive.read_month(month):
+            counts[record['source']] = counts.get(record['source'], 0) + 1
+        size = os.path.getsize(archive.path_for(month))
+        print(f"{month}: {sum(counts.values())}건 ({size:,} bytes) " +
+              ', '.join(f"{name} {count}" for name, count in counts.items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+기사 저장소 (SQLite)
+모든 수집기의 기사를 하나의 WAL 모드 SQLite DB(data/articles.db)에 URL 기준으로 모읍니다.
+URL/소스/카테고리/키워드/발행 시각 인덱스가 있어 "최근 48시간 경제 기사 중 아직 글로 쓰지 않은 것" 같은
+날짜를 넘나드는 조회를 파일을 모두 읽지 않고 바로 할 수 있습니다.
+
+사용법:
+    python src/storage/article_store.py import    # 기존 날짜별 JSON 폴더 가져오기
+    python src/storage/article_store.py recent [시간] [카테고리]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.content_cache import normalize_url
+from src.storage.article_archive import to_record, to_timestamp
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, 'data', 'articles.db')
+
+# 기존 날짜별 JSON 폴더 → 폴더에 저장된 기사의 기본 소스
+LEGACY_JSON_DIRS = {
+    os.path.join(PROJECT_ROOT, 'data', 'bbc_news_json'): 'BBC',
+    os.path.join(PROJECT_ROOT, 'data', 'korean_news_json'): '연합뉴스',
+    os.path.join(PROJECT_ROOT, 'korea_agent', 'korean_news_json'): '연합뉴스',
+    os.path.join(PROJECT_ROOT, 'data', 'naver_trend_json'): '네이버뉴스',
+}
+COLUMNS = ('url_key', 'url', 'source', 'category', 'keyword', 'title', 'summary', 'content',
+           'published', 'collected_at', 'guid')
+
+
+class ArticleStore:
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # 여러 프로세서가 동시에 쓸 수 있으므로 잠금 대기 시간을 넉넉히
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                url_key TEXT NOT NULL UNIQUE,
+                url TEXT NOT NULL,
+                source TEXT,
+                category TEXT,
+                keyword TEXT,
+                title TEXT NOT NULL,
+                summary TEXT,
+                content TEXT,
+                published TEXT,
+                collected_at TEXT NOT NULL,
+                guid TEXT,
+                posted_at TEXT
+            )
+        """)
+        # published는 UTC ISO 문자열이므로 문자열 비교로 범위 조회 가능
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source, published)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category, published)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_keyword ON articles(keyword, published)")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_unposted ON articles(published) WHERE posted_at IS NULL"
+        )
+        self.conn.commit()
+
+    def upsert(self, items: Iterable[Dict], source: Optional[str] = None, keyword: Optional[str] = None) -> int:
+        """기사들을 한 트랜잭션으로 추가/갱신 (같은 URL이면 비어 있지 않은 새 값으로 덮어씀)"""
+        now = time.time()
+        rows = []
+        for item in items:
+            record = to_record(item, source=source, collected_at=now)
+            if not record['link']:
+                continue
+            rows.append((
+                normalize_url(record['link']), record['link'], record['source'], record['category'],
+                keyword or record['keyword'], record['title'], record['summary'], record['content'],
+                record['published'], record['collected_at'], record['guid'],
+            ))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO articles ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+                "ON CONFLICT(url_key) DO UPDATE SET "
+                "title = excluded.title, "
+                "summary = COALESCE(NULLIF(excluded.summary, ''), articles.summary), "
+                "content = COALESCE(excluded.content, articles.content), "
+                "category = COALESCE(excluded.category, articles.category), "
+                "keyword = COALESCE(articles.keyword, excluded.keyword), "
+                "published = COALESCE(excluded.published, articles.published)",
+                rows
+            )
+        return len(rows)
+
+    def query(self, source: Optional[str] = None, category: Optional[str] = None,
+              keyword: Optional[str] = None, since: Optional[datetime] = None,
+              until: Optional[datetime] = None, unposted: bool = False,
+              limit: Optional[int] = None) -> List[Dict]:
+        """조건에 맞는 기사 (발행 시각 최신순)"""
+        conditions, params = [], []
+        for column, value in (('source', source), ('category', category), ('keyword', keyword)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("published >= ?")
+            params.append(to_timestamp(since))
+        if until is not None:
+            conditions.append("published <= ?")
+            params.append(to_timestamp(until))
+        if unposted:
+            conditions.append("posted_at IS NULL")
+        sql = "SELECT * FROM articles"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY published DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._to_item(row) for row in self.conn.execute(sql, params)]
+
+    def recent(self, hours: float = 48, **filters) -> List[Dict]:
+        """최근 hours시간 안에 발행된 기사 (예: recent(48, category='economy', unposted=True))"""
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return self.query(since=since, **filters)
+
+    def get(self, url: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM articles WHERE url_key = ?", (normalize_url(url),)).fetchone()
+        return self._to_item(row) if row is not None else None
+
+    def mark_posted(self, items: Iterable[Dict], posted_at: Optional[datetime] = None):
+        """블로그 글에 사용한 기사 기록 (unposted 조회에서 제외)"""
+        posted = to_timestamp(posted_at or datetime.now(timezone.utc))
+        keys = [(posted, normalize_url(item.get('originallink') or item['link'])) for item in items]
+        with self.conn:
+            self.conn.executemany("UPDATE articles SET posted_at = ? WHERE url_key = ?", keys)
+
+    @staticmethod
+    def _to_item(row: sqlite3.Row) -> Dict:
+        """DB 행 → 프로세서가 쓰는 뉴스 dict (link 키 사용)"""
+        item = dict(row)
+        item['link'] = item.pop('url')
+        del item['url_key']
+        return item
+
+    def import_json_dirs(self, dirs: Optional[Dict[str, str]] = None) -> int:
+        """기존 날짜별/키워드별 JSON 파일을 가져옴 (여러 번 실행해도 URL 기준으로 한 번만 저장)"""
+        total = 0
+        for directory, source in (dirs or LEGACY_JSON_DIRS).items():
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ {path} 읽기 실패: {e}")
+                    continue
+                count = 0
+                try:
+                    for keyword, items in _json_groups(data):
+                        # 키워드별 파일은 네이버 검색 결과
+                        default_source = '네이버뉴스' if keyword is not None else source
+                        count += self.upsert([{**item, 'source': item.get('source') or default_source}
+                                              for item in items], keyword=keyword)
+                except (TypeError, ValueError) as e:
+                    print(f"⚠️ {path} 가져오기 실패: {e}")
+                    continue
+                print(f"  {name}: {count}건")
+                total += count
+        return total
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def _json_groups(data):
+    """기존 JSON 파일 형식별로 (키워드, 기사 목록) 생성
+
+    - [기사, ...]: BBC/연합뉴스 날짜별 파일
+    - {"keyword": ..., "news": [...]}: 네이버 트렌드 요약 파일
+    - {키워드: [기사, ...]}: korea_agent 네이버 키워드별 파일
+    """
+    if isinstance(data, list):
+        yield None, data
+    elif isinstance(data, dict) and 'news' in data:
+        yield data.get('keyword'), data['news']
+    elif isinstance(data, dict):
+        for keyword, items in data.items():
+            if isinstance(items, list):
+                yield keyword, items
+
+
+# 사용 예시
+def main():
+    store = ArticleStore()
+    if len(sys.argv) > 1 and sys.argv[1] == 'import':
+        print(f"📥 기존 JSON 가져오기 완료: {store.import_json_dirs()}건 (전체 {len(store)}건)")
+    else:
+        hours = float(sys.argv[2]) if len(sys.argv) > 2 else 48
+        category = sys.argv[3] if len(sys.argv) > 3 else None
+        for item in store.recent(hours, category=category, unposted=True):
+            print(f"[{item['published']}] [{item['source']}/{item['category'] or item['keyword']}] {item['title']}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
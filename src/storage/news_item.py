@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+공용 뉴스 항목 모델
+모든 수집기(BBC, 연합뉴스, 네이버)가 같은 __slots__ 기반 NewsItem을 만듭니다.
+- 발행 시각은 UTC 기준 datetime 하나로만 보관 (published / published_date는 같은 값)
+- source/category/keyword 문자열은 sys.intern으로 공유
+- 기존 코드가 dict처럼 쓰던 방식(item['title'], item.get(...), {**item})은 그대로 동작
+- 아카이브 레코드로 바로 변환 (중간 dict를 만들거나 날짜를 다시 파싱하지 않음)
+"""
+
+import hashlib
+import html
+import sys
+import time
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+
+from src.scrapers.dedup import TAG_RE
+from src.storage.seen_index import item_key
+
+SCHEMA_VERSION = 1
+MISSING_CONTENT = "(본문을 가져오지 못했습니다.)"
+
+FIELDS = ('title', 'link', 'summary', 'published', 'source', 'category', 'keyword', 'content', 'guid')
+FIELD_SET = frozenset(FIELDS)
+INTERNED_FIELDS = frozenset(('source', 'category', 'keyword'))
+# 수집기마다 달랐던 키 이름 → 공용 필드
+ALIASES = {'published_date': 'published', 'originallink': 'link', 'description': 'summary'}
+
+
+def canonical_time(value) -> Optional[datetime]:
+    """datetime / ISO·RFC 822 문자열 / published_parsed(튜플) → UTC 기준 시간대 없는 datetime"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            value = parsedate_to_datetime(text)  # 네이버/RSS pubDate (형식이 틀리면 ValueError)
+    elif isinstance(value, (tuple, list, time.struct_time)):
+        value = datetime(*tuple(value)[:6])
+    if not isinstance(value, datetime):
+        raise TypeError(f"발행일로 쓸 수 없는 값입니다: {value!r}")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _naver_time(item: Dict) -> Optional[datetime]:
+    """네이버 pubDate → datetime (읽을 수 없으면 None, 기사 하나 때문에 검색 결과 전체를 버리지 않도록)"""
+    try:
+        return canonical_time(item.get('pubDate'))
+    except (TypeError, ValueError, IndexError):
+        print(f"⚠️ 발행일을 읽을 수 없어 비워 둡니다: {item.get('pubDate')!r} ({item.get('originallink') or item.get('link')})")
+        return None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class NewsItem(MutableMapping):
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, title: str = '', link: str = '', summary: str = '', published=None,
+                 source: Optional[str] = None, category: Optional[str] = None, keyword: Optional[str] = None,
+                 content: Optional[str] = None, guid: Optional[str] = None, **extra):
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = canonical_time(published)
+        self.source = _intern(source)
+        self.category = _intern(category)
+        self.keyword = _intern(keyword)
+        self.content = content
+        self.guid = guid
+        self.extra: Optional[Dict[str, Any]] = extra or None  # 파이프라인 단계에서 붙이는 값 (feed, signal 등)
+
+    # ---- 수집기별 생성 ----
+
+    @classmethod
+    def from_feed_entry(cls, entry: Dict, source: str, category: Optional[str] = None) -> 'NewsItem':
+        """compact 피드 항목(feed_parser/rss_stream) → NewsItem"""
+        return cls(
+            title=entry['title'].strip(),
+            link=entry['link'],
+            summary=TAG_RE.sub('', entry.get('summary') or '').strip(),
+            published=entry.get('published_parsed'),
+            source=source,
+            category=category,
+            guid=entry.get('guid'),
+        )
+
+    @classmethod
+    def from_naver(cls, item: Dict, keyword: Optional[str] = None) -> 'NewsItem':
+        """네이버 검색 API 항목 → NewsItem (원문 링크 하나만 보관, <b> 태그 제거)"""
+        return cls(
+            title=html.unescape(TAG_RE.sub('', item.get('title') or '')).strip(),
+            link=item.get('originallink') or item.get('link', ''),
+            summary=html.unescape(TAG_RE.sub('', item.get('description') or '')).strip(),
+            published=_naver_time(item),
+            source='네이버뉴스',
+            keyword=keyword,
+            guid=item.get('link'),
+        )
+
+    @classmethod
+    def from_record(cls, record: Dict) -> 'NewsItem':
+        """아카이브 레코드 → NewsItem"""
+        return cls(
+            title=record['title'], link=record['link'], summary=record['summary'],
+            published=record['published'], source=record['source'], category=record['category'],
+            keyword=record['keyword'], content=record['content'], guid=record['guid'],
+        )
+
+    def to_record(self, source: Optional[str] = None, collected_at: Optional[float] = None) -> Dict:
+        """아카이브 레코드 (article_archive.ARCHIVE_FIELDS 순서)"""
+        collected = datetime.fromtimestamp(collected_at or time.time(), timezone.utc).replace(tzinfo=None)
+        return {
+            'v': SCHEMA_VERSION,
+            'id': hashlib.sha1(item_key(self).encode('utf-8')).hexdigest()[:16],
+            'source': source or self.source,
+            'category': self.category,
+            'keyword': self.keyword,
+            'title': self.title,
+            'link': self.link,
+            'summary': self.summary,
+            'content': None if self.content == MISSING_CONTENT else self.content,
+            'published': self.published.isoformat(timespec='seconds') if self.published else None,
+            'collected_at': collected.isoformat(timespec='seconds'),
+            'guid': self.guid or self.link,
+        }
+
+    # ---- dict 호환 (값이 None인 필드는 없는 키로 취급) ----
+
+    def __getitem__(self, key: str):
+        key = ALIASES.get(key, key)
+        if key in FIELD_SET:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        key = ALIASES.get(key, key)
+        if key == 'published':
+            value = canonical_time(value)
+        elif key in INTERNED_FIELDS:
+            value = _intern(value)
+        if key in FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        key = ALIASES.get(key, key)
+        if key in FIELD_SET:
+            if getattr(self, key) is None:
+                raise KeyError(key)
+            setattr(self, key, None)
+        elif self.extra is not None and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in FIELDS:
+            if getattr(self, field) is not None:
+                yield field
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"NewsItem(source={self.source!r}, category={self.category!r}, title={self.title!r})"
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+분석용 Parquet 내보내기
+아카이브 기사(data/archive/*.jsonl)와 생성한 블로그 글(data/blog_posts/*.md)을 월/소스별로 나눈
+Parquet 데이터셋(data/parquet/articles, data/parquet/posts)으로 내보냅니다.
+- source/category/keyword는 딕셔너리 인코딩 (반복되는 문자열을 한 번만 저장)
+- 아카이브 파일별로 읽은 위치를 기록해 다음 실행에서는 새로 추가된 줄만 내보냄
+- 읽을 때는 월 파티션과 발행 시각 통계로 필요 없는 파일/행 그룹을 건너뜀
+pyarrow가 필요합니다 (없으면 내보내기/조회 시 안내 메시지와 함께 RuntimeError).
+
+사용법:
+    python src/storage/parquet_export.py export
+    python src/storage/parquet_export.py trend [category|keyword|source] [시작일] [종료일]
+    python src/storage/parquet_export.py compact
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.storage.article_archive import ArticleArchive, to_timestamp
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_EXPORT_DIR = os.path.join(PROJECT_ROOT, 'data', 'parquet')
+DEFAULT_POSTS_DIR = os.path.join(PROJECT_ROOT, 'data', 'blog_posts')
+BATCH_ROWS = 50000  # 한 번에 쓰는 최대 행 수 (메모리 상한)
+PARTITIONS = ['month', 'source']
+TIME_COLUMNS = {'articles': 'published', 'posts': 'created_at'}
+KEY_COLUMNS = {'articles': 'id', 'posts': 'file'}  # 같은 기사/글을 가리키는 열
+POST_NAME_RE = re.compile(r'^blog_(?:(KoreanNews)_)?(.*?)_(\d{4}-\d{2}-\d{2})\.md$')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다 (pip install pyarrow).")
+
+
+def _dict_string():
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def article_schema():
+    return pa.schema([
+        ('id', pa.string()),
+        ('source', _dict_string()),
+        ('category', _dict_string()),
+        ('keyword', _dict_string()),
+        ('title', pa.string()),
+        ('link', pa.string()),
+        ('summary', pa.string()),
+        ('content', pa.string()),
+        ('published', pa.timestamp('s')),
+        ('collected_at', pa.timestamp('s')),
+        ('month', pa.string()),
+    ])
+
+
+def post_schema():
+    return pa.schema([
+        ('file', pa.string()),
+        ('title', pa.string()),
+        ('source', _dict_string()),
+        ('created_at', pa.timestamp('s')),
+        ('chars', pa.int32()),
+        ('sha256', pa.string()),
+        ('month', pa.string()),
+    ])
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _article_row(record: Dict) -> Dict:
+    """아카이브 레코드 → 내보낼 행 (발행일이 없으면 수집 월에 넣음)"""
+    published = _parse_time(record.get('published'))
+    collected = _parse_time(record['collected_at'])
+    return {
+        'id': record['id'],
+        'source': record.get('source') or 'unknown',
+        'category': record.get('category'),
+        'keyword': record.get('keyword'),
+        'title': record.get('title'),
+        'link': record.get('link'),
+        'summary': record.get('summary'),
+        'content': record.get('content'),
+        'published': published,
+        'collected_at': collected,
+        'month': (published or collected).strftime('%Y-%m'),
+    }
+
+
+def _post_row(path: str) -> Dict:
+    """블로그 글 파일 → 내보낼 행 (소스와 날짜는 save_blog_post가 만든 파일 이름에서)"""
+    with open(path, 'rb') as f:
+        body = f.read()
+    text = body.decode('utf-8', errors='replace')
+    name = os.path.basename(path)
+    match = POST_NAME_RE.match(name)
+    title = next((line[2:].strip() for line in text.splitlines() if line.startswith('# ')), None)
+    if match:
+        created = datetime.strptime(match.group(3), '%Y-%m-%d')
+        source = '연합뉴스' if match.group(1) else 'BBC'
+        title = title or match.group(2).replace('_', ' ')
+    else:
+        created = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc).replace(tzinfo=None)
+        source = 'unknown'
+    return {
+        'file': name,
+        'title': title or name,
+        'source': source,
+        'created_at': created,
+        'chars': len(text),
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'month': created.strftime('%Y-%m'),
+    }
+
+
+class ParquetExporter:
+    def __init__(self, root: Optional[str] = None, archive: Optional[ArticleArchive] = None,
+                 posts_dir: Optional[str] = None):
+        self.root = root or DEFAULT_EXPORT_DIR
+        self.archive = archive or ArticleArchive()
+        self.posts_dir = posts_dir or DEFAULT_POSTS_DIR
+        self.state_path = os.path.join(self.root, 'export_state.json')
+        os.makedirs(self.root, exist_ok=True)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'articles': {}, 'posts': {}}
+
+    def _save_state(self):
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def dataset_dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _write(self, name: str, rows: List[Dict], schema):
+        """행 묶음을 새 파일로 추가 (기존 파일은 건드리지 않음)"""
+        table = pa.Table.from_pylist(rows, schema=schema)
+        ds.write_dataset(
+            table, self.dataset_dir(name), format='parquet',
+            partitioning=PARTITIONS, partitioning_flavor='hive',
+            basename_template=f"part-{time.time_ns()}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+        )
+
+    def export_articles(self) -> int:
+        """아카이브에 새로 추가된 레코드를 내보내고 행 수 반환
+
+        배치를 쓴 뒤에 읽은 위치를 저장하므로, 그 사이에 중단되면 다음 실행에서 그 배치가 한 번 더 들어갈 수
+        있습니다.
+        같은 기사가 여러 번 아카이브에 기록된 경우도 그대로 내보내며, 중복은 compact가 id별로 정리하고 trend는 id를 한 번만 셉니다.
+        """
+        _require_pyarrow()
+        offsets = self.state.setdefault('articles', {})
+        total = 0
+        for month in self.archive.months():
+            rows: List[Dict] = []
+            offset = offsets.get(month, 0)
+            if offset >= os.path.getsize(self.archive.path_for(month)):
+                continue
+            for record, end in self.archive.read_month_from(month, offset):
+                rows.append(_article_row(record))
+                offset = end
+                if len(rows) >= BATCH_ROWS:
+                    self._write('articles', rows, article_schema())
+                    total += len(rows)
+                    rows = []
+                    offsets[month] = offset
+                    self._save_state()
+            if rows:
+                self._write('articles', rows, article_schema())
+                total += len(rows)
+            offsets[month] = offset
+            self._save_state()
+        return total
+
+    def export_posts(self) -> int:
+        """아직 내보내지 않았거나 내용이 바뀐 블로그 글을 내보내고 행 수 반환"""
+        _require_pyarrow()
+        exported = self.state.setdefault('posts', {})
+        rows = []
+        for path in sorted(glob.glob(os.path.join(self.posts_dir, '*.md'))):
+            name = os.path.basename(path)
+            mtime = os.path.getmtime(path)
+            if exported.get(name) == mtime:
+                continue
+            rows.append(_post_row(path))
+            exported[name] = mtime
+        if rows:
+            self._write('posts', rows, post_schema())
+            self._save_state()
+        return len(rows)
+
+    def export(self) -> Dict[str, int]:
+        return {'articles': self.export_articles(), 'posts': self.export_posts()}
+
+    def _latest_rows(self, name: str, base: str) -> Dict[str, Tuple[str, int]]:
+        """키(기사 id / 글 파일 이름) → 남길 행의 (Parquet 파일 경로, 행 번호)
+
+        기사는 collected_at이 가장 늦은 행을, 수정 후 다시 내보낸 글은 가장 나중에 쓴 파일(part-<time_ns>)의 행을 남깁니다.
+        """
+        key_column = KEY_COLUMNS[name]
+        columns = [key_column, 'collected_at'] if name == 'articles' else [key_column]
+        paths = sorted(glob.glob(os.path.join(base, '**', '*.parquet'), recursive=True), key=os.path.basename)
+        ranks: Dict[str, datetime] = {}
+        latest: Dict[str, Tuple[str, int]] = {}
+        for path in paths:
+            table = pq.read_table(path, columns=columns, partitioning=None)
+            keys = table[key_column].to_pylist()
+            collected = table['collected_at'].to_pylist() if name == 'articles' else [None] * len(keys)
+            for row, (key, rank) in enumerate(zip(keys, collected)):
+                rank = rank or datetime.min
+                if key not in ranks or rank >= ranks[key]:  # 같으면 나중에 쓴 쪽
+                    ranks[key] = rank
+                    latest[key] = (path, row)
+        return latest
+
+    def compact(self, name: str = 'articles') -> int:
+        """파티션마다 쌓인 작은 증분 파일들을 발행 시각 순으로 정렬한 파일 하나로 합치고, 합친 파티션 수 반환
+
+        같은 기사(id)나 같은 글(file)의 행은 가장 최근 것 하나만 남깁니다 (여러 번 수집·내보낸 항목이 중복으로 세어지지 않도록).
+        """
+        _require_pyarrow()
+        merged = 0
+        base = self.dataset_dir(name)
+        key_column = KEY_COLUMNS[name]
+        latest = self._latest_rows(name, base)
+        for directory, _, files in os.walk(base):
+            parts = sorted(f for f in files if f.endswith('.parquet'))
+            paths = [os.path.join(directory, f) for f in parts]
+            tables = [pq.read_table(path, partitioning=None) for path in paths]
+            stale = False
+            for i, path in enumerate(paths):
+                keep = pa.array([latest[key] == (path, row)
+                                 for row, key in enumerate(tables[i][key_column].to_pylist())], pa.bool_())
+                if not pc.all(keep).as_py():
+                    tables[i] = tables[i].filter(keep)
+                    stale = True
+            if len(parts) < 2 and not stale:
+                continue
+            table = pa.concat_tables(tables).sort_by(TIME_COLUMNS[name])
+            if table.num_rows:
+                tmp_path = os.path.join(directory, f"part-{time.time_ns()}-0.parquet.tmp")
+                pq.write_table(table, tmp_path, compression='zstd')
+                os.replace(tmp_path, tmp_path[:-len('.tmp')])
+            for path in paths:
+                os.remove(path)
+            merged += 1
+        return merged
+
+    # ---- 조회 ----
+
+    def dataset(self, name: str = 'articles'):
+        _require_pyarrow()
+        return ds.dataset(self.dataset_dir(name), format='parquet', partitioning='hive')
+
+    def read(self, name: str = 'articles', columns: Optional[List[str]] = None,
+             since: Optional[datetime] = None, until: Optional[datetime] = None,
+             source: Optional[str] = None, **equals):
+        """조건에 맞는 행을 pyarrow Table로 반환
+
+        월/소스 조건은 파티션 디렉터리를 고르는 데, 시각 조건은 Parquet 행 그룹 통계로 건너뛰는 데 쓰입니다.
+        equals: 다른 열의 일치 조건 (예: category='economy')
+        """
+        time_column = TIME_COLUMNS[name]
+        conditions = []
+        if since is not None:
+            since_key = to_timestamp(since)
+            conditions.append(ds.field('month') >= since_key[:7])
+            conditions.append(ds.field(time_column) >= pa.scalar(datetime.fromisoformat(since_key), pa.timestamp('s')))
+        if until is not None:
+            until_key = to_timestamp(until)
+            conditions.append(ds.field('month') <= until_key[:7])
+            conditions.append(ds.field(time_column) <= pa.scalar(datetime.fromisoformat(until_key), pa.timestamp('s')))
+        if source is not None:
+            conditions.append(ds.field('source') == source)
+        for column, value in equals.items():
+            conditions.append(ds.field(column) == value)
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return self.dataset(name).to_table(columns=columns, filter=expression)
+
+    def trend(self, by: str = 'category', unit: str = 'day', name: str = 'articles', **filters) -> List[Dict]:
+        """기간(unit: day/week/month)별·열 값별 건수 (예: 카테고리별 일간 기사 수)
+
+        아직 compact하지 않아 같은 기사가 여러 행으로 남아 있어도 id(글은 file)를 한 번만 셉니다.
+        """
+        time_column = TIME_COLUMNS[name]
+        key_column = KEY_COLUMNS[name]
+        table = self.read(name, columns=[by, time_column, key_column], **filters)
+        table = table.filter(pc.is_valid(table[time_column]))
+        values = table[by]
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(pa.string())
+        period = pc.floor_temporal(table[time_column], unit=unit)
+        counts = pa.table({'period': period, by: values, 'key': table[key_column]}).group_by(['period', by]) \
+            .aggregate([('key', 'count_distinct')])
+        rows = counts.rename_columns(['period', by, 'count']).to_pylist()
+        return sorted(rows, key=lambda row: (row['period'], -row['count']))
+
+
+# 사용 예시
+def main():
+    exporter = ParquetExporter()
+    command = sys.argv[1] if len(sys.argv) > 1 else 'export'
+    if command == 'export':
+        counts = exporter.export()
+        print(f"📦 Parquet 내보내기 완료: 기사 {counts['articles']}건, 블로그 글 {counts['posts']}건")
+    elif command == 'compact':
+        print(f"🧹 합친 파티션: 기사 {exporter.compact('articles')}개, 블로그 글 {exporter.compact('posts')}개")
+    elif command == 'trend':
+        by = sys.argv[2] if len(sys.argv) > 2 else 'category'
+        since = datetime.fromisoformat(sys.argv[3]) if len(sys.argv) > 3 else None
+        until = datetime.fromisoformat(sys.argv[4]) if len(sys.argv) > 4 else None
+        started = time.perf_counter()
+        rows = exporter.trend(by, since=since, until=until)
+        for row in rows:
+            print(f"{row['period']:%Y-%m-%d}  {row[by] or '-'}: {row['count']}")
+        print(f"({len(rows)}행, {time.perf_counter() - started:.2f}초)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+블로그 글 발행 대기열 (SQLite)
+생성한 블로그 글을 data/posts.db에 파일 경로·내용 해시·상태와 함께 기록하고, 포스터는 여기서 다음 글을 가져갑니다.
+상태: generated → queued → posting → published / failed (failed는 다시 queued로)
+상태 변경은 BEGIN IMMEDIATE 트랜잭션 안에서 현재 상태를 확인하고 바꾸므로, 여러 파이프라인이나 포스터가 동시에
+실행돼도 같은 글을 두 번 가져가거나 서로의 기록을 덮어쓰지 않습니다.
+다음에 발행할 글은 queued 글만 담는 부분 인덱스의 첫 항목이므로 글이 아무리 쌓여도 바로 찾습니다.
+
+사용법:
+    python src/storage/post_registry.py list [상태]
+    python src/storage/post_registry.py requeue <파일 경로>   # 실패한 글 다시 대기열에
+    python src/storage/post_registry.py requeue-stale [초]    # posting에 멈춘 글 다시 대기열에 (기본 3600초)
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, 'data', 'posts.db')
+
+STATES = ('generated', 'queued', 'posting', 'published', 'failed')
+# 상태별로 옮겨 갈 수 있는 상태
+TRANSITIONS = {
+    'generated': ('queued', 'posting'),
+    'queued': ('posting',),
+    'posting': ('published', 'failed', 'queued'),
+    'failed': ('queued', 'posting'),
+    'published': (),
+}
+# 상태에 들어갈 때 기록하는 시각 열
+STATE_TIME_COLUMNS = {
+    'queued': 'queued_at',
+    'posting': 'posting_at',
+    'published': 'published_at',
+    'failed': 'failed_at',
+}
+
+
+class PostStateError(Exception):
+    """허용되지 않는 상태 변경 (이미 다른 포스터가 가져간 글 등)"""
+
+
+def _now() -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime())
+
+
+def _file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class PostRegistry:
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # 트랜잭션은 직접 BEGIN IMMEDIATE로 시작 (읽고 바꾸는 사이에 다른 프로세스가 끼어들지 않도록)
+        self.conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                title TEXT,
+                source TEXT,
+                content_hash TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                queued_at TEXT,
+                posting_at TEXT,
+                published_at TEXT,
+                failed_at TEXT
+            )
+        """)
+        # 대기 중인 글만 담는 인덱스: 다음 글 조회는 이 인덱스의 첫 항목
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posts_queue ON posts(queued_at, id) WHERE state = 'queued'"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_state ON posts(state, updated_at)")
+
+    def _begin(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def _get(self, path: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM posts WHERE path = ?", (os.path.abspath(path),)).fetchone()
+
+    def _set_state(self, post_id: int, state: str, error: Optional[str] = None):
+        now = _now()
+        columns = "state = ?, updated_at = ?, error = ?"
+        params: list = [state, now, error]
+        if state in STATE_TIME_COLUMNS:
+            columns += f", {STATE_TIME_COLUMNS[state]} = ?"
+            params.append(now)
+        if state == 'posting':
+            columns += ", attempts = attempts + 1"
+        self.conn.execute(f"UPDATE posts SET {columns} WHERE id = ?", params + [post_id])
+
+    def register(self, path: str, title: Optional[str] = None, source: Optional[str] = None,
+                 enqueue: bool = True) -> Dict:
+        """생성한 글을 기록하고 (enqueue=True이면) 발행 대기열에 넣음
+
+        같은 경로에 다시 저장된 글은 내용이 바뀐 경우에만 다시 대기열에 넣습니다.
+        이미 발행한 글은 내용이 바뀌어도 상태를 그대로 두어 같은 글이 두 번 발행되지 않게 합니다.
+        """
+        path = os.path.abspath(path)
+        content_hash = _file_hash(path)
+        state = 'queued' if enqueue else 'generated'
+        now = _now()
+        self._begin()
+        try:
+            row = self._get(path)
+            if row is None:
+                self.conn.execute(
+                    "INSERT INTO posts (path, title, source, content_hash, state, created_at, updated_at, queued_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, title, source, content_hash, state, now, now, now if enqueue else None)
+                )
+            elif row['content_hash'] != content_hash and row['state'] == 'published':
+                # 발행한 글은 끝난 상태: 같은 경로에 다시 저장돼도 해시만 갱신하고 대기열에 넣지 않음
+                self.conn.execute(
+                    "UPDATE posts SET content_hash = ?, updated_at = ? WHERE id = ?", (content_hash, now, row['id'])
+                )
+            elif row['content_hash'] != content_hash and row['state'] != 'posting':
+                self.conn.execute(
+                    "UPDATE posts SET title = COALESCE(?, title), source = COALESCE(?, source), content_hash = ?, "
+                    "state = ?, error = NULL, created_at = ?, updated_at = ?, queued_at = ? WHERE id = ?",
+                    (title, source, content_hash, state, now, now, now if enqueue else None, row['id'])
+                )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return dict(self._get(path))
+
+    def transition(self, path: str, state: str, error: Optional[str] = None) -> Dict:
+        """글 하나의 상태를 바꿈 (현재 상태에서 허용되지 않는 변경이면 PostStateError)"""
+        if state not in STATES:
+            raise ValueError(f"알 수 없는 상태입니다: {state}")
+        self._begin()
+        try:
+            row = self._get(path)
+            if row is None:
+                raise PostStateError(f"등록되지 않은 글입니다: {path}")
+            if state not in TRANSITIONS[row['state']]:
+                raise PostStateError(f"{row['state']} → {state} 변경은 허용되지 않습니다: {path}")
+            self._set_state(row['id'], state, error)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return dict(self._get(path))
+
+    def claim_next(self, source: Union[str, Tuple[str, ...], None] = None) -> Optional[Dict]:
+        """가장 먼저 대기열에 들어간 글을 posting 상태로 가져감 (없으면 None)
+
+        source(소스 이름 또는 튜플)를 주면 그 소스의 글만 가져갑니다 (다른 파이프라인의 글을 올리지 않도록).
+        """
+        # 통계가 없으면 SQLite가 state 인덱스를 골라 정렬을 따로 하므로 대기열 인덱스를 지정
+        sql = "SELECT * FROM posts INDEXED BY idx_posts_queue WHERE state = 'queued'"
+        params: list = []
+        if source is not None:
+            sources = (source,) if isinstance(source, str) else tuple(source)
+            sql += f" AND source IN ({', '.join('?' * len(sources))})"
+            params.extend(sources)
+        sql += " ORDER BY queued_at, id LIMIT 1"
+        self._begin()
+        try:
+            row = self.conn.execute(sql, params).fetchone()
+            if row is not None:
+                self._set_state(row['id'], 'posting')
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return dict(self._get(row['path'])) if row is not None else None
+
+    def claim(self, path: str, title: Optional[str] = None, source: Optional[str] = None) -> Dict:
+        """지정한 파일을 posting 상태로 가져감 (등록되지 않은 파일이면 먼저 등록)"""
+        if self._get(path) is None:
+            self.register(path, title=title, source=source)
+        return self.transition(path, 'posting')
+
+    def mark_published(self, path: str) -> Dict:
+        return self.transition(path, 'published')
+
+    def mark_failed(self, path: str, error: Optional[str] = None) -> Dict:
+        return self.transition(path, 'failed', error=error)
+
+    def requeue(self, path: str) -> Dict:
+        """실패했거나 posting에서 멈춘 글을 다시 대기열에"""
+        return self.transition(path, 'queued')
+
+    def requeue_stale(self, max_seconds: float = 3600) -> int:
+        """posting 상태로 max_seconds 넘게 남은 글(포스터가 중간에 죽은 경우)을 다시 대기열에 넣고 개수 반환"""
+        cutoff = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(time.time() - max_seconds))
+        self._begin()
+        try:
+            rows = self.conn.execute(
+                "SELECT id FROM posts WHERE state = 'posting' AND posting_at < ?", (cutoff,)
+            ).fetchall()
+            for row in rows:
+                self._set_state(row['id'], 'queued', error='posting 시간 초과')
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def get(self, path: str) -> Optional[Dict]:
+        row = self._get(path)
+        return dict(row) if row is not None else None
+
+    def list(self, state: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """최근에 상태가 바뀐 글부터"""
+        if state is None:
+            rows = self.conn.execute("SELECT * FROM posts ORDER BY updated_at DESC, id DESC LIMIT ?", (limit,))
+        else:
+            rows = self.conn.execute(
+                "SELECT * FROM posts WHERE state = ? ORDER BY updated_at DESC, id DESC LIMIT ?", (state, limit)
+            )
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        return {row['state']: row['n'] for row in
+                self.conn.execute("SELECT state, COUNT(*) AS n FROM posts GROUP BY state")}
+
+    def close(self):
+        self.conn.close()
+
+
+# 사용 예시
+def main():
+    registry = PostRegistry()
+    if len(sys.argv) > 2 and sys.argv[1] == 'requeue':
+        post = registry.requeue(sys.argv[2])
+        print(f"🔁 다시 대기열에 넣었습니다: {post['title'] or post['path']}")
+    elif len(sys.argv) > 1 and sys.argv[1] == 'requeue-stale':
+        count = registry.requeue_stale(float(sys.argv[2]) if len(sys.argv) > 2 else 3600)
+        print(f"🔁 posting 상태로 멈춘 글 {count}개를 다시 대기열에 넣었습니다.")
+    else:
+        state = sys.argv[2] if len(sys.argv) > 2 else None
+        for post in registry.list(state):
+            print(f"[{post['state']}] {post['updated_at']} {post['title'] or '-'} ({post['source'] or '-'})")
+            print(f"    {post['path']}" + (f"  ⚠️ {post['error']}" if post['error'] else ''))
+        print(registry.counts())
+    registry.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+원문 HTML 저장소
+기사 응답 본문을 내용 해시(SHA-256)로 압축 저장하고, URL → 해시 색인을 SQLite에 둡니다.
+같은 페이지는 URL이나 실행이 달라도 한 번만 저장되며, 전체 크기가 한도를 넘으면 오래 쓰지 않은 것부터 지웁니다.
+본문 추출기를 고친 뒤에는 다시 요청하지 않고 저장된 원문에서 추출을 다시 실행할 수 있습니다.
+zstandard가 설치되어 있으면 zstd로, 없으면 zlib로 압축합니다 (읽을 때는 파일마다 기록된 방식 사용).
+크롤러는 압축·파일 쓰기가 이벤트 루프를 막지 않도록 put()을 asyncio.to_thread로 호출하므로, 연결은 스레드 간에
+공유하고 DB 작업은 잠금으로 한 번에 하나씩 실행합니다 (압축은 잠금 밖에서).
+
+사용법:
+    python src/storage/raw_store.py stats
+    python src/storage/raw_store.py gc [최대 MB]
+    python src/storage/raw_store.py reextract   # BBC/연합뉴스 추출기를 저장된 원문에 다시 실행해 본문 캐시 갱신
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.content_cache import normalize_url
+
+DEFAULT_STORE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'raw_pages'
+)
+GC_CHECK_EVERY = 100  # 저장 몇 번마다 크기 한도를 확인할지
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == 'zst':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zst':
+        if zstandard is None:
+            raise RuntimeError("zstd로 저장된 원문을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class RawPageStore:
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.root = root or DEFAULT_STORE_DIR
+        self.max_bytes = max_bytes  # 압축 후 전체 크기 한도 (None이면 GC 안 함)
+        self.codec = 'zst' if zstandard is not None else 'zz'
+        self.stats = {'stored': 0, 'deduplicated': 0, 'gc_removed': 0}
+        self._puts = 0
+        self._lock = threading.Lock()  # put()이 작업 스레드에서 동시에 호출되므로 DB 작업을 직렬화
+
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(self.root, 'index.db'), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                host TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                encoding TEXT,
+                complete INTEGER NOT NULL DEFAULT 1,
+                fetched_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_hash ON pages(hash)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_host ON pages(host)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_blobs_access ON blobs(last_access)")
+        self.conn.commit()
+
+    def _blob_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f'{digest}.{codec}')
+
+    def put(self, url: str, body: bytes, encoding: Optional[str] = None, complete: bool = True) -> str:
+        """응답 본문 저장 후 내용 해시 반환 (여러 스레드에서 동시에 호출 가능)
+
+        complete=False: 본문이 끝난 뒤 다운로드를 멈춘 앞부분만 저장한 경우 (연합뉴스 스트리밍 수집)
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            row = self.conn.execute("SELECT codec FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        stored = row is not None and os.path.exists(self._blob_path(digest, row[0]))
+        if not stored:
+            # 압축과 파일 쓰기는 잠금 밖에서 (같은 원문을 두 스레드가 동시에 써도 같은 내용으로 교체될 뿐)
+            path = self._blob_path(digest, self.codec)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = _compress(body, self.codec)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        now = time.time()
+        with self._lock:
+            with self.conn:
+                if stored:
+                    self.conn.execute("UPDATE blobs SET last_access = ? WHERE hash = ?", (now, digest))
+                    self.stats['deduplicated'] += 1
+                else:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO blobs (hash, codec, size, stored_size, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (digest, self.codec, len(body), len(data), now, now)
+                    )
+                    self.stats['stored'] += 1
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO pages (url_key, url, host, hash, encoding, complete, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (normalize_url(url), url, urlsplit(url).netloc.lower(), digest, encoding, int(complete), now)
+                )
+            self._puts += 1
+            check_gc = self.max_bytes is not None and self._puts % GC_CHECK_EVERY == 0
+        if check_gc:
+            self.gc()
+        return digest
+
+    def read_blob(self, digest: str) -> Optional[bytes]:
+        """해시로 원문 읽기 (없으면 None)"""
+        row = self.conn.execute("SELECT codec FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._blob_path(digest, row[0]), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        return _decompress(data, row[0])
+
+    def get(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """URL의 마지막 저장 원문과 인코딩 (없으면 None)"""
+        row = self.conn.execute(
+            "SELECT hash, encoding FROM pages WHERE url_key = ?", (normalize_url(url),)
+        ).fetchone()
+        if row is None:
+            return None
+        body = self.read_blob(row[0])
+        if body is None:
+            return None
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE blobs SET last_access = ? WHERE hash = ?", (time.time(), row[0]))
+        return body, row[1]
+
+    def iter_pages(self, hosts: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, bytes, Optional[str]]]:
+        """저장된 페이지를 (URL, 원문, 인코딩)으로 하나씩 (hosts를 주면 그 호스트들만)"""
+        query = "SELECT url, hash, encoding FROM pages"
+        params: Tuple = ()
+        if hosts is not None:
+            params = tuple(host.lower() for host in hosts)
+            query += f" WHERE host IN ({','.join('?' * len(params))})"
+        for url, digest, encoding in self.conn.execute(query, params).fetchall():
+            body = self.read_blob(digest)
+            if body is not None:
+                yield url, body, encoding
+
+    def reextract(self, extract: Callable[[bytes, str, Optional[str]], Optional[str]],
+                  hosts: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """저장된 원문에 추출 함수(원문, URL, 인코딩 → 본문)를 다시 실행 (네트워크 요청 없음)"""
+        return {url: extract(body, url, encoding) for url, body, encoding in self.iter_pages(hosts)}
+
+    def total_size(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+
+    def gc(self, max_bytes: Optional[int] = None) -> int:
+        """URL이 가리키지 않는 원문을 지우고, 그래도 한도를 넘으면 오래 쓰지 않은 원문부터 삭제 (삭제 수 반환)"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+        with self._lock, self.conn:
+            removed += self.conn.execute(
+                "SELECT hash, codec, stored_size FROM blobs WHERE hash NOT IN (SELECT hash FROM pages)"
+            ).fetchall()
+            total = self.total_size() - sum(size for _, _, size in removed)
+            if max_bytes is not None and total > max_bytes:
+                for digest, codec, size in self.conn.execute(
+                    "SELECT hash, codec, stored_size FROM blobs WHERE hash IN (SELECT hash FROM pages) "
+                    "ORDER BY last_access"
+                ):
+                    if total <= max_bytes:
+                        break
+                    removed.append((digest, codec, size))
+                    total -= size
+            for digest, _, _ in removed:
+                self.conn.execute("DELETE FROM pages WHERE hash = ?", (digest,))
+                self.conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        for digest, codec, _ in removed:
+            try:
+                os.remove(self._blob_path(digest, codec))
+            except OSError:
+                pass
+        self.stats['gc_removed'] += len(removed)
+        return len(removed)
+
+    def summary(self) -> Dict:
+        """저장 페이지/원문 수, 원본/압축 크기"""
+        pages = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        blobs, size, stored = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+        ).fetchone()
+        return {'pages': pages, 'blobs': blobs, 'raw_bytes': size, 'stored_bytes': stored, **self.stats}
+
+    def close(self):
+        self.conn.close()
+
+
+_default_store: Optional[RawPageStore] = None
+
+
+def default_store() -> Optional[RawPageStore]:
+    """설정에 따라 크롤러가 공유할 원문 저장소 (RAW_STORE_ENABLED=False이면 None)
+
+    프로세스에서 한 번만 열고 모든 크롤러가 같은 인스턴스(같은 SQLite 연결)를 씁니다.
+    """
+    global _default_store
+    from config import config
+
+    if not getattr(config, 'RAW_STORE_ENABLED', True):
+        return None
+    if _default_store is None:
+        _default_store = RawPageStore(max_bytes=int(getattr(config, 'RAW_STORE_MAX_MB', 512) * 1024 * 1024))
+    return _default_store
+
+
+# 사용 예시
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('stats', 'gc', 'reextract'):
+        print("사용법: python src/storage/raw_store.py stats")
+        print("        python src/storage/raw_store.py gc [최대 MB]")
+        print("        python src/storage/raw_store.py reextract")
+        return
+    store = RawPageStore()
+    if sys.argv[1] == 'reextract':
+        from src.scrapers.bbc_rss_crawler import BBCNewsCrawler
+        from src.scrapers.korean_news_crawler import KoreanNewsCrawler
+
+        for crawler in (BBCNewsCrawler(raw_store=store), KoreanNewsCrawler(raw_store=store)):
+            contents = crawler.reextract_from_store()
+            extracted = sum(1 for content in contents.values() if content)
+            print(f"♻️ {type(crawler).__name__}: {len(contents)}개 페이지 중 {extracted}개 본문 추출")
+    elif sys.argv[1] == 'gc':
+        max_bytes = int(float(sys.argv[2]) * 1024 * 1024) if len(sys.argv) > 2 else None
+        print(f"🧹 삭제한 원문: {store.gc(max_bytes)}개")
+    summary = store.summary()
+    print(f"페이지 {summary['pages']}개, 원문 {summary['blobs']}개, "
+          f"{summary['raw_bytes']:,} → {summary['stored_bytes']:,} bytes ({store.codec})")
+    store.close()
+
+if __name__ == "__main__":
+    main()
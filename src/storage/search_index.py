@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+기사/블로그 글 전문 검색 색인 (SQLite FTS5)
+모든 수집기의 기사와 data/blog_posts의 마크다운 글을 data/search.db 하나에서 검색합니다.
+한국어는 띄어쓰기 단위로 조사가 붙어 단어 색인으로는 잘 찾히지 않으므로, 한글 구간은 두 글자씩 겹치는
+n-gram(bigram)으로 나눠 색인하고 검색어도 같은 방식으로 나눠 구(phrase)로 찾습니다.
+("반도체" → "반도 도체", "반도체수출"에도 일치하고 두 글자 단어 "경제"도 찾을 수 있음)
+결과는 BM25 점수(제목 가중치 높음) 순입니다.
+
+사용법:
+    python src/storage/search_index.py rebuild          # 기사 DB와 블로그 글 폴더 전체 색인
+    python src/storage/search_index.py search <검색어> [article|post]
+"""
+
+import glob
+import hashlib
+import html
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행할 때)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.content_cache import normalize_url
+from src.scrapers.dedup import TAG_RE
+from src.storage.article_archive import to_record
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, 'data', 'search.db')
+DEFAULT_POSTS_DIR = os.path.join(PROJECT_ROOT, 'data', 'blog_posts')
+# 한글 구간 / 그 밖의 글자·숫자 구간
+TOKEN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+TITLE_WEIGHT = 10.0  # BM25에서 제목 일치를 본문보다 얼마나 높게 칠지
+
+
+def _is_hangul(token: str) -> bool:
+    return '가' <= token[0] <= '힣'
+
+
+def _bigrams(token: str) -> List[str]:
+    return [token[i:i + 2] for i in range(len(token) - 1)] or [token]
+
+
+def ngram_text(text: Optional[str]) -> str:
+    """색인용 텍스트: 한글 구간은 겹치는 두 글자 조각으로, 나머지는 소문자 단어로"""
+    words = []
+    for token in TOKEN_RE.findall((text or '').lower()):
+        words.extend(_bigrams(token) if _is_hangul(token) else [token])
+    return ' '.join(words)
+
+
+def plain_text(text: Optional[str]) -> str:
+    """HTML 태그(네이버 <b> 등)를 지우고 &quot; 같은 엔티티를 글자로"""
+    return html.unescape(TAG_RE.sub('', text or '')).strip()
+
+
+def match_query(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (단어마다 AND, 한글 단어는 bigram 구, 한 글자는 접두어 검색)"""
+    terms = []
+    for token in TOKEN_RE.findall(query.lower()):
+        if _is_hangul(token) and len(token) == 1:
+            terms.append(f'{token}*')
+        elif _is_hangul(token):
+            terms.append('"' + ' '.join(_bigrams(token)) + '"')
+        else:
+            terms.append(f'"{token}"')
+    return ' AND '.join(terms) or None
+
+
+class SearchIndex:
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # docs: 원래 제목/링크 등 결과로 돌려줄 값, docs_fts: n-gram으로 나눈 검색용 텍스트 (rowid = docs.id)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                ref TEXT NOT NULL,
+                title TEXT NOT NULL,
+                location TEXT NOT NULL,
+                source TEXT,
+                category TEXT,
+                keyword TEXT,
+                published TEXT,
+                fingerprint TEXT,
+                UNIQUE(kind, ref)
+            )
+        """)
+        self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(title, body, tokenize='unicode61')")
+        self.conn.commit()
+
+    def _put(self, kind: str, ref: str, title: str, body: str, location: str, fingerprint: str,
+             source: Optional[str] = None, category: Optional[str] = None, keyword: Optional[str] = None,
+             published: Optional[str] = None) -> bool:
+        """문서 하나를 추가/갱신 (내용 지문이 같으면 건너뛰고 False), 호출하는 쪽에서 트랜잭션 관리"""
+        row = self.conn.execute("SELECT id, fingerprint FROM docs WHERE kind = ? AND ref = ?", (kind, ref)).fetchone()
+        if row is not None and row['fingerprint'] == fingerprint:
+            return False
+        values = (title, location, source, category, keyword, published, fingerprint)
+        if row is None:
+            doc_id = self.conn.execute(
+                "INSERT INTO docs (kind, ref, title, location, source, category, keyword, published, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (kind, ref) + values
+            ).lastrowid
+        else:
+            doc_id = row['id']
+            self.conn.execute(
+                "UPDATE docs SET title = ?, location = ?, source = ?, category = ?, keyword = ?, published = ?, "
+                "fingerprint = ? WHERE id = ?", values + (doc_id,)
+            )
+            self.conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+        self.conn.execute("INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+                          (doc_id, ngram_text(title), ngram_text(body)))
+        return True
+
+    def add_articles(self, items: Iterable[Dict], source: Optional[str] = None,
+                     keyword: Optional[str] = None) -> int:
+        """기사들을 한 트랜잭션으로 색인하고 새로 색인한 개수 반환 (같은 URL은 내용이 바뀐 경우에만 다시 색인)"""
+        count = 0
+        with self.conn:
+            for item in items:
+                record = to_record(item, source=source)
+                if not record['link']:
+                    continue
+                # 네이버 원본 dict가 들어와도 태그·엔티티가 색인과 결과 제목에 남지 않도록 정리
+                title = plain_text(record['title'])
+                body = '\n'.join(plain_text(part) for part in (record['summary'], record['content']) if part)
+                fingerprint = hashlib.sha1(f"{title}\n{body}".encode('utf-8')).hexdigest()
+                count += self._put(
+                    'article', normalize_url(record['link']), title, body, record['link'], fingerprint,
+                    source=record['source'], category=record['category'],
+                    keyword=keyword or record['keyword'], published=record['published'],
+                )
+        return count
+
+    def add_post(self, path: str, title: Optional[str] = None, source: Optional[str] = None) -> bool:
+        """블로그 글 마크다운 파일 하나를 색인 (파일 내용이 그대로면 False)"""
+        with open(path, 'rb') as f:
+            body = f.read()
+        text = body.decode('utf-8', errors='replace')
+        if title is None:
+            title = next((line[2:].strip() for line in text.splitlines() if line.startswith('# ')),
+                         os.path.splitext(os.path.basename(path))[0])
+        modified = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(os.path.getmtime(path)))
+        with self.conn:
+            return self._put('post', os.path.abspath(path), title, text, path,
+                             hashlib.sha256(body).hexdigest(), source=source, published=modified)
+
+    def sync_posts(self, posts_dir: Optional[str] = None) -> int:
+        """블로그 글 폴더를 훑어 새로 생기거나 바뀐 글을 색인하고, 지워진 글은 색인에서 제거"""
+        root = os.path.abspath(posts_dir or DEFAULT_POSTS_DIR)
+        paths = sorted(glob.glob(os.path.join(root, '*.md')))
+        count = sum(self.add_post(path) for path in paths)
+        existing = set(paths)
+        stale = [row['id'] for row in self.conn.execute("SELECT id, ref FROM docs WHERE kind = 'post'")
+                 if os.path.dirname(row['ref']) == root and row['ref'] not in existing]
+        with self.conn:
+            for doc_id in stale:
+                self.conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+                self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+        return count
+
+    def search(self, query: str, kind: Optional[str] = None, source: Optional[str] = None,
+               since: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """검색어와 관련도 높은 순으로 문서 반환 (kind: 'article' 또는 'post', since: UTC ISO 문자열)"""
+        expression = match_query(query)
+        if expression is None:
+            return []
+        sql = (f"SELECT docs.*, bm25(docs_fts, {TITLE_WEIGHT}, 1.0) AS score "
+               "FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid WHERE docs_fts MATCH ?")
+        params: list = [expression]
+        for column, value in (('kind', kind), ('source', source)):
+            if value is not None:
+                sql += f" AND docs.{column} = ?"
+                params.append(value)
+        if since is not None:
+            sql += " AND docs.published >= ?"
+            params.append(since)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def related_posts(self, topic: str, limit: int = 5) -> List[Dict]:
+        """주제와 비슷한 이전 블로그 글 (관련 글 링크나 같은 주제 반복 확인용)"""
+        return self.search(topic, kind='post', limit=limit)
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+# 사용 예시
+def main():
+    index = SearchIndex()
+    if len(sys.argv) > 1 and sys.argv[1] == 'rebuild':
+        from src.storage.article_store import ArticleStore
+        store = ArticleStore()
+        articles = index.add_articles(store.query())
+        store.close()
+        print(f"🔎 색인 완료: 기사 {articles}건, 블로그 글 {index.sync_posts()}건 (전체 {len(index)}건)")
+    elif len(sys.argv) > 2 and sys.argv[1] == 'search':
+        kind = sys.argv[3] if len(sys.argv) > 3 else None
+        started = time.perf_counter()
+        results = index.search(sys.argv[2], kind=kind)
+        elapsed = (time.perf_counter() - started) * 1000
+        for result in results:
+            print(f"[{result['kind']}] {result['title']} ({result['source'] or '-'}, {result['published'] or '-'})")
+            print(f"    {result['location']}")
+        print(f"({len(results)}건, {elapsed:.1f}ms)")
+    else:
+        print(__doc__)
+    index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+수집한 기사 인덱스
+이미 가져온 기사(URL/GUID)를 SQLite에 기록하고, 앞단에 블룸 필터를 두어
+처음 보는 기사는 DB 조회 없이 바로 걸러냅니다. 수백만 건에서도 빠르게 동작합니다.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import time
+from typing import Dict, Iterable, List, Optional
+
+from src.scrapers.content_cache import normalize_url
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'cache', 'seen_articles.db'
+)
+
+SQL_BATCH = 500  # IN (...) 조회 한 번에 넣을 키 개수
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (bytearray + 이중 해싱)"""
+
+    HEADER = struct.Struct('<QQQ')  # 비트 수, 해시 함수 수, 추가된 키 수
+
+    def __init__(self, capacity: int = 2_000_000, error_rate: float = 0.001):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: str):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.HEADER.pack(self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['BloomFilter']:
+        try:
+            with open(path, 'rb') as f:
+                num_bits, num_hashes, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+        if len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.num_bits, bloom.num_hashes, bloom.count, bloom.bits = num_bits, num_hashes, count, bits
+        return bloom
+
+
+def item_key(item: Dict) -> str:
+    """기사 식별 키 (정규화한 원문 URL, 없으면 GUID)"""
+    url = item.get('originallink') or item.get('link')
+    if url:
+        return normalize_url(url)
+    return item.get('guid') or item.get('title', '')
+
+
+def item_fingerprint(item: Dict) -> str:
+    """제목+요약 해시 (기사 내용이 수정되었는지 판단용)"""
+    text = f"{item.get('title', '')}\n{item.get('summary') or item.get('description', '')}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class SeenIndex:
+    def __init__(self, db_path: Optional[str] = None, bloom_capacity: int = 2_000_000):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.bloom_path = self.db_path + '.bloom'
+        self.bloom_capacity = bloom_capacity
+        self.stats = {'bloom_negative': 0, 'db_checked': 0}
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                guid TEXT,
+                source TEXT,
+                fingerprint TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+        self.bloom = self._load_bloom()
+
+    def _load_bloom(self) -> BloomFilter:
+        """저장된 블룸 필터를 읽고, DB와 개수가 다르면 DB에서 다시 만듦"""
+        row_count = self.conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+        bloom = BloomFilter.load(self.bloom_path) if self.db_path != ':memory:' else None
+        if bloom is not None and bloom.count == row_count:
+            return bloom
+
+        bloom = BloomFilter(max(self.bloom_capacity, row_count * 2))
+        for (key,) in self.conn.execute("SELECT key FROM seen_articles"):
+            bloom.add(key)
+        return bloom
+
+    def _stored_fingerprints(self, keys: List[str]) -> Dict[str, str]:
+        found = {}
+        for i in range(0, len(keys), SQL_BATCH):
+            batch = keys[i:i + SQL_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            for key, fingerprint in self.conn.execute(
+                f"SELECT key, fingerprint FROM seen_articles WHERE key IN ({placeholders})", batch
+            ):
+                found[key] = fingerprint
+        return found
+
+    def filter_new(self, items: Iterable[Dict], include_updated: bool = False) -> List[Dict]:
+        """처음 보는 기사만 반환 (include_updated=True이면 제목/요약이 바뀐 기사도 포함)"""
+        items = list(items)
+        keys = [item_key(item) for item in items]
+
+        # 블룸 필터에 없으면 확실히 새 기사, 있으면 DB에서 확인
+        maybe_seen = [key for key in keys if key in self.bloom]
+        self.stats['bloom_negative'] += len(keys) - len(maybe_seen)
+        self.stats['db_checked'] += len(maybe_seen)
+        stored = self._stored_fingerprints(maybe_seen) if maybe_seen else {}
+
+        new_items = []
+        for item, key in zip(items, keys):
+            if key not in stored:
+                new_items.append(item)
+            elif include_updated and stored[key] != item_fingerprint(item):
+                new_items.append(item)
+        return new_items
+
+    def mark_seen(self, items: Iterable[Dict], source: Optional[str] = None):
+        """기사들을 처리 완료로 기록 (수집/저장이 성공한 뒤에 호출)"""
+        now = time.time()
+        rows = []
+        for item in items:
+            key = item_key(item)
+            rows.append((key, item.get('link'), item.get('guid'), source or item.get('source'),
+                         item_fingerprint(item), now, now))
+        with self.conn:
+            for row in rows:
+                inserted = self.conn.execute(
+                    "INSERT OR IGNORE INTO seen_articles "
+                    "(key, url, guid, source, fingerprint, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    row
+                ).rowcount
+                if inserted:
+                    self.bloom.add(row[0])
+                else:
+                    self.conn.execute(
+                        "UPDATE seen_articles SET fingerprint = ?, last_seen = ? WHERE key = ?",
+                        (row[4], now, row[0])
+                    )
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+    def flush(self):
+        """블룸 필터를 디스크에 저장 (다음 실행에서 DB 재스캔 없이 사용)"""
+        if self.db_path != ':memory:':
+            self.bloom.save(self.bloom_path)
+
+    def close(self):
+        """블룸 필터를 저장하고 DB 연결 종료"""
+        self.flush()
+        self.conn.close()